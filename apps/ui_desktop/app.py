@@ -17,6 +17,7 @@ import uuid
 from core.generators import generate
 from core.dq.profiler import profile
 from core.integrity.scd2 import scd2_version_rows
+from core.writers.parquet_writer import sort_frame, downcast_frame
 
 # Importar sistema de localización
 try:
@@ -1151,7 +1152,12 @@ Características: Generación híbrida, SCD2 automático, Perfiles de error, DQ
                 # Aplicar rango de fechas global
                 self._apply_date_range_to_engine()
 
-                ecosystem_data, summary = generate_ecosystem_data(ecosystem_key, volume, apply_translation)
+                def on_table_generated(table_name, table_volume):
+                    self.root.after(0, lambda: self.status_label.config(
+                        text=f"Generado {table_name} ({table_volume:,} registros)..."))
+
+                ecosystem_data, summary = generate_ecosystem_data(ecosystem_key, volume, apply_translation,
+                                                                  progress_cb=on_table_generated)
 
                 # Paso 3: Crear carpeta de sesión
                 self.root.after(0, lambda: self.status_label.config(text="Organizando archivos..."))
@@ -1173,7 +1179,7 @@ Características: Generación híbrida, SCD2 automático, Perfiles de error, DQ
                         ))
                         
                         out_file = session_folder / f"ecosystem__{table_name}.{format_ext}"
-                        df = pd.DataFrame(data)
+                        df = downcast_frame(sort_frame(pd.DataFrame(data), eco_def.get_sort_keys(table_name)))
                         self._save_dataframe(df, out_file, format_ext)
                         
                         # Registrar en sesión
@@ -2,9 +2,10 @@
 Sistema de Ecosistemas de Negocios Actualizado
 Genera datos completos e interconectados usando dominios y tablas reales del sistema
 """
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Iterator, Mapping
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import uuid
 
 class BusinessType(Enum):
@@ -32,15 +33,33 @@ class BusinessEcosystem:
     analytics_tables: Dict[str, List[str]] # domain -> [tables]
     relationships: Dict[str, str]          # "table_a -> table_b": "foreign_key"
     volume_ratios: Dict[str, float]        # table -> ratio relative to base volume
+    sort_keys: Dict[str, List[str]] = field(default_factory=dict)  # table -> columnas de orden físico
+
+    def get_sort_keys(self, table: str) -> List[str]:
+        """Columnas por las que ordenar una tabla al escribirla.
+
+        Si no hay orden explícito, las tablas de hechos se ordenan por sus FKs
+        declaradas en `relationships` (las columnas más filtradas en análisis).
+        """
+        if table in self.sort_keys:
+            return self.sort_keys[table]
+        if not table.startswith("fact_"):
+            return []
+        keys: List[str] = []
+        for relation, fk in self.relationships.items():
+            if relation.split("->")[0].strip() == table and fk not in keys:
+                keys.append(fk)
+        return keys
 
 # ===============================
 # DEFINICIÓN DE ECOSISTEMAS REALES
 # ===============================
 
-BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
+# Cada ecosistema se construye bajo demanda (ver get_ecosystem_by_key)
+_ECOSYSTEM_FACTORIES: Dict[str, Callable[[], BusinessEcosystem]] = {
     
     # Ecosistemas Social Media / Creator Intelligence
-    "social_media_influencer": BusinessEcosystem(
+    "social_media_influencer": lambda: BusinessEcosystem(
         key="social_media_influencer",
         name="Influencer Multi-Plataforma",
         display_name="Influencer Multi-Plataforma",
@@ -91,7 +110,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_corporate": BusinessEcosystem(
+    "social_media_corporate": lambda: BusinessEcosystem(
         key="social_media_corporate",
         name="Empresa Multi-Plataforma",
         display_name="Empresa Multi-Plataforma", 
@@ -144,7 +163,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # Ecosistemas E-commerce
-    "ecommerce_marketplace": BusinessEcosystem(
+    "ecommerce_marketplace": lambda: BusinessEcosystem(
         key="ecommerce_marketplace",
         name="Marketplace Multi-Vendedor", 
         display_name="Marketplace Multi-Vendedor",
@@ -193,7 +212,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # Ecosistemas Banking
-    "banking_digital": BusinessEcosystem(
+    "banking_digital": lambda: BusinessEcosystem(
         key="banking_digital",
         name="Banco Digital Completo",
         display_name="Banco Digital Completo",
@@ -237,11 +256,14 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
             "fact_collections": 0.05,  # 5% collections
             "fact_risk_scores": 1.2,   # 120% risk scores
             "fact_risk": 0.8           # 80% risk assessments
+        },
+        sort_keys={
+            "fact_transactions": ["account_id", "transaction_date"]
         }
     ),
 
     # Ecosistemas Healthcare  
-    "healthcare_hospital": BusinessEcosystem(
+    "healthcare_hospital": lambda: BusinessEcosystem(
         key="healthcare_hospital",
         name="Hospital Completo",
         display_name="Hospital Completo",
@@ -293,7 +315,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # Ecosistemas Education
-    "education_university": BusinessEcosystem(
+    "education_university": lambda: BusinessEcosystem(
         key="education_university", 
         name="Universidad Completa",
         display_name="Universidad Completa",
@@ -342,7 +364,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # Ecosistemas Retail
-    "retail_supermarket": BusinessEcosystem(
+    "retail_supermarket": lambda: BusinessEcosystem(
         key="retail_supermarket",
         name="Cadena de Supermercados",
         display_name="Cadena de Supermercados", 
@@ -392,7 +414,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # Ecosistemas Microbusiness
-    "microbusiness_bakery": BusinessEcosystem(
+    "microbusiness_bakery": lambda: BusinessEcosystem(
         key="microbusiness_bakery",
         name="Panadería Artesanal",
         display_name="Panadería Artesanal",
@@ -441,7 +463,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     # =================== NUEVOS ECOSISTEMAS (95 adicionales) ===================
     
     # SOCIAL MEDIA & CREATOR (10 ecosistemas)
-    "social_media_gaming_streamer": BusinessEcosystem(
+    "social_media_gaming_streamer": lambda: BusinessEcosystem(
         key="social_media_gaming_streamer",
         name="Streamer de Gaming",
         display_name="Streamer de Gaming",
@@ -476,7 +498,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_beauty_influencer": BusinessEcosystem(
+    "social_media_beauty_influencer": lambda: BusinessEcosystem(
         key="social_media_beauty_influencer",
         name="Beauty Influencer",
         display_name="Influencer de Belleza",
@@ -511,7 +533,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_fitness_coach": BusinessEcosystem(
+    "social_media_fitness_coach": lambda: BusinessEcosystem(
         key="social_media_fitness_coach",
         name="Coach de Fitness",
         display_name="Coach de Fitness",
@@ -543,7 +565,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_food_blogger": BusinessEcosystem(
+    "social_media_food_blogger": lambda: BusinessEcosystem(
         key="social_media_food_blogger",
         name="Food Blogger",
         display_name="Blogger Gastronómico",
@@ -575,7 +597,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_travel_blogger": BusinessEcosystem(
+    "social_media_travel_blogger": lambda: BusinessEcosystem(
         key="social_media_travel_blogger",
         name="Travel Blogger",
         display_name="Blogger de Viajes",
@@ -607,7 +629,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_tech_reviewer": BusinessEcosystem(
+    "social_media_tech_reviewer": lambda: BusinessEcosystem(
         key="social_media_tech_reviewer",
         name="Tech Reviewer",
         display_name="Revisor de Tecnología",
@@ -639,7 +661,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_fashion_stylist": BusinessEcosystem(
+    "social_media_fashion_stylist": lambda: BusinessEcosystem(
         key="social_media_fashion_stylist",
         name="Fashion Stylist",
         display_name="Estilista de Moda",
@@ -671,7 +693,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_diy_creator": BusinessEcosystem(
+    "social_media_diy_creator": lambda: BusinessEcosystem(
         key="social_media_diy_creator",
         name="DIY Creator",
         display_name="Creador DIY",
@@ -703,7 +725,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_music_producer": BusinessEcosystem(
+    "social_media_music_producer": lambda: BusinessEcosystem(
         key="social_media_music_producer",
         name="Music Producer",
         display_name="Productor Musical",
@@ -735,7 +757,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "social_media_education_tutor": BusinessEcosystem(
+    "social_media_education_tutor": lambda: BusinessEcosystem(
         key="social_media_education_tutor",
         name="Education Tutor",
         display_name="Tutor Educativo",
@@ -768,7 +790,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # E-COMMERCE & RETAIL (15 ecosistemas)
-    "ecommerce_fashion_boutique": BusinessEcosystem(
+    "ecommerce_fashion_boutique": lambda: BusinessEcosystem(
         key="ecommerce_fashion_boutique",
         name="Boutique de Moda Online",
         display_name="Boutique de Moda Online",
@@ -794,7 +816,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "ecommerce_electronics_store": BusinessEcosystem(
+    "ecommerce_electronics_store": lambda: BusinessEcosystem(
         key="ecommerce_electronics_store",
         name="Tienda de Electrónicos",
         display_name="Tienda de Electrónicos",
@@ -820,7 +842,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "ecommerce_home_decor": BusinessEcosystem(
+    "ecommerce_home_decor": lambda: BusinessEcosystem(
         key="ecommerce_home_decor",
         name="Decoración del Hogar",
         display_name="Decoración del Hogar",
@@ -846,7 +868,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "ecommerce_sports_equipment": BusinessEcosystem(
+    "ecommerce_sports_equipment": lambda: BusinessEcosystem(
         key="ecommerce_sports_equipment",
         name="Equipamiento Deportivo",
         display_name="Equipamiento Deportivo",
@@ -872,7 +894,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "ecommerce_books_media": BusinessEcosystem(
+    "ecommerce_books_media": lambda: BusinessEcosystem(
         key="ecommerce_books_media",
         name="Librería Online",
         display_name="Librería Online",
@@ -899,7 +921,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # HEALTHCARE & WELLNESS (12 ecosistemas)
-    "healthcare_dental_clinic": BusinessEcosystem(
+    "healthcare_dental_clinic": lambda: BusinessEcosystem(
         key="healthcare_dental_clinic",
         name="Clínica Dental",
         display_name="Clínica Dental",
@@ -925,7 +947,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "healthcare_veterinary_clinic": BusinessEcosystem(
+    "healthcare_veterinary_clinic": lambda: BusinessEcosystem(
         key="healthcare_veterinary_clinic",
         name="Clínica Veterinaria",
         display_name="Clínica Veterinaria",
@@ -951,7 +973,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "healthcare_mental_health": BusinessEcosystem(
+    "healthcare_mental_health": lambda: BusinessEcosystem(
         key="healthcare_mental_health",
         name="Centro de Salud Mental",
         display_name="Centro de Salud Mental",
@@ -978,7 +1000,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # EDUCATION & TRAINING (12 ecosistemas)
-    "education_language_school": BusinessEcosystem(
+    "education_language_school": lambda: BusinessEcosystem(
         key="education_language_school",
         name="Escuela de Idiomas",
         display_name="Escuela de Idiomas",
@@ -1004,7 +1026,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "education_cooking_school": BusinessEcosystem(
+    "education_cooking_school": lambda: BusinessEcosystem(
         key="education_cooking_school",
         name="Escuela de Cocina",
         display_name="Escuela de Cocina",
@@ -1031,7 +1053,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # BANKING & FINTECH (10 ecosistemas)
-    "fintech_digital_wallet": BusinessEcosystem(
+    "fintech_digital_wallet": lambda: BusinessEcosystem(
         key="fintech_digital_wallet",
         name="Billetera Digital",
         display_name="Billetera Digital",
@@ -1057,7 +1079,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "fintech_lending_platform": BusinessEcosystem(
+    "fintech_lending_platform": lambda: BusinessEcosystem(
         key="fintech_lending_platform",
         name="Plataforma de Préstamos",
         display_name="Plataforma de Préstamos",
@@ -1084,7 +1106,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # MICROBUSINESS EXPANDED (20 ecosistemas)
-    "microbusiness_coffee_shop": BusinessEcosystem(
+    "microbusiness_coffee_shop": lambda: BusinessEcosystem(
         key="microbusiness_coffee_shop",
         name="Cafetería Local",
         display_name="Cafetería Local",
@@ -1110,7 +1132,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "microbusiness_flower_shop": BusinessEcosystem(
+    "microbusiness_flower_shop": lambda: BusinessEcosystem(
         key="microbusiness_flower_shop",
         name="Floristería",
         display_name="Floristería",
@@ -1136,7 +1158,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "microbusiness_auto_repair": BusinessEcosystem(
+    "microbusiness_auto_repair": lambda: BusinessEcosystem(
         key="microbusiness_auto_repair",
         name="Taller Mecánico",
         display_name="Taller Mecánico",
@@ -1162,7 +1184,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "microbusiness_pet_grooming": BusinessEcosystem(
+    "microbusiness_pet_grooming": lambda: BusinessEcosystem(
         key="microbusiness_pet_grooming",
         name="Peluquería Canina",
         display_name="Peluquería Canina",
@@ -1188,7 +1210,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "microbusiness_yoga_studio": BusinessEcosystem(
+    "microbusiness_yoga_studio": lambda: BusinessEcosystem(
         key="microbusiness_yoga_studio",
         name="Estudio de Yoga",
         display_name="Estudio de Yoga",
@@ -1215,7 +1237,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # RETAIL SPECIALIZED (15 ecosistemas)
-    "retail_pharmacy": BusinessEcosystem(
+    "retail_pharmacy": lambda: BusinessEcosystem(
         key="retail_pharmacy",
         name="Farmacia",
         display_name="Farmacia",
@@ -1241,7 +1263,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_gas_station": BusinessEcosystem(
+    "retail_gas_station": lambda: BusinessEcosystem(
         key="retail_gas_station",
         name="Gasolinera",
         display_name="Gasolinera",
@@ -1267,7 +1289,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_jewelry_store": BusinessEcosystem(
+    "retail_jewelry_store": lambda: BusinessEcosystem(
         key="retail_jewelry_store",
         name="Joyería",
         display_name="Joyería",
@@ -1294,7 +1316,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # ENTERTAINMENT & MEDIA (10 ecosistemas)
-    "entertainment_cinema": BusinessEcosystem(
+    "entertainment_cinema": lambda: BusinessEcosystem(
         key="entertainment_cinema",
         name="Complejo Cinematográfico",
         display_name="Complejo Cinematográfico",
@@ -1320,7 +1342,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "entertainment_arcade": BusinessEcosystem(
+    "entertainment_arcade": lambda: BusinessEcosystem(
         key="entertainment_arcade",
         name="Sala de Juegos",
         display_name="Sala de Juegos",
@@ -1347,7 +1369,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # TECHNOLOGY & SERVICES (10 ecosistemas)
-    "tech_computer_repair": BusinessEcosystem(
+    "tech_computer_repair": lambda: BusinessEcosystem(
         key="tech_computer_repair",
         name="Reparación de Computadoras",
         display_name="Reparación de Computadoras",
@@ -1373,7 +1395,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "tech_mobile_repair": BusinessEcosystem(
+    "tech_mobile_repair": lambda: BusinessEcosystem(
         key="tech_mobile_repair",
         name="Reparación de Celulares",
         display_name="Reparación de Celulares",
@@ -1400,7 +1422,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # FOOD & BEVERAGE (15 ecosistemas)
-    "food_restaurant_fine": BusinessEcosystem(
+    "food_restaurant_fine": lambda: BusinessEcosystem(
         key="food_restaurant_fine",
         name="Restaurante Gourmet",
         display_name="Restaurante Gourmet",
@@ -1426,7 +1448,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "food_pizza_delivery": BusinessEcosystem(
+    "food_pizza_delivery": lambda: BusinessEcosystem(
         key="food_pizza_delivery",
         name="Pizzería a Domicilio",
         display_name="Pizzería a Domicilio",
@@ -1452,7 +1474,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "food_bakery": BusinessEcosystem(
+    "food_bakery": lambda: BusinessEcosystem(
         key="food_bakery",
         name="Panadería Artesanal",
         display_name="Panadería Artesanal",
@@ -1478,7 +1500,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "food_ice_cream": BusinessEcosystem(
+    "food_ice_cream": lambda: BusinessEcosystem(
         key="food_ice_cream",
         name="Heladería",
         display_name="Heladería",
@@ -1505,7 +1527,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # AUTOMOTIVE (8 ecosistemas)
-    "auto_dealership": BusinessEcosystem(
+    "auto_dealership": lambda: BusinessEcosystem(
         key="auto_dealership",
         name="Concesionario de Autos",
         display_name="Concesionario de Autos",
@@ -1531,7 +1553,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "auto_parts_store": BusinessEcosystem(
+    "auto_parts_store": lambda: BusinessEcosystem(
         key="auto_parts_store",
         name="Refaccionaria",
         display_name="Refaccionaria",
@@ -1558,7 +1580,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # REAL ESTATE (5 ecosistemas)
-    "realestate_agency": BusinessEcosystem(
+    "realestate_agency": lambda: BusinessEcosystem(
         key="realestate_agency",
         name="Inmobiliaria",
         display_name="Inmobiliaria",
@@ -1585,7 +1607,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # CONSULTING & PROFESSIONAL (8 ecosistemas)
-    "consulting_legal": BusinessEcosystem(
+    "consulting_legal": lambda: BusinessEcosystem(
         key="consulting_legal",
         name="Despacho Jurídico",
         display_name="Despacho Jurídico",
@@ -1611,7 +1633,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "consulting_accounting": BusinessEcosystem(
+    "consulting_accounting": lambda: BusinessEcosystem(
         key="consulting_accounting",
         name="Despacho Contable",
         display_name="Despacho Contable",
@@ -1638,7 +1660,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # AGRICULTURE & FARMING (5 ecosistemas)
-    "agri_organic_farm": BusinessEcosystem(
+    "agri_organic_farm": lambda: BusinessEcosystem(
         key="agri_organic_farm",
         name="Granja Orgánica",
         display_name="Granja Orgánica",
@@ -1665,7 +1687,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # SPORTS & FITNESS (8 ecosistemas)
-    "fitness_gym": BusinessEcosystem(
+    "fitness_gym": lambda: BusinessEcosystem(
         key="fitness_gym",
         name="Gimnasio",
         display_name="Gimnasio",
@@ -1691,7 +1713,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "fitness_crossfit": BusinessEcosystem(
+    "fitness_crossfit": lambda: BusinessEcosystem(
         key="fitness_crossfit",
         name="Box de CrossFit",
         display_name="Box de CrossFit",
@@ -1718,7 +1740,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # TRAVEL & HOSPITALITY (8 ecosistemas)
-    "hotel_boutique": BusinessEcosystem(
+    "hotel_boutique": lambda: BusinessEcosystem(
         key="hotel_boutique",
         name="Hotel Boutique",
         display_name="Hotel Boutique",
@@ -1744,7 +1766,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "travel_agency": BusinessEcosystem(
+    "travel_agency": lambda: BusinessEcosystem(
         key="travel_agency",
         name="Agencia de Viajes",
         display_name="Agencia de Viajes",
@@ -1771,7 +1793,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # TRANSPORTATION (5 ecosistemas)
-    "transport_taxi": BusinessEcosystem(
+    "transport_taxi": lambda: BusinessEcosystem(
         key="transport_taxi",
         name="Servicio de Taxi",
         display_name="Servicio de Taxi",
@@ -1798,7 +1820,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # PERSONAL CARE & BEAUTY (10 ecosistemas)
-    "beauty_nail_salon": BusinessEcosystem(
+    "beauty_nail_salon": lambda: BusinessEcosystem(
         key="beauty_nail_salon",
         name="Salón de Uñas",
         display_name="Salón de Uñas",
@@ -1824,7 +1846,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "beauty_barbershop": BusinessEcosystem(
+    "beauty_barbershop": lambda: BusinessEcosystem(
         key="beauty_barbershop",
         name="Barbería",
         display_name="Barbería",
@@ -1850,7 +1872,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "beauty_spa": BusinessEcosystem(
+    "beauty_spa": lambda: BusinessEcosystem(
         key="beauty_spa",
         name="Spa y Relajación",
         display_name="Spa y Relajación",
@@ -1877,7 +1899,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # MANUFACTURING & CRAFTS (5 ecosistemas)
-    "craft_jewelry_maker": BusinessEcosystem(
+    "craft_jewelry_maker": lambda: BusinessEcosystem(
         key="craft_jewelry_maker",
         name="Joyería Artesanal",
         display_name="Joyería Artesanal",
@@ -1903,7 +1925,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "craft_furniture": BusinessEcosystem(
+    "craft_furniture": lambda: BusinessEcosystem(
         key="craft_furniture",
         name="Carpintería",
         display_name="Carpintería",
@@ -1930,7 +1952,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # PETS & VETERINARY (8 ecosistemas)
-    "pets_veterinary": BusinessEcosystem(
+    "pets_veterinary": lambda: BusinessEcosystem(
         key="pets_veterinary",
         name="Clínica Veterinaria General",
         display_name="Clínica Veterinaria General",
@@ -1956,7 +1978,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "pets_store": BusinessEcosystem(
+    "pets_store": lambda: BusinessEcosystem(
         key="pets_store",
         name="Tienda de Mascotas",
         display_name="Tienda de Mascotas",
@@ -1983,7 +2005,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # GAMING & ENTERTAINMENT (10 ecosistemas)
-    "gaming_internet_cafe": BusinessEcosystem(
+    "gaming_internet_cafe": lambda: BusinessEcosystem(
         key="gaming_internet_cafe",
         name="Ciber Café",
         display_name="Ciber Café",
@@ -2009,7 +2031,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "gaming_board_games": BusinessEcosystem(
+    "gaming_board_games": lambda: BusinessEcosystem(
         key="gaming_board_games",
         name="Café de Juegos de Mesa",
         display_name="Café de Juegos de Mesa",
@@ -2036,7 +2058,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # FASHION & CLOTHING (8 ecosistemas)
-    "fashion_boutique_luxury": BusinessEcosystem(
+    "fashion_boutique_luxury": lambda: BusinessEcosystem(
         key="fashion_boutique_luxury",
         name="Boutique de Lujo",
         display_name="Boutique de Lujo",
@@ -2062,7 +2084,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "fashion_shoe_store": BusinessEcosystem(
+    "fashion_shoe_store": lambda: BusinessEcosystem(
         key="fashion_shoe_store",
         name="Zapatería",
         display_name="Zapatería",
@@ -2088,7 +2110,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "fashion_tailoring": BusinessEcosystem(
+    "fashion_tailoring": lambda: BusinessEcosystem(
         key="fashion_tailoring",
         name="Sastrería",
         display_name="Sastrería",
@@ -2115,7 +2137,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # HOME & GARDEN (6 ecosistemas)
-    "home_hardware_store": BusinessEcosystem(
+    "home_hardware_store": lambda: BusinessEcosystem(
         key="home_hardware_store",
         name="Ferretería",
         display_name="Ferretería",
@@ -2141,7 +2163,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "home_garden_center": BusinessEcosystem(
+    "home_garden_center": lambda: BusinessEcosystem(
         key="home_garden_center",
         name="Centro de Jardinería",
         display_name="Centro de Jardinería",
@@ -2168,7 +2190,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # ARTS & CULTURE (6 ecosistemas)
-    "arts_music_store": BusinessEcosystem(
+    "arts_music_store": lambda: BusinessEcosystem(
         key="arts_music_store",
         name="Tienda de Instrumentos",
         display_name="Tienda de Instrumentos",
@@ -2194,7 +2216,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "arts_gallery": BusinessEcosystem(
+    "arts_gallery": lambda: BusinessEcosystem(
         key="arts_gallery",
         name="Galería de Arte",
         display_name="Galería de Arte",
@@ -2221,7 +2243,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # CLEANING & MAINTENANCE (4 ecosistemas)
-    "cleaning_laundromat": BusinessEcosystem(
+    "cleaning_laundromat": lambda: BusinessEcosystem(
         key="cleaning_laundromat",
         name="Lavandería",
         display_name="Lavandería",
@@ -2247,7 +2269,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "cleaning_dry_cleaner": BusinessEcosystem(
+    "cleaning_dry_cleaner": lambda: BusinessEcosystem(
         key="cleaning_dry_cleaner",
         name="Tintorería",
         display_name="Tintorería",
@@ -2274,7 +2296,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # SPECIALIZED RETAIL (10 ecosistemas)
-    "retail_optical": BusinessEcosystem(
+    "retail_optical": lambda: BusinessEcosystem(
         key="retail_optical",
         name="Óptica",
         display_name="Óptica",
@@ -2300,7 +2322,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_toy_store": BusinessEcosystem(
+    "retail_toy_store": lambda: BusinessEcosystem(
         key="retail_toy_store",
         name="Juguetería",
         display_name="Juguetería",
@@ -2326,7 +2348,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_stationery": BusinessEcosystem(
+    "retail_stationery": lambda: BusinessEcosystem(
         key="retail_stationery",
         name="Papelería",
         display_name="Papelería",
@@ -2352,7 +2374,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_bike_shop": BusinessEcosystem(
+    "retail_bike_shop": lambda: BusinessEcosystem(
         key="retail_bike_shop",
         name="Tienda de Bicicletas",
         display_name="Tienda de Bicicletas",
@@ -2379,7 +2401,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # SPECIALIZED SERVICES (8 ecosistemas)
-    "service_locksmith": BusinessEcosystem(
+    "service_locksmith": lambda: BusinessEcosystem(
         key="service_locksmith",
         name="Cerrajería",
         display_name="Cerrajería",
@@ -2405,7 +2427,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "service_plumbing": BusinessEcosystem(
+    "service_plumbing": lambda: BusinessEcosystem(
         key="service_plumbing",
         name="Plomería",
         display_name="Plomería",
@@ -2431,7 +2453,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "service_electrical": BusinessEcosystem(
+    "service_electrical": lambda: BusinessEcosystem(
         key="service_electrical",
         name="Electricidad",
         display_name="Electricidad",
@@ -2458,7 +2480,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # WELLNESS & ALTERNATIVE MEDICINE (5 ecosistemas)
-    "wellness_massage": BusinessEcosystem(
+    "wellness_massage": lambda: BusinessEcosystem(
         key="wellness_massage",
         name="Centro de Masajes",
         display_name="Centro de Masajes",
@@ -2484,7 +2506,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "wellness_acupuncture": BusinessEcosystem(
+    "wellness_acupuncture": lambda: BusinessEcosystem(
         key="wellness_acupuncture",
         name="Clínica de Acupuntura",
         display_name="Clínica de Acupuntura",
@@ -2511,7 +2533,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # FINAL SPECIALTY BUSINESSES (2 ecosistemas)
-    "specialty_printing": BusinessEcosystem(
+    "specialty_printing": lambda: BusinessEcosystem(
         key="specialty_printing",
         name="Imprenta Digital",
         display_name="Imprenta Digital",
@@ -2537,7 +2559,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "specialty_wedding_planning": BusinessEcosystem(
+    "specialty_wedding_planning": lambda: BusinessEcosystem(
         key="specialty_wedding_planning",
         name="Organización de Bodas",
         display_name="Organización de Bodas",
@@ -2564,7 +2586,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
     ),
 
     # FINAL ECOSYSTEMS TO REACH 100 (14 ecosistemas)
-    "food_food_truck": BusinessEcosystem(
+    "food_food_truck": lambda: BusinessEcosystem(
         key="food_food_truck",
         name="Food Truck",
         display_name="Food Truck",
@@ -2590,7 +2612,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_convenience_store": BusinessEcosystem(
+    "retail_convenience_store": lambda: BusinessEcosystem(
         key="retail_convenience_store",
         name="Tienda de Conveniencia",
         display_name="Tienda de Conveniencia",
@@ -2616,7 +2638,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "service_photography": BusinessEcosystem(
+    "service_photography": lambda: BusinessEcosystem(
         key="service_photography",
         name="Estudio Fotográfico",
         display_name="Estudio Fotográfico",
@@ -2642,7 +2664,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "transport_delivery": BusinessEcosystem(
+    "transport_delivery": lambda: BusinessEcosystem(
         key="transport_delivery",
         name="Servicio de Delivery",
         display_name="Servicio de Delivery",
@@ -2668,7 +2690,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_wine_store": BusinessEcosystem(
+    "retail_wine_store": lambda: BusinessEcosystem(
         key="retail_wine_store",
         name="Vinoteca",
         display_name="Vinoteca",
@@ -2694,7 +2716,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "service_tutoring": BusinessEcosystem(
+    "service_tutoring": lambda: BusinessEcosystem(
         key="service_tutoring",
         name="Centro de Tutorías",
         display_name="Centro de Tutorías",
@@ -2720,7 +2742,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "health_dentist_cosmetic": BusinessEcosystem(
+    "health_dentist_cosmetic": lambda: BusinessEcosystem(
         key="health_dentist_cosmetic",
         name="Dentista Cosmético",
         display_name="Dentista Cosmético",
@@ -2746,7 +2768,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "entertainment_bowling": BusinessEcosystem(
+    "entertainment_bowling": lambda: BusinessEcosystem(
         key="entertainment_bowling",
         name="Boliche",
         display_name="Boliche",
@@ -2772,7 +2794,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_electronics_repair": BusinessEcosystem(
+    "retail_electronics_repair": lambda: BusinessEcosystem(
         key="retail_electronics_repair",
         name="Reparación de Electrónicos",
         display_name="Reparación de Electrónicos",
@@ -2798,7 +2820,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "agri_farmers_market": BusinessEcosystem(
+    "agri_farmers_market": lambda: BusinessEcosystem(
         key="agri_farmers_market",
         name="Mercado de Agricultores",
         display_name="Mercado de Agricultores",
@@ -2824,7 +2846,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "service_house_cleaning": BusinessEcosystem(
+    "service_house_cleaning": lambda: BusinessEcosystem(
         key="service_house_cleaning",
         name="Limpieza Doméstica",
         display_name="Limpieza Doméstica",
@@ -2850,7 +2872,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "retail_thrift_store": BusinessEcosystem(
+    "retail_thrift_store": lambda: BusinessEcosystem(
         key="retail_thrift_store",
         name="Tienda de Segunda Mano",
         display_name="Tienda de Segunda Mano",
@@ -2876,7 +2898,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "food_catering": BusinessEcosystem(
+    "food_catering": lambda: BusinessEcosystem(
         key="food_catering",
         name="Servicio de Catering",
         display_name="Servicio de Catering",
@@ -2902,7 +2924,7 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
         }
     ),
 
-    "specialty_escape_room": BusinessEcosystem(
+    "specialty_escape_room": lambda: BusinessEcosystem(
         key="specialty_escape_room",
         name="Escape Room",
         display_name="Escape Room",
@@ -2933,9 +2955,31 @@ BUSINESS_ECOSYSTEMS: Dict[str, BusinessEcosystem] = {
 # FUNCIONES DE UTILIDAD 
 # ===============================
 
+@lru_cache(maxsize=None)
+def get_ecosystem_by_key(key: str) -> Optional[BusinessEcosystem]:
+    """Obtener un ecosistema específico por su clave (se construye en el primer acceso)"""
+    factory = _ECOSYSTEM_FACTORIES.get(key)
+    return factory() if factory else None
+
+class _LazyEcosystems(Mapping[str, BusinessEcosystem]):
+    """Vista de solo lectura que construye cada ecosistema al accederlo"""
+
+    def __getitem__(self, key: str) -> BusinessEcosystem:
+        if key not in _ECOSYSTEM_FACTORIES:
+            raise KeyError(key)
+        return get_ecosystem_by_key(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ECOSYSTEM_FACTORIES)
+
+    def __len__(self) -> int:
+        return len(_ECOSYSTEM_FACTORIES)
+
+BUSINESS_ECOSYSTEMS: Mapping[str, BusinessEcosystem] = _LazyEcosystems()
+
 def get_available_ecosystems() -> Dict[str, BusinessEcosystem]:
-    """Obtener todos los ecosistemas disponibles"""
-    return BUSINESS_ECOSYSTEMS
+    """Obtener todos los ecosistemas disponibles (materializa todas las definiciones)"""
+    return {key: get_ecosystem_by_key(key) for key in _ECOSYSTEM_FACTORIES}
 
 def get_ecosystems_by_type(business_type: BusinessType) -> Dict[str, BusinessEcosystem]:
     """Obtener ecosistemas por tipo de negocio"""
@@ -2944,14 +2988,10 @@ def get_ecosystems_by_type(business_type: BusinessType) -> Dict[str, BusinessEco
         if ecosystem.business_type == business_type
     }
 
-def get_ecosystem_by_key(key: str) -> Optional[BusinessEcosystem]:
-    """Obtener un ecosistema específico por su clave"""
-    return BUSINESS_ECOSYSTEMS.get(key)
-
 def get_business_types() -> List[BusinessType]:
     """Obtener todos los tipos de negocio disponibles"""
     return list(set(ecosystem.business_type for ecosystem in BUSINESS_ECOSYSTEMS.values()))
 
 def get_ecosystem_display_names() -> Dict[str, str]:
     """Obtener mapa de key -> display_name para la UI"""
-    return {key: ecosystem.display_name for key, ecosystem in BUSINESS_ECOSYSTEMS.items()}
\ No newline at end of file
+    return {key: ecosystem.display_name for key, ecosystem in BUSINESS_ECOSYSTEMS.items()}
@@ -3,13 +3,17 @@ Generador de Ecosistemas de Negocios Actualizado
 Genera datasets completos e interconectados para ecosistemas de negocios específicos
 usando dominios y tablas reales del sistema
 """
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Set, Callable, Mapping
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 from pathlib import Path
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import logging
+import os
+import threading
 from datetime import datetime
-import uuid
-import time
 
 from .business_ecosystems import (
     BusinessEcosystem, 
@@ -18,27 +22,71 @@ from .business_ecosystems import (
     BusinessType
 )
 from ..generators import generate
+from ..utils.seed import resolve_seed
+from ..utils.frames import records_to_frame, frame_to_records
+from ..writers.parquet_writer import pa, pq, ParquetWriterSession
 
 # Intentar importar localización, fallar silenciosamente si no está disponible
 try:
-    from ..localization.i18n import translate_complete_dataset
+    from ..localization.i18n import translate_dataframe
     LOCALIZATION_AVAILABLE = True
 except ImportError:
     LOCALIZATION_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Pool de hilos compartido entre ejecuciones; se crea al primer uso
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Obtener (creando si hace falta) el pool de generación del módulo"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="ecosys")
+            atexit.register(_EXECUTOR.shutdown)
+        return _EXECUTOR
+
+
+def _translate_table(name: str, data: pd.DataFrame, language: str) -> pd.DataFrame:
+    """Traducir una tabla conservando la original si falla"""
+    try:
+        return translate_dataframe(data, language)
+    except Exception as e:
+        logger.warning("   Error traduciendo %s: %s", name, e)
+        return data
+
+
 class EcosystemGenerator:
     """
     Generador de ecosistemas de negocios completos usando dominios y tablas reales
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.ecosystem = None
         self.base_volume = 1000
-        self.generated_data = {}
+        self.generated_data: Dict[str, pd.DataFrame] = {}  # almacenamiento columnar por tabla
         self.id_mappings = {}  # Para mantener consistencia entre tablas
+        self.required_tables: Optional[Set[str]] = None  # None = todas las tablas
+        self.progress_cb: Optional[Callable[[str, int], None]] = None
+        self._volumes: Mapping[str, int] = MappingProxyType({})  # tabla -> registros, fijo por ejecución
+        self._table_index: Dict[str, int] = {}  # tabla -> posición, para derivar su semilla
+        self._lock = threading.Lock()
+        self._row_count = 0  # total de registros generados en la ejecución actual
+        self.seed = resolve_seed(seed)
+        self._rng = np.random.default_rng(self.seed)
+        # tabla -> (columnas del esquema, [(fk, ids_padre)]) calculado una vez por tabla
+        self._fk_plan: Dict[str, Tuple[frozenset, List[Tuple[str, np.ndarray]]]] = {}
         
     def generate_complete_ecosystem(self, ecosystem_key: str, base_volume: int = 1000, 
-                                  apply_translation: bool = False) -> Tuple[Dict[str, List[Dict]], Dict[str, Any]]:
+                                  apply_translation: bool = False,
+                                  requested_tables: Optional[Set[str]] = None,
+                                  progress_cb: Optional[Callable[[str, int], None]] = None,
+                                  parallel: bool = False,
+                                  max_workers: Optional[int] = None,
+                                  as_frames: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
         Generar un ecosistema completo de negocio
         
@@ -46,114 +94,396 @@ class EcosystemGenerator:
             ecosystem_key: Clave del ecosistema a generar
             base_volume: Volumen base para escalado
             apply_translation: Si aplicar traducción al español
+            requested_tables: Subconjunto de tablas a generar (se agregan sus dependencias).
+                None genera todas las tablas del ecosistema.
+            progress_cb: Callback opcional `(tabla, volumen)` invocado tras generar cada tabla.
+                Se ejecuta en el hilo del generador: las UIs deben reenviarlo a su event loop
+                (p. ej. `root.after`) en lugar de tocar widgets directamente.
+            parallel: Generar todas las tablas en un único ThreadPoolExecutor compartido por
+                los tres grupos. Las tablas comparten el estado global de `random`, por lo que
+                el resultado deja de ser reproducible con la misma semilla.
+            max_workers: Hilos a usar en modo paralelo; por defecto se usa el pool compartido
+                del módulo, dimensionado a `os.cpu_count()`.
+            as_frames: Devolver cada tabla como DataFrame en lugar de lista de dicts,
+                evitando la conversión final a filas.
             
         Returns:
             Tuple[generated_data, summary]
         """
-        print(f"GENERANDO ECOSISTEMA COMPLETO: {ecosystem_key}")
+        logger.info("GENERANDO ECOSISTEMA COMPLETO: %s", ecosystem_key)
         
         # Obtener definición del ecosistema
-        self.ecosystem = get_ecosystem_by_key(ecosystem_key)
-        if not self.ecosystem:
-            raise ValueError(f"Ecosistema '{ecosystem_key}' no encontrado")
-            
-        self.base_volume = base_volume
-        self.generated_data = {}
-        self.id_mappings = {}
+        self._prepare_run(ecosystem_key, base_volume, requested_tables, progress_cb)
         
-        print(f"Descripcion: {self.ecosystem.description}")
-        print(f"Volumen base: {base_volume} registros")
-        print("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Descripcion: %s", self.ecosystem.description)
+            logger.info("Volumen base: %d registros", base_volume)
+            logger.info("=" * 60)
         
         try:
             # Paso 1: Generar entidades maestras
-            print(f"Generando entidades maestras para {self.ecosystem.display_name}...")
-            
-            # Paso 2: Generar tablas principales
-            print("Generando tablas principales...")
-            self._generate_tables_group(self.ecosystem.core_tables, "principales")
+            logger.info("Generando entidades maestras para %s...", self.ecosystem.display_name)
             
-            # Paso 3: Generar tablas de soporte
-            print("Generando tablas de soporte...")
-            self._generate_tables_group(self.ecosystem.support_tables, "soporte")
+            if parallel:
+                # Pasos 2-4 en un solo pool: principales, soporte y análisis se solapan
+                logger.info("Generando tablas en paralelo...")
+                self._generate_groups_parallel([
+                    self.ecosystem.core_tables,
+                    self.ecosystem.support_tables,
+                    self.ecosystem.analytics_tables,
+                ], max_workers)
+            else:
+                # Paso 2: Generar tablas principales
+                logger.info("Generando tablas principales...")
+                self._generate_tables_group(self.ecosystem.core_tables, "principales")
+                
+                # Paso 3: Generar tablas de soporte
+                logger.info("Generando tablas de soporte...")
+                self._generate_tables_group(self.ecosystem.support_tables, "soporte")
+                
+                # Paso 4: Generar tablas de análisis
+                logger.info("Generando tablas de analisis...")
+                self._generate_tables_group(self.ecosystem.analytics_tables, "análisis")
             
-            # Paso 4: Generar tablas de análisis
-            print("Generando tablas de analisis...")
-            self._generate_tables_group(self.ecosystem.analytics_tables, "análisis")
+            # Paso 5: Enlazar claves foráneas con IDs reales de las tablas padre
+            logger.info("Aplicando relaciones...")
+            self._apply_relationships()
             
-            # Paso 5: Aplicar traducciones si se solicita
+            # Paso 6: Aplicar traducciones si se solicita
             if apply_translation and LOCALIZATION_AVAILABLE:
-                print("Aplicando traducciones...")
+                logger.info("Aplicando traducciones...")
                 self._apply_translations()
             
-            print("\nEcosistema generado exitosamente!")
+            logger.info("Ecosistema generado exitosamente!")
             
             # Crear resumen
             summary = self._create_summary()
-            print(f"Total de tablas: {summary['total_tables']}")
-            print(f"Total de registros: {summary['total_records']:,}")
+            logger.info("Total de tablas: %d", summary["total_tables"])
+            logger.info("Total de registros: %d", summary["total_records"])
             
-            return self.generated_data, summary
+            if as_frames:
+                return self.generated_data, summary
+            return {table: frame_to_records(df) for table, df in self.generated_data.items()}, summary
             
         except Exception as e:
-            print(f"Error generando ecosistema: {e}")
+            logger.error("Error generando ecosistema: %s", e)
             raise
     
+    def _prepare_run(self, ecosystem_key: str, base_volume: int,
+                     requested_tables: Optional[Set[str]],
+                     progress_cb: Optional[Callable[[str, int], None]]):
+        """Cargar el ecosistema y reiniciar el estado de una ejecución"""
+        self.ecosystem = get_ecosystem_by_key(ecosystem_key)
+        if not self.ecosystem:
+            raise ValueError(f"Ecosistema '{ecosystem_key}' no encontrado")
+            
+        self.base_volume = base_volume
+        self.generated_data = {}
+        self.id_mappings = {}
+        self._fk_plan = {}
+        self._rng = np.random.default_rng(self.seed)
+        self._row_count = 0
+        self.required_tables = self._resolve_required_tables(requested_tables)
+        self.progress_cb = progress_cb
+        # Volúmenes calculados una sola vez para todas las fases
+        self._volumes = MappingProxyType({
+            table: self._calculate_table_volume(table)
+            for tables_by_domain in (self.ecosystem.core_tables,
+                                     self.ecosystem.support_tables,
+                                     self.ecosystem.analytics_tables)
+            for tables in tables_by_domain.values()
+            for table in tables
+        })
+        self._table_index = {table: index for index, table in enumerate(self._volumes)}
+
+    def _table_seed(self, table: str) -> np.random.SeedSequence:
+        """Semilla propia de cada tabla derivada de `self.seed` y su posición en el ecosistema"""
+        return np.random.SeedSequence([self.seed, self._table_index[table]])
+
+    def _resolve_required_tables(self, requested_tables: Optional[Set[str]]) -> Optional[Set[str]]:
+        """Cierre transitivo de las tablas pedidas sobre las dependencias de `relationships`.
+
+        Pedir una tabla hija obliga a generar también sus tablas padre; la dirección
+        de cada relación se resuelve con `_fk_parents` (algunas declaran primero al padre).
+        """
+        if requested_tables is None:
+            return None
+        dependencies = {
+            child: {parent for _, parent in parents} for child, parents in self._fk_parents().items()
+        }
+        required: Set[str] = set()
+        pending = list(requested_tables)
+        while pending:
+            table = pending.pop()
+            if table in required:
+                continue
+            required.add(table)
+            pending.extend(dependencies.get(table, ()))
+        return required
+
+    def _is_required(self, table: str) -> bool:
+        return self.required_tables is None or table in self.required_tables
+
     def _generate_tables_group(self, tables_by_domain: Dict[str, List[str]], group_name: str):
         """Generar un grupo de tablas organizadas por dominio"""
         for domain, tables in tables_by_domain.items():
             for table in tables:
+                if self._is_required(table):
+                    self._generate_table(domain, table)
+
+    def _table_jobs(self, groups: List[Dict[str, List[str]]]) -> List[Tuple[str, str]]:
+        """Lista plana (dominio, tabla) de las tablas requeridas en el orden declarado"""
+        return [
+            (domain, table)
+            for tables_by_domain in groups
+            for domain, tables in tables_by_domain.items()
+            for table in tables
+            if self._is_required(table)
+        ]
+
+    def _generate_groups_parallel(self, groups: List[Dict[str, List[str]]], max_workers: Optional[int] = None):
+        """Generar varios grupos de tablas concurrentemente conservando el orden declarado"""
+        jobs = self._table_jobs(groups)
+        if len(jobs) <= 2:
+            for domain, table in jobs:
+                self._generate_table(domain, table)
+            return
+        # Con max_workers explícito se usa un pool propio; si no, el compartido
+        if max_workers:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                self._run_table_jobs(executor, jobs)
+        else:
+            self._run_table_jobs(_shared_executor(), jobs)
+        self.generated_data = {
+            table: self.generated_data[table] for _, table in jobs if table in self.generated_data
+        }
+
+    def _run_table_jobs(self, executor: ThreadPoolExecutor, jobs: List[Tuple[str, str]]):
+        """Enviar las tablas al pool y esperar a que terminen todas"""
+        futures = [executor.submit(self._generate_table, domain, table) for domain, table in jobs]
+        for future in as_completed(futures):
+            future.result()
+
+    def _generate_table(self, domain: str, table: str):
+        """Generar una tabla y registrarla en `generated_data`"""
+        try:
+            volume = self._volumes[table]
+            if volume > 0:
+                logger.info("   %s: %d registros", table, volume)
+                seed = int(self._table_seed(table).generate_state(1)[0])
+                data = records_to_frame(generate(domain, table, volume, seed=seed))
+                with self._lock:
+                    self.generated_data[table] = data
+                    self._row_count += len(data)
+            else:
+                logger.info("   %s: volumen calculado = 0, omitiendo", table)
+            if self.progress_cb:
+                self.progress_cb(table, volume)
+        except Exception as e:
+            logger.warning("   Error generando %s: %s", table, e)
+            with self._lock:
+                self.generated_data[table] = pd.DataFrame()
+    
+    def _relation_endpoints(self, relation: str, fk: str) -> Tuple[str, str]:
+        """Obtener (tabla_hija, tabla_padre) de una relación "tabla_a -> tabla_b".
+
+        Normalmente tabla_a contiene la FK, pero algunas definiciones declaran primero
+        la tabla dueña de la clave (p. ej. "dim_platform -> dim_channel": "platform_id").
+        """
+        source, _, target = (part.strip() for part in relation.partition("->"))
+        stem = fk[:-3] if fk.endswith("_id") else fk
+        if source.endswith(stem) and not target.endswith(stem):
+            return target, source
+        return source, target
+
+    def _extract_relationship_ids(self, table: str, key: str) -> np.ndarray:
+        """IDs de una tabla padre para una FK (columna homónima o `id`), cacheados en id_mappings"""
+        cache_key = (table, key)
+        if cache_key not in self.id_mappings:
+            df = self.generated_data.get(table)
+            if df is None or df.empty:
+                self.id_mappings[cache_key] = np.empty(0, dtype=np.int64)
+            else:
+                column = key if key in df.columns else "id"
+                ids = df[column].dropna() if column in df.columns else pd.Series(dtype=object)
+                self.id_mappings[cache_key] = ids.to_numpy()
+        return self.id_mappings[cache_key]
+
+    def _fk_parents(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Índice inverso tabla_hija -> [(fk, tabla_padre)] construido una vez desde `relationships`"""
+        index: Dict[str, List[Tuple[str, str]]] = {}
+        for relation, fk in self.ecosystem.relationships.items():
+            child, parent = self._relation_endpoints(relation, fk)
+            index.setdefault(child, []).append((fk, parent))
+        return index
+
+    def _get_fk_plan(self, table: str, df: pd.DataFrame, fk_parents: Dict[str, List[Tuple[str, str]]]) -> List[Tuple[str, np.ndarray]]:
+        """Plan de FKs de una tabla; se invalida si cambian las columnas del esquema"""
+        schema = frozenset(df.columns)
+        cached = self._fk_plan.get(table)
+        if cached is not None and cached[0] == schema:
+            return cached[1]
+        plan: List[Tuple[str, np.ndarray]] = []
+        for fk, parent in fk_parents.get(table, ()):
+            if fk in schema:
+                parent_ids = self._extract_relationship_ids(parent, fk)
+                if len(parent_ids):
+                    plan.append((fk, parent_ids))
+        self._fk_plan[table] = (schema, plan)
+        return plan
+
+    def _apply_relationships(self):
+        """Reasignar cada FK declarada en `relationships` a IDs generados en la tabla padre"""
+        fk_parents = self._fk_parents()
+        for table, df in self.generated_data.items():
+            if df.empty or table not in fk_parents:
+                continue
+            for fk, parent_ids in self._get_fk_plan(table, df, fk_parents):
+                # Un único sorteo vectorizado por columna FK, asignado como columna
+                df[fk] = pd.array(self._rng.choice(parent_ids, size=len(df)))
+
+    def sink_parquet(self, ecosystem_key: str, out_dir: Path, base_volume: int = 1000,
+                     chunk_size: int = 50_000,
+                     requested_tables: Optional[Set[str]] = None,
+                     progress_cb: Optional[Callable[[str, int], None]] = None) -> Dict[str, Any]:
+        """
+        Generar un ecosistema escribiendo cada tabla por lotes directamente a Parquet
+
+        No llena `generated_data`: solo se retienen en memoria las columnas de IDs que
+        otras tablas usan como FK y, por tabla, como mucho un row group (`ROW_GROUP_SIZE`
+        filas en Arrow) pendiente de escribir. Los archivos tienen el mismo orden,
+        row groups y tipos reducidos que la escritura no incremental. Las tablas
+        padre se escriben antes que sus hijas. Una tabla que falla a medias no deja
+        archivo y cuenta 0 registros, como el DataFrame vacío de la generación en memoria.
+
+        Returns:
+            Resumen del ecosistema, con la ruta de cada archivo en "files"
+        """
+        if pq is None:
+            raise RuntimeError("pyarrow no está instalado; no se puede escribir Parquet")
+        self._prepare_run(ecosystem_key, base_volume, requested_tables, progress_cb)
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        fk_parents = self._fk_parents()
+        parent_keys: Dict[str, Set[str]] = {}  # tabla padre -> FKs que la referencian
+        for links in fk_parents.values():
+            for fk, parent in links:
+                parent_keys.setdefault(parent, set()).add(fk)
+
+        logger.info("GENERANDO ECOSISTEMA EN PARQUET: %s -> %s", ecosystem_key, out_dir)
+        table_counts: Dict[str, int] = {}
+        files: Dict[str, str] = {}
+        for domain, table in self._parents_first(fk_parents):
+            volume = self._volumes[table]
+            path = out_dir / f"ecosystem__{table}.parquet"
+            logger.info("   %s: %d registros", table, volume)
+            retained: Dict[str, List[np.ndarray]] = {}
+            fk_columns: Optional[Dict[str, np.ndarray]] = None
+            # Mismo row group, orden y reducción de tipos que la escritura no incremental
+            writer = ParquetWriterSession(path, sort_by=self.ecosystem.get_sort_keys(table))
+            offsets = range(0, volume, chunk_size)
+            # Semilla propia por tabla y lote: ningún lote repite el flujo aleatorio de otro
+            chunk_seeds = self._table_seed(table).spawn(len(offsets))
+            failed = False
+            try:
+                for offset, chunk_seed in zip(offsets, chunk_seeds):
+                    size = min(chunk_size, volume - offset)
+                    seed = int(chunk_seed.generate_state(1)[0])
+                    df = records_to_frame(generate(domain, table, size, seed=seed))
+                    if fk_columns is None:
+                        # Columnas FK completas sorteadas una vez; cada lote toma su vista
+                        fk_columns = {
+                            fk: parent_ids[self._rng.integers(0, len(parent_ids), size=volume, dtype=np.int64)]
+                            for fk, parent_ids in self._get_fk_plan(table, df, fk_parents)
+                        }
+                    for fk, column in fk_columns.items():
+                        df[fk] = pd.array(column[offset:offset + size])
+                    for key in parent_keys.get(table, ()):
+                        column = key if key in df.columns else "id"
+                        if column in df.columns:
+                            retained.setdefault(key, []).append(df[column].dropna().to_numpy())
+                    writer.append_batch(pa.Table.from_pandas(df, preserve_index=False))
+            except Exception as e:
+                logger.warning("   Error generando %s: %s", table, e)
+                failed = True
+            finally:
                 try:
-                    volume = self._calculate_table_volume(table)
-                    if volume > 0:
-                        print(f"   {table}: {volume:,} registros")
-                        data = generate(domain, table, volume)
-                        self.generated_data[table] = data
-                    else:
-                        print(f"   {table}: volumen calculado = 0, omitiendo")
-                    # Micro-sleep para ceder control (evita UI aparente frozen en hilos únicos)
-                    time.sleep(0.001)
+                    writer.close()
                 except Exception as e:
-                    print(f"   Error generando {table}: {e}")
-                    self.generated_data[table] = []
-    
+                    logger.warning("   Error escribiendo %s: %s", table, e)
+                    failed = True
+            if failed:
+                # Igual que en memoria (DataFrame vacío): sin archivo parcial ni IDs para las hijas
+                path.unlink(missing_ok=True)
+                retained = {}
+            for key, parts in retained.items():
+                self.id_mappings[(table, key)] = np.concatenate(parts)
+            written = 0 if failed else writer.rows_written
+            table_counts[table] = written
+            self._row_count += written
+            if written:
+                files[table] = str(path)
+            if self.progress_cb:
+                self.progress_cb(table, volume)
+
+        summary = self._create_summary(table_counts)
+        summary["files"] = files
+        logger.info("Total de registros: %d", summary["total_records"])
+        return summary
+
+    def _parents_first(self, fk_parents: Dict[str, List[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+        """Ordenar las tablas requeridas para que cada padre preceda a sus hijas"""
+        jobs = self._table_jobs([
+            self.ecosystem.core_tables,
+            self.ecosystem.support_tables,
+            self.ecosystem.analytics_tables,
+        ])
+        by_table = {table: (domain, table) for domain, table in jobs}
+        ordered: List[Tuple[str, str]] = []
+        visited: Set[str] = set()
+
+        def visit(table: str):
+            if table in visited or table not in by_table:
+                return
+            visited.add(table)
+            for _, parent in fk_parents.get(table, ()):
+                visit(parent)
+            ordered.append(by_table[table])
+
+        for _, table in jobs:
+            visit(table)
+        return ordered
+
     def _calculate_table_volume(self, table: str) -> int:
         """Calcular el volumen de registros para una tabla específica"""
         ratio = self.ecosystem.volume_ratios.get(table, 1.0)
         return max(1, int(self.base_volume * ratio))
     
     def _apply_translations(self):
-        """Aplicar traducciones a los datos generados"""
-        translated_data = {}
-        for table_name, data in self.generated_data.items():
-            if data:  # Solo traducir si hay datos
-                try:
-                    translated_data[table_name] = translate_complete_dataset(data, "es")
-                except Exception as e:
-                    print(f"   ⚠️ Error traduciendo {table_name}: {e}")
-                    translated_data[table_name] = data  # Mantener original si falla
-            else:
-                translated_data[table_name] = data
-                
-        self.generated_data = translated_data
+        """Aplicar traducciones a los datos generados.
+
+        En el mismo proceso: cada tabla solo traduce sus valores distintos, así que
+        copiar los DataFrames a otros procesos cuesta más que la traducción.
+        """
+        self.generated_data = {
+            name: data if data.empty else _translate_table(name, data, "es")
+            for name, data in self.generated_data.items()
+        }
     
-    def _create_summary(self) -> Dict[str, Any]:
+    def _create_summary(self, table_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Crear resumen del ecosistema generado"""
-        tables_summary = {}
-        total_records = 0
-        
-        for table_name, data in self.generated_data.items():
-            record_count = len(data) if data else 0
-            tables_summary[table_name] = record_count
-            total_records += record_count
+        if table_counts is None:
+            table_counts = {table_name: len(data) for table_name, data in self.generated_data.items()}
+        tables_summary = dict(table_counts)
         
         return {
             "ecosystem_key": self.ecosystem.key,
             "ecosystem_name": self.ecosystem.display_name,
             "description": self.ecosystem.description,
             "business_type": self.ecosystem.business_type.value,
-            "total_tables": len(self.generated_data),
-            "total_records": total_records,
+            "total_tables": len(tables_summary),
+            "total_records": self._row_count,
             "base_volume": self.base_volume,
             "tables_summary": tables_summary,
             "master_entities": self.ecosystem.master_entities,
@@ -170,14 +500,25 @@ def get_available_ecosystem_options():
     return {key: ecosystem.display_name for key, ecosystem in ecosystems.items()}
 
 def generate_ecosystem_data(ecosystem_key: str, volume: int = 1000, 
-                          apply_translation: bool = False) -> Tuple[Dict[str, List[Dict]], Dict[str, Any]]:
+                          apply_translation: bool = False,
+                          requested_tables: Optional[Set[str]] = None,
+                          progress_cb: Optional[Callable[[str, int], None]] = None,
+                          parallel: bool = False,
+                          max_workers: Optional[int] = None,
+                          seed: Optional[int] = None,
+                          as_frames: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Función de conveniencia para generar un ecosistema completo
     
     Returns:
         Tuple[generated_data, summary]
     """
-    generator = EcosystemGenerator()
-    data, summary = generator.generate_complete_ecosystem(ecosystem_key, volume, apply_translation)
+    generator = EcosystemGenerator(seed=seed)
+    data, summary = generator.generate_complete_ecosystem(ecosystem_key, volume, apply_translation,
+                                                          requested_tables=requested_tables,
+                                                          progress_cb=progress_cb,
+                                                          parallel=parallel,
+                                                          max_workers=max_workers,
+                                                          as_frames=as_frames)
     
     return data, summary
\ No newline at end of file
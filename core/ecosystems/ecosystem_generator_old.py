@@ -7,6 +7,8 @@ import pandas as pd
 from pathlib import Path
 import json
 from datetime import datetime
+from functools import lru_cache
+import random
 import uuid
 
 from .business_ecosystems import (
@@ -18,6 +20,8 @@ from .business_ecosystems import (
 from ..generators import generate
 from ..localization.i18n import translate_complete_dataset
 
+_choice = random.choice
+
 
 class EcosystemGenerator:
     """Generador de ecosistemas completos de negocios"""
@@ -205,51 +209,24 @@ class EcosystemGenerator:
     
     def _map_entity_to_schema(self, entity: str) -> Tuple[str, str]:
         """Mapear entidad a dominio/tabla existente"""
-        # Mapeo básico - esto se puede expandir
-        entity_mapping = {
-            "users": ("creator_intelligence", "creator_intelligence"),
-            "customers": ("retail", "retail"),
-            "patients": ("healthcare", "patients"),
-            "students": ("education", "education"),
-            "products": ("retail", "retail"),
-            "sellers": ("enterprise", "enterprise"),
-            "employees": ("enterprise", "enterprise"),
-            "accounts": ("finance", "accounts"),
-            "stores": ("retail", "retail"),
-            "content": ("creator_intelligence", "creator_intelligence")
-        }
-        
-        return entity_mapping.get(entity, ("retail", "retail"))
+        return map_entity_to_schema(entity)
     
     def _map_table_to_schema(self, table: str) -> Tuple[str, str]:
         """Mapear tabla a dominio/tabla existente"""
-        # Mapeo inteligente basado en prefijos y nombres
-        if "social" in table or "content" in table or "platform" in table:
-            return ("creator_intelligence", "creator_intelligence")
-        elif "customer" in table or "retail" in table or "product" in table:
-            return ("retail", "retail")
-        elif "patient" in table or "doctor" in table or "medical" in table:
-            return ("healthcare", "patients")
-        elif "student" in table or "professor" in table or "course" in table:
-            return ("education", "education")
-        elif "account" in table or "transaction" in table or "bank" in table:
-            return ("finance", "accounts")
-        elif "employee" in table or "enterprise" in table or "company" in table:
-            return ("enterprise", "enterprise")
-        else:
-            # Default fallback
-            return ("retail", "retail")
+        return map_table_to_schema(table)
     
     def _extract_relationship_ids(self, entity: str, data: List[Dict]):
         """Extraer IDs para usar en relaciones"""
         if not data:
             return
             
-        # Buscar campo ID principal
-        id_fields = [key for key in data[0].keys() if 'id' in key.lower()]
+        # Buscar campo ID principal (primer "id" / "*_id"; evita falsos positivos como "paid")
+        primary_id = next(
+            (key for key in data[0] if key == 'id' or key.endswith('_id') or key.endswith('Id')),
+            None
+        )
         
-        if id_fields:
-            primary_id = id_fields[0]  # Usar el primer campo ID encontrado
+        if primary_id:
             ids = [record[primary_id] for record in data if primary_id in record]
             
             if entity not in self.relationships_map:
@@ -261,18 +238,20 @@ class EcosystemGenerator:
         # Esta es una implementación básica
         # En un sistema completo, esto sería más sofisticado
         
-        if not data or not self.relationships_map:
+        if not data or 'users' not in self.relationships_map:
+            return data
+        
+        # Los campos de relación se detectan una vez con el primer registro;
+        # las tablas sin FK (catálogos, soporte) salen sin recorrer los datos
+        fk_fields = [field for field in data[0] if 'user_id' in field]
+        user_ids = self.relationships_map['users'].get('ids', [])
+        if not fk_fields or not user_ids:
             return data
         
-        # Buscar campos de relación en los datos
         for record in data:
-            for field, value in record.items():
-                if 'user_id' in field and 'users' in self.relationships_map:
-                    # Reemplazar con ID real de usuario generado
-                    user_ids = self.relationships_map['users'].get('ids', [])
-                    if user_ids:
-                        import random
-                        record[field] = random.choice(user_ids)
+            for field in fk_fields:
+                # Reemplazar con ID real de usuario generado
+                record[field] = _choice(user_ids)
         
         return data
     
@@ -296,6 +275,47 @@ class EcosystemGenerator:
         }
 
 
+# Mapeo básico - esto se puede expandir
+_ENTITY_MAPPING: Dict[str, Tuple[str, str]] = {
+    "users": ("creator_intelligence", "creator_intelligence"),
+    "customers": ("retail", "retail"),
+    "patients": ("healthcare", "patients"),
+    "students": ("education", "education"),
+    "products": ("retail", "retail"),
+    "sellers": ("enterprise", "enterprise"),
+    "employees": ("enterprise", "enterprise"),
+    "accounts": ("finance", "accounts"),
+    "stores": ("retail", "retail"),
+    "content": ("creator_intelligence", "creator_intelligence")
+}
+
+# Mapeo inteligente basado en prefijos y nombres (se evalúa en orden)
+_TABLE_KEYWORDS: Tuple[Tuple[Tuple[str, ...], Tuple[str, str]], ...] = (
+    (("social", "content", "platform"), ("creator_intelligence", "creator_intelligence")),
+    (("customer", "retail", "product"), ("retail", "retail")),
+    (("patient", "doctor", "medical"), ("healthcare", "patients")),
+    (("student", "professor", "course"), ("education", "education")),
+    (("account", "transaction", "bank"), ("finance", "accounts")),
+    (("employee", "enterprise", "company"), ("enterprise", "enterprise")),
+)
+
+
+@lru_cache(maxsize=512)
+def map_entity_to_schema(entity: str) -> Tuple[str, str]:
+    """Mapear entidad a dominio/tabla existente"""
+    return _ENTITY_MAPPING.get(entity, ("retail", "retail"))
+
+
+@lru_cache(maxsize=512)
+def map_table_to_schema(table: str) -> Tuple[str, str]:
+    """Mapear tabla a dominio/tabla existente"""
+    for keywords, schema in _TABLE_KEYWORDS:
+        if any(keyword in table for keyword in keywords):
+            return schema
+    # Default fallback
+    return ("retail", "retail")
+
+
 def get_available_ecosystem_options() -> Dict[str, str]:
     """Obtener opciones de ecosistemas para la UI"""
     ecosystems = get_available_ecosystems()
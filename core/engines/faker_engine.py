@@ -8,19 +8,33 @@ Soporta contextos geográficos y localización de datos por país/región.
 """
 from __future__ import annotations
 from typing import Dict, Any, Callable
+from bisect import bisect_right
+from functools import lru_cache
 import random
-from datetime import datetime, timedelta, UTC
+import threading
+from datetime import date, datetime, timedelta, UTC
+
+import numpy as np
+
+try:  # pragma: no cover
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None  # type: ignore
 
 try:  # pragma: no cover
     from faker import Faker
 except ImportError:  # pragma: no cover
     Faker = None  # type: ignore
 
+try:  # pragma: no cover
+    import xxhash
+except ImportError:  # pragma: no cover
+    xxhash = None  # type: ignore
+
 # Importar sistemas de localización
 try:
     from core.localization.geographic_contexts import (
-        get_context_data, get_random_city, get_random_province, 
-        get_phone_format, get_currency
+        get_context_data, get_phone_format, get_currency
     )
     LOCALIZATION_AVAILABLE = True
 except ImportError:
@@ -35,11 +49,19 @@ _CURRENT_GEOGRAPHIC_CONTEXT = "global"
 _CURRENT_LANGUAGE = "en"
 _CURRENT_DATE_RANGE_START = None  # type: datetime | None
 _CURRENT_DATE_RANGE_END = None    # type: datetime | None
+# Derivados del rango, calculados una vez en `set_date_range`
+_RANGE_DAYS = 0             # días completos entre inicio y fin
+_RANGE_TOTAL_SECONDS = 0    # segundos entre inicio y fin
+_RANGE_START_ORD = 0        # ordinal de la fecha de inicio
+_RANGE_DATE_SUFFIX = ""     # parte horaria + zona de inicio, p. ej. "T00:00:00+00:00"
 
 def set_geographic_context(context_name: str):
     """Establecer el contexto geográfico global para la generación"""
-    global _CURRENT_GEOGRAPHIC_CONTEXT
+    global _CURRENT_GEOGRAPHIC_CONTEXT, _PHONE_FORMATTER, _PHONE_BATCH
     _CURRENT_GEOGRAPHIC_CONTEXT = context_name
+    if LOCALIZATION_AVAILABLE:
+        _refresh_context_cache()
+        _PHONE_FORMATTER, _PHONE_BATCH = _phone_generators(get_phone_format(context_name))
 
 def set_language_context(language: str):
     """Establecer el idioma para la generación"""
@@ -62,6 +84,7 @@ def set_date_range(start_ym: str | None, end_ym: str | None):
         end_ym: Cadena en formato 'YYYY-MM' o 'YYYY-MM-DD' (fin inclusive) o None para limpiar.
     """
     global _CURRENT_DATE_RANGE_START, _CURRENT_DATE_RANGE_END
+    global _RANGE_DAYS, _RANGE_TOTAL_SECONDS, _RANGE_START_ORD, _RANGE_DATE_SUFFIX
     if not start_ym or not end_ym:
         _CURRENT_DATE_RANGE_START = None
         _CURRENT_DATE_RANGE_END = None
@@ -70,15 +93,14 @@ def set_date_range(start_ym: str | None, end_ym: str | None):
     def _parse(s: str) -> datetime:
         s = s.strip()
         try:
-            # Intentar YYYY-MM-DD
-            return datetime.fromisoformat(s).replace(tzinfo=UTC) if 'T' not in s else datetime.fromisoformat(s)
-        except Exception:
-            # Intentar YYYY-MM
-            try:
-                year, month = map(int, s.split('-')[:2])
-                return datetime(year, month, 1, tzinfo=UTC)
-            except Exception as e:  # pragma: no cover
-                raise ValueError(f"Fecha inválida para rango: {s}") from e
+            # YYYY-MM (caso habitual desde la UI): sin pasar por fromisoformat
+            if len(s) == 7 and s[4] == '-':
+                return datetime(int(s[:4]), int(s[5:7]), 1, tzinfo=UTC)
+            # YYYY-MM-DD o fecha/hora ISO completa (conserva su zona horaria)
+            parsed = datetime.fromisoformat(s)
+            return parsed if 'T' in s else parsed.replace(tzinfo=UTC)
+        except ValueError as e:
+            raise ValueError(f"Fecha inválida para rango: {s}") from e
 
     start_dt = _parse(start_ym)
     end_dt = _parse(end_ym)
@@ -87,109 +109,438 @@ def set_date_range(start_ym: str | None, end_ym: str | None):
         start_dt, end_dt = end_dt, start_dt
     _CURRENT_DATE_RANGE_START = start_dt
     _CURRENT_DATE_RANGE_END = end_dt
+    _RANGE_DAYS = max(0, (end_dt.date() - start_dt.date()).days)
+    _RANGE_TOTAL_SECONDS = max(0, int((end_dt - start_dt).total_seconds()))
+    _RANGE_START_ORD = start_dt.toordinal()
+    _RANGE_DATE_SUFFIX = start_dt.isoformat()[10:]
+
+# Métodos de Faker ya resueltos: atributo -> método ligado (None si no existe)
+_FAKE_METHODS: Dict[str, Callable[[], Any] | None] = {}
+
+def _fake_method(attr: str) -> Callable[[], Any] | None:
+    try:
+        return _FAKE_METHODS[attr]
+    except KeyError:
+        method = _FAKE_METHODS[attr] = getattr(_FAKE, attr, None) if _FAKE else None
+        return method
+
+if _FAKE:
+    def _fake_or(default: str, attr: str) -> str:
+        method = _fake_method(attr)
+        return method() if method is not None else default
+else:
+    def _fake_or(default: str, attr: str) -> str:
+        return default
+
+class _RandomPool:
+    """Uniformes [0, 1) precalculadas por bloques con NumPy.
+
+    Cada llamada consume un valor del bloque en lugar de pasar por
+    `random.randint`/`random.uniform`; al agotarse se genera otro bloque
+    completo en una sola llamada al RNG.
+
+    El generador es PCG64DXSM sembrado vía `SeedSequence`, de modo que los
+    procesos paralelos pueden usar flujos independientes con `SeedSequence.spawn`.
+    """
+
+    SIZE = 65536
+
+    def __init__(self, seed: int = 42):
+        self.seed(seed)
 
-def _fake_or(default: str, attr: str) -> str:
-    if _FAKE and hasattr(_FAKE, attr):
-        return getattr(_FAKE, attr)()
-    return default
+    def seed(self, seed: int):
+        self.rng = np.random.Generator(np.random.PCG64DXSM(seed))
+        self._refill()
+
+    def _refill(self):
+        # Lista de floats de Python: indexarla es más barato que un ndarray
+        self._values = self.rng.random(self.SIZE).tolist()
+        self._idx = 0
+
+    def next(self) -> float:
+        idx = self._idx
+        if idx >= self.SIZE:
+            self._refill()
+            idx = 0
+        self._idx = idx + 1
+        return self._values[idx]
+
+
+_POOL = _RandomPool()
+_uniform01 = _POOL.next
+
+def seed_random_pool(seed: int):
+    """Reiniciar el pool de aleatorios para que la generación sea reproducible"""
+    _POOL.seed(seed)
+
+def seed_faker(seed: int):
+    """Reiniciar el estado de Faker (procesos reutilizados entre trabajos)"""
+    if _FAKE:
+        _FAKE.seed_instance(seed)
 
 def _rand_choice(opts):
-    return random.choice(opts)
+    return opts[int(_uniform01() * len(opts))]
 
 def _rand_numeric(min_v=0, max_v=1000):
-    return random.randint(min_v, max_v)
+    return min_v + int(_uniform01() * (max_v - min_v + 1))
+
+# ===== CAMPOS CON GENERACIÓN POR COLUMNA =====
+# Se invocan como las lambdas de GENERAL_MAP (un valor) y además exponen
+# `batch(n)`, que genera la columna completa con una sola llamada a NumPy.
+
+class _NumericField:
+    __slots__ = ("min_v", "max_v", "_span")
+
+    def __init__(self, min_v=0, max_v=1000):
+        self.min_v, self.max_v = min_v, max_v
+        self._span = max_v - min_v + 1
+
+    def __call__(self):
+        # Cuerpo de `_rand_numeric` en línea: una sola llamada Python por celda
+        return self.min_v + int(_uniform01() * self._span)
+
+    def batch(self, n: int) -> list:
+        return _POOL.rng.integers(self.min_v, self.max_v + 1, size=n).tolist()
+
+class _FloatField:
+    __slots__ = ("min_v", "max_v", "nd", "_width", "_lo", "_hi", "_scale", "_dtype")
+
+    def __init__(self, min_v=0, max_v=1000, nd=2):
+        self.min_v, self.max_v, self.nd = min_v, max_v, nd
+        self._width = max_v - min_v
+        # En bloque se sortean enteros en unidades de 10^-nd y se escalan al final
+        self._scale = 10 ** nd
+        self._lo, self._hi = round(min_v * self._scale), round(max_v * self._scale)
+        span = max(abs(self._lo), abs(self._hi))
+        self._dtype = np.int16 if span < 2**15 else np.int32 if span < 2**31 else np.int64
+
+    def __call__(self):
+        return round(self.min_v + _uniform01() * self._width, self.nd)
+
+    def batch(self, n: int) -> list:
+        units = _POOL.rng.integers(self._lo, self._hi + 1, size=n, dtype=self._dtype)
+        return (units / self._scale).tolist()
+
+class _ChoiceField:
+    """Elección entre opciones fijas, uniforme o con pesos.
+
+    Con pesos se precalcula la distribución acumulada una vez y cada valor se
+    obtiene por búsqueda binaria de una uniforme (`np.searchsorted` en bloque).
+    """
+    __slots__ = ("opts", "_n", "_values", "_index_dtype", "_cdf", "_cdf_list", "categorical")
+
+    def __init__(self, opts, weights=None):
+        self.opts = tuple(opts)
+        self._n = len(self.opts)
+        self._values = np.array(self.opts, dtype=object)
+        # Índices compactos: las listas de opciones casi siempre caben en uint8
+        self._index_dtype = np.uint8 if self._n <= 256 else np.uint16 if self._n <= 65536 else np.int64
+        # Texto sin repetidos: se puede emitir como pd.Categorical con estas categorías
+        self.categorical = len(set(self.opts)) == self._n and all(isinstance(o, str) for o in self.opts)
+        self._cdf = self._cdf_list = None
+        if weights is not None:
+            cdf = np.cumsum(np.asarray(weights, dtype=float))
+            self._cdf = cdf / cdf[-1]
+            self._cdf_list = self._cdf.tolist()
+
+    def __call__(self):
+        if self._cdf_list is not None:
+            return self.opts[min(bisect_right(self._cdf_list, _uniform01()), self._n - 1)]
+        return self.opts[int(_uniform01() * self._n)]
+
+    def codes(self, n: int) -> np.ndarray:
+        """Índices de `n` opciones sorteadas"""
+        if self._cdf is not None:
+            idx = np.searchsorted(self._cdf, _POOL.rng.random(n), side="right")
+            return np.minimum(idx, self._n - 1).astype(self._index_dtype)
+        return _POOL.rng.integers(0, self._n, size=n, dtype=self._index_dtype)
+
+    def batch(self, n: int) -> list:
+        return self._values[self.codes(n)].tolist()
+
+class _PrefixedNumberField:
+    """Código de texto con prefijo fijo y parte numérica, p. ej. "SKU12345" """
+    __slots__ = ("prefix", "min_v", "max_v", "_span")
+
+    def __init__(self, prefix: str, min_v: int, max_v: int):
+        self.prefix, self.min_v, self.max_v = prefix, min_v, max_v
+        self._span = max_v - min_v + 1
+
+    def __call__(self):
+        return f"{self.prefix}{self.min_v + int(_uniform01() * self._span)}"
+
+    def batch(self, n: int) -> list:
+        digits = _POOL.rng.integers(self.min_v, self.max_v + 1, size=n, dtype=np.int64).astype(str)
+        return (np.char.add(self.prefix, digits) if self.prefix else digits).tolist()
+
+class _TimeOfDayField:
+    """Hora del día "H:MM" con la hora entre `min_h` y `max_h`"""
+    __slots__ = ("min_h", "max_h")
+
+    def __init__(self, min_h: int, max_h: int):
+        self.min_h, self.max_h = min_h, max_h
+
+    def __call__(self):
+        return f"{_rand_numeric(self.min_h, self.max_h)}:{_rand_numeric(0, 59):02d}"
+
+    def batch(self, n: int) -> list:
+        rng = _POOL.rng
+        hours = rng.integers(self.min_h, self.max_h + 1, size=n).astype(str)
+        minutes = np.char.zfill(rng.integers(0, 60, size=n).astype(str), 2)
+        return np.char.add(np.char.add(hours, ":"), minutes).tolist()
+
+class _FakerField:
+    """Valor de Faker con el método ligado resuelto una sola vez.
+
+    En bloque se llama a Faker una vez por fila: muestrear de un pool repetiría
+    valores (correos, notas) en columnas grandes.
+    """
+    __slots__ = ("default", "attr", "_method")
+
+    def __init__(self, default: str, attr: str):
+        self.default, self.attr = default, attr
+        self._method = _fake_method(attr)
+
+    def __call__(self):
+        return self._method() if self._method is not None else self.default
 
-def _rand_float(min_v=0, max_v=1000, nd=2):
-    return round(random.uniform(min_v, max_v), nd)
+    def batch(self, n: int) -> list:
+        method = self._method
+        if method is None:
+            return [self.default] * n
+        return [method() for _ in range(n)]
+
+class _OptionalField:
+    """Valor de otro campo presente en `present` de cada `out_of` filas; None en el resto"""
+    __slots__ = ("spec", "present", "out_of")
+
+    def __init__(self, spec, present: int, out_of: int):
+        self.spec, self.present, self.out_of = spec, present, out_of
+
+    def __call__(self):
+        return self.spec() if int(_uniform01() * self.out_of) < self.present else None
+
+    def batch(self, n: int) -> list:
+        # Una máscara para toda la columna y valores solo para las filas presentes
+        keep = _POOL.rng.integers(0, self.out_of, size=n) < self.present
+        out = np.full(n, None, dtype=object)
+        out[keep] = self.spec.batch(int(keep.sum()))
+        return out.tolist()
+
+class _DateField:
+    __slots__ = ("days_back",)
+
+    def __init__(self, days_back=365):
+        self.days_back = days_back
+
+    def __call__(self):
+        return _rand_date(self.days_back)
+
+    def batch(self, n: int) -> list:
+        return _date_batch(n, self.days_back)
+
+class _DatetimeUtcField:
+    __slots__ = ("days_back",)
+
+    def __init__(self, days_back=365):
+        self.days_back = days_back
+
+    def __call__(self):
+        return _rand_datetime_utc(self.days_back)
+
+    def batch(self, n: int) -> list:
+        return _datetime_utc_batch(n, self.days_back)
+
+_numeric_field = _NumericField
+_float_field = _FloatField
+_choice_field = _ChoiceField
+_datetime_utc_field = _DatetimeUtcField
+_date_field = _DateField
+_prefixed_number_field = _PrefixedNumberField
+_faker_field = _FakerField
+_optional_field = _OptionalField
+_time_of_day_field = _TimeOfDayField
+# Campos sin entrada propia cuyo nombre sugiere una fecha (ver `_field_generator`)
+_GENERIC_DATE_FIELD = _DateField(365)
+
+# "Ahora" fijado por `generate_rows` para todo el lote (por hilo); fuera de un
+# lote se consulta el reloj en cada llamada
+_NOW = threading.local()
+
+def _now_utc() -> datetime:
+    return getattr(_NOW, "utc", None) or datetime.now(UTC)
+
+def _now_local() -> datetime:
+    return getattr(_NOW, "local", None) or datetime.now()
 
 def _rand_date(days_back=365):
     """Genera una fecha ISO. Si hay rango global, usarlo; si no, usar days_back relativo al ahora."""
-    if _CURRENT_DATE_RANGE_START and _CURRENT_DATE_RANGE_END:
-        start = _CURRENT_DATE_RANGE_START
-        end = _CURRENT_DATE_RANGE_END
-        # número de días entre ambos (inclusivo)
-        delta_days = max(0, (end.date() - start.date()).days)
-        pick = start + timedelta(days=random.randint(0, delta_days))
-        return pick.isoformat()
-    base = datetime.now(UTC)
-    return (base - timedelta(days=random.randint(0, days_back))).isoformat()
+    if _CURRENT_DATE_RANGE_START is not None:
+        # Sumar días enteros conserva la hora y zona del inicio
+        pick = date.fromordinal(_RANGE_START_ORD + _rand_numeric(0, _RANGE_DAYS))
+        return pick.isoformat() + _RANGE_DATE_SUFFIX
+    return (_now_utc() - timedelta(seconds=86400 * _rand_numeric(0, days_back))).isoformat()
 
 def _rand_datetime_utc(days_back=365):
     """Genera una fecha/hora UTC aleatoria respetando el rango global si está definido."""
-    if _CURRENT_DATE_RANGE_START and _CURRENT_DATE_RANGE_END:
-        start = _CURRENT_DATE_RANGE_START
-        end = _CURRENT_DATE_RANGE_END
-        total_seconds = max(0, int((end - start).total_seconds()))
-        # evitar cero segundos
-        offset = 0 if total_seconds == 0 else random.randint(0, total_seconds)
-        result = start + timedelta(seconds=offset)
-        return result.isoformat()
-    base = datetime.now(UTC)
-    delta_days = random.randint(-abs(days_back), abs(days_back))
-    result = base + timedelta(days=delta_days, hours=random.randint(0, 23), minutes=random.randint(0, 59))
-    return result.isoformat()
+    if _CURRENT_DATE_RANGE_START is not None:
+        offset = _rand_numeric(0, _RANGE_TOTAL_SECONDS)
+        return (_CURRENT_DATE_RANGE_START + timedelta(seconds=offset)).isoformat()
+    # Día en [-days_back, days_back] más hora y minuto: un solo sorteo en minutos
+    minutes = _rand_numeric(-1440 * abs(days_back), 1440 * abs(days_back) + 1439)
+    return (_now_utc() + timedelta(seconds=60 * minutes)).isoformat()
+
+def _iso_batch(start: datetime, offsets: np.ndarray) -> list:
+    """Formatear `start + offsets` (segundos) como `datetime.isoformat()` en bloque"""
+    naive = start.replace(tzinfo=None)
+    suffix = start.isoformat()[len(naive.isoformat()):]  # "+00:00" o "" si es naive
+    values = np.datetime64(naive, "us") + offsets.astype("timedelta64[s]")
+    text = np.datetime_as_string(values, unit="us" if naive.microsecond else "s")
+    return (np.char.add(text, suffix) if suffix else text).tolist()
+
+_EPOCH_ORD = date(1970, 1, 1).toordinal()
+
+def _date_batch(n: int, days_back=365) -> list:
+    """Versión por columna de `_rand_date`: fechas formateadas con datetime64"""
+    rng = _POOL.rng
+    if _CURRENT_DATE_RANGE_START is not None:
+        days = (_RANGE_START_ORD - _EPOCH_ORD) + rng.integers(0, _RANGE_DAYS + 1, size=n)
+        text = np.datetime_as_string(days.astype("datetime64[D]"))
+        return np.char.add(text, _RANGE_DATE_SUFFIX).tolist()
+    return _iso_batch(_now_utc(), rng.integers(0, days_back + 1, size=n) * -86400)
+
+def _datetime_utc_batch(n: int, days_back=365) -> list:
+    """Versión por columna de `_rand_datetime_utc`: un sorteo NumPy para n valores"""
+    rng = _POOL.rng
+    if _CURRENT_DATE_RANGE_START is not None:
+        return _iso_batch(_CURRENT_DATE_RANGE_START, rng.integers(0, _RANGE_TOTAL_SECONDS + 1, size=n))
+    minutes = rng.integers(-1440 * abs(days_back), 1440 * abs(days_back) + 1440, size=n)
+    return _iso_batch(_now_utc(), minutes * 60)
 
 def _rand_datetime_local():
     """Genera una fecha/hora local aleatoria respetando el rango global si está definido."""
-    if _CURRENT_DATE_RANGE_START and _CURRENT_DATE_RANGE_END:
+    if _CURRENT_DATE_RANGE_START is not None:
         # Convertir a naive local de ser necesario
-        start = _CURRENT_DATE_RANGE_START
-        end = _CURRENT_DATE_RANGE_END
-        total_seconds = max(0, int((end - start).total_seconds()))
-        offset = 0 if total_seconds == 0 else random.randint(0, total_seconds)
-        result = (start + timedelta(seconds=offset)).replace(tzinfo=None)
+        offset = _rand_numeric(0, _RANGE_TOTAL_SECONDS)
+        result = (_CURRENT_DATE_RANGE_START + timedelta(seconds=offset)).replace(tzinfo=None)
         return result.isoformat()
-    base = datetime.now()
-    delta_days = random.randint(-30, 30)
-    result = base + timedelta(days=delta_days, hours=random.randint(0, 23), minutes=random.randint(0, 59))
-    return result.isoformat()
+    return (_now_local() + timedelta(seconds=60 * _rand_numeric(-30 * 1440, 30 * 1440 + 1439))).isoformat()
 
 # ===== FUNCIONES LOCALIZADAS POR CONTEXTO GEOGRÁFICO =====
+# La disponibilidad de localización es fija desde la importación, así que cada
+# función se define una sola vez en su variante correspondiente.
 
-def _localized_city():
-    """Genera una ciudad según el contexto geográfico actual"""
-    if LOCALIZATION_AVAILABLE:
-        return get_random_city(_CURRENT_GEOGRAPHIC_CONTEXT)
-    return _fake_or("City", "city")
+# Bloques numéricos (mín, máx) de cada formato telefónico tras el prefijo
+_PHONE_PARTS: Dict[str, tuple] = {
+    "+593": ((90, 99), (100, 999), (1000, 9999)),     # Ecuador
+    "+57": ((300, 350), (100, 999), (1000, 9999)),    # Colombia
+    "+52": ((55, 99), (1000, 9999), (1000, 9999)),    # México
+    "+34": ((600, 799), (100, 999), (100, 999)),      # España
+    "+1": ((200, 999), (200, 999), (1000, 9999)),     # USA/Canadá
+}
+_PHONE_DEFAULT_PARTS = ((100000, 999999999),)
 
-def _localized_province():
-    """Genera una provincia/estado según el contexto geográfico actual"""
-    if LOCALIZATION_AVAILABLE:
-        return get_random_province(_CURRENT_GEOGRAPHIC_CONTEXT)
-    return _fake_or("State", "state")
+def _phone_generators(phone_format: str) -> tuple:
+    """Elegir una vez los generadores (por valor, por columna) de un formato de país"""
+    if phone_format == "MIXED":
+        fallback = lambda: _fake_or("+1-555-0000", "phone_number")
+        return fallback, lambda n: [fallback() for _ in range(n)]
+    parts = _PHONE_PARTS.get(phone_format, _PHONE_DEFAULT_PARTS)
 
-def _localized_phone():
-    """Genera un teléfono con formato del contexto geográfico actual"""
-    if LOCALIZATION_AVAILABLE:
-        phone_format = get_phone_format(_CURRENT_GEOGRAPHIC_CONTEXT)
-        if phone_format != "MIXED":
-            # Generar número según formato del país
-            if phone_format == "+593":  # Ecuador
-                return f"+593-{random.randint(90,99)}-{random.randint(100,999)}-{random.randint(1000,9999)}"
-            elif phone_format == "+57":  # Colombia
-                return f"+57-{random.randint(300,350)}-{random.randint(100,999)}-{random.randint(1000,9999)}"
-            elif phone_format == "+52":  # México
-                return f"+52-{random.randint(55,99)}-{random.randint(1000,9999)}-{random.randint(1000,9999)}"
-            elif phone_format == "+34":  # España
-                return f"+34-{random.randint(600,799)}-{random.randint(100,999)}-{random.randint(100,999)}"
-            elif phone_format == "+1":  # USA/Canadá
-                return f"+1-{random.randint(200,999)}-{random.randint(200,999)}-{random.randint(1000,9999)}"
-            else:
-                return f"{phone_format}-{random.randint(100000,999999999)}"
-    return _fake_or("+1-555-0000", "phone_number")
+    def scalar() -> str:
+        return "-".join([phone_format, *[str(_rand_numeric(lo, hi)) for lo, hi in parts]])
 
-def _localized_currency():
-    """Obtiene la moneda del contexto geográfico actual"""
-    if LOCALIZATION_AVAILABLE:
+    def batch(n: int) -> list:
+        text = np.full(n, phone_format)
+        for lo, hi in parts:
+            digits = _POOL.rng.integers(lo, hi + 1, size=n).astype(str)
+            text = np.char.add(np.char.add(text, "-"), digits)
+        return text.tolist()
+
+    return scalar, batch
+
+# Datos del contexto activo, recalculados solo en `set_geographic_context`
+_CACHED_CTX: Dict[str, Any] = {}
+_CACHED_CITIES: tuple = ()
+_CACHED_PROVINCES: tuple = ()
+_CACHED_STREETS: tuple = ()
+_CACHED_COUNTRIES: tuple = ()
+_CACHED_POSTAL_FMT = "#####"
+_CACHED_COUNTRY_NAME = None  # None en el contexto "global"
+
+# Mapear código de país a nombre
+_COUNTRY_NAMES: Dict[str, str] = {
+    "ecuador": "Ecuador",
+    "colombia": "Colombia", 
+    "mexico": "México",
+    "argentina": "Argentina",
+    "chile": "Chile",
+    "peru": "Perú",
+    "espana": "España",
+    "francia": "Francia",
+    "alemania": "Alemania",
+    "italia": "Italia",
+    "usa": "Estados Unidos",
+    "canada": "Canadá"
+}
+
+def _refresh_context_cache():
+    global _CACHED_CTX, _CACHED_CITIES, _CACHED_PROVINCES, _CACHED_STREETS
+    global _CACHED_COUNTRIES, _CACHED_POSTAL_FMT, _CACHED_COUNTRY_NAME
+    _CACHED_CTX = get_context_data(_CURRENT_GEOGRAPHIC_CONTEXT)
+    _CACHED_CITIES = tuple(_CACHED_CTX["cities"])
+    _CACHED_PROVINCES = tuple(_CACHED_CTX.get("provinces", ()))
+    _CACHED_STREETS = tuple(_CACHED_CTX.get("streets", ()))
+    _CACHED_COUNTRIES = tuple(_CACHED_CTX.get("countries", ["Global"]))
+    _CACHED_POSTAL_FMT = _CACHED_CTX.get("postal_code_format", "#####")
+    _CACHED_COUNTRY_NAME = (None if _CURRENT_GEOGRAPHIC_CONTEXT == "global"
+                            else _COUNTRY_NAMES.get(_CURRENT_GEOGRAPHIC_CONTEXT, "Global"))
+
+if LOCALIZATION_AVAILABLE:
+    _refresh_context_cache()
+
+    def _localized_city():
+        """Genera una ciudad según el contexto geográfico actual"""
+        return _rand_choice(_CACHED_CITIES)
+
+    def _localized_province():
+        """Genera una provincia/estado según el contexto geográfico actual"""
+        return _rand_choice(_CACHED_PROVINCES) if _CACHED_PROVINCES else "N/A"
+
+    def _localized_currency():
+        """Obtiene la moneda del contexto geográfico actual"""
         return get_currency(_CURRENT_GEOGRAPHIC_CONTEXT)
-    return "USD"
+
+    _PHONE_FORMATTER, _PHONE_BATCH = _phone_generators(get_phone_format(_CURRENT_GEOGRAPHIC_CONTEXT))
+else:
+    def _localized_city():
+        return _fake_or("City", "city")
+
+    def _localized_province():
+        return _fake_or("State", "state")
+
+    def _localized_currency():
+        return "USD"
+
+    _PHONE_FORMATTER, _PHONE_BATCH = _phone_generators("MIXED")
+
+class _PhoneField:
+    """Teléfono localizado; el formato activo se fija en `set_geographic_context`"""
+    __slots__ = ()
+
+    def __call__(self):
+        return _PHONE_FORMATTER()
+
+    def batch(self, n: int) -> list:
+        return _PHONE_BATCH(n)
+
+_PHONE_FIELD = _PhoneField()
 
 def _localized_address():
     """Genera una dirección localizada según el contexto geográfico"""
     if LOCALIZATION_AVAILABLE:
-        context = get_context_data(_CURRENT_GEOGRAPHIC_CONTEXT)
-        if "streets" in context:
-            street = random.choice(context["streets"])
+        if _CACHED_STREETS:
+            street = random.choice(_CACHED_STREETS)
             number = random.randint(1, 999)
             return f"{street} {number}"
     return _fake_or("123 Main St", "address")
@@ -197,8 +548,7 @@ def _localized_address():
 def _localized_postal_code():
     """Genera código postal según formato del país"""
     if LOCALIZATION_AVAILABLE:
-        context = get_context_data(_CURRENT_GEOGRAPHIC_CONTEXT)
-        postal_format = context.get("postal_code_format", "#####")
+        postal_format = _CACHED_POSTAL_FMT
         
         # Generar según formato específico
         if postal_format == "EC######":  # Ecuador
@@ -208,746 +558,745 @@ def _localized_postal_code():
         elif postal_format == "#####":  # México, España, USA
             return f"{random.randint(10000,99999)}"
         elif postal_format == "A####AAA":  # Argentina
-            return f"{random.choice('ABCDEFG')}{random.randint(1000,9999)}{random.choice('ABC')}{random.choice('ABC')}{random.choice('ABC')}"
+            # Un solo sorteo de 64 bits descompuesto en cada posición
+            r, a = divmod(random.getrandbits(64), 7)
+            r, digits = divmod(r, 9000)
+            r, b = divmod(r, 3)
+            r, c = divmod(r, 3)
+            return f"{'ABCDEFG'[a]}{1000 + digits}{'ABC'[b]}{'ABC'[c]}{'ABC'[r % 3]}"
         elif postal_format == "A#A #A#":  # Canadá
-            return f"{random.choice('ABCDEFG')}{random.randint(0,9)}{random.choice('ABCDEFG')} {random.randint(0,9)}{random.choice('ABCDEFG')}{random.randint(0,9)}"
+            r, a = divmod(random.getrandbits(64), 7)
+            r, d1 = divmod(r, 10)
+            r, b = divmod(r, 7)
+            r, d2 = divmod(r, 10)
+            r, c = divmod(r, 7)
+            return f"{'ABCDEFG'[a]}{d1}{'ABCDEFG'[b]} {d2}{'ABCDEFG'[c]}{r % 10}"
     return f"{random.randint(10000,99999)}"
 
 def _localized_country():
     """Obtiene el país del contexto geográfico actual"""
     if LOCALIZATION_AVAILABLE:
-        context = get_context_data(_CURRENT_GEOGRAPHIC_CONTEXT)
-        if _CURRENT_GEOGRAPHIC_CONTEXT == "global":
-            return random.choice(context.get("countries", ["Global"]))
-        else:
-            # Mapear código de país a nombre
-            country_names = {
-                "ecuador": "Ecuador",
-                "colombia": "Colombia", 
-                "mexico": "México",
-                "argentina": "Argentina",
-                "chile": "Chile",
-                "peru": "Perú",
-                "espana": "España",
-                "francia": "Francia",
-                "alemania": "Alemania",
-                "italia": "Italia",
-                "usa": "Estados Unidos",
-                "canada": "Canadá"
-            }
-            return country_names.get(_CURRENT_GEOGRAPHIC_CONTEXT, "Global")
+        if _CACHED_COUNTRY_NAME is None:  # contexto "global": país aleatorio
+            return random.choice(_CACHED_COUNTRIES)
+        return _CACHED_COUNTRY_NAME
     return _fake_or("Country", "country")
 
+# Opciones usadas dentro de expresiones compuestas de GENERAL_MAP
+_UNIT_SIZE_UOMS = ("ml", "g", "kg", "L", "units")
+_COURSE_CODE_SUBJECTS = ("MATH", "ENG", "SCI", "HIST", "ART")
+_COURSE_TITLE_PREFIXES = ("Introduction to", "Advanced", "Principles of", "Applied", "Contemporary")
+_COURSE_TITLE_SUBJECTS = ("Mathematics", "Science", "Literature", "History", "Art")
+
 GENERAL_MAP: Dict[str, Callable[[], Any]] = {
     # Identificadores genéricos
-    "id": lambda: _rand_numeric(1, 10_000_000),
-    "*_id": lambda: _rand_numeric(1, 10_000_000),
+    "id": _numeric_field(1, 10_000_000),
+    "*_id": _numeric_field(1, 10_000_000),
     "*_id_hash": lambda: hashlib_sha("id" + str(_rand_numeric())),
-    "*_code": lambda: f"C{_rand_numeric(100,999)}",
-    "*_number": lambda: f"N{_rand_numeric(1000,9999)}",
+    "*_code": _prefixed_number_field("C", 100, 999),
+    "*_number": _prefixed_number_field("N", 1000, 9999),
     
     # Nombres y descripciones - Base
-    "first_name": lambda: _fake_or("Name", "first_name"),
-    "last_name": lambda: _fake_or("Last", "last_name"),
-    "provider_name": lambda: _fake_or("Clinic", "company"),
-    "procedure_name": lambda: _fake_or("Procedure", "bs"),
-    "diagnosis_name": lambda: _fake_or("Diagnosis", "catch_phrase"),
-    "branch_name": lambda: _fake_or("Branch", "city"),
-    "site_name": lambda: _fake_or("Site", "street_name"),
-    "channel_name": lambda: _fake_or("Channel", "word"),
-    "visit_name": lambda: f"Visit {_rand_numeric(1,20)}",
-    "product_line": lambda: _fake_or("Product", "word"),
-    "policy_id": lambda: f"POL{_rand_numeric(1000,9999)}",
-    "coverage_limit": lambda: _rand_float(10000, 1000000, 2),
-    "deductible": lambda: _rand_float(500, 5000, 2),
-    "premium_amount": lambda: _rand_float(100, 2000, 2),
-    "claim_amount": lambda: _rand_float(100, 50000, 2),
-    "approval_amount": lambda: _rand_float(100, 45000, 2),
-    "outstanding_balance": lambda: _rand_float(0, 10000, 2),
-    "credit_limit": lambda: _rand_float(1000, 50000, 2),
-    "interest_rate": lambda: _rand_float(0.01, 0.25, 4),
-    "loan_id": lambda: _rand_numeric(1000000, 9999999),
-    "account_id": lambda: _rand_numeric(100000, 999999),
-    "transaction_amount": lambda: _rand_float(1, 10000, 2),
-    "fee_amount": lambda: _rand_float(0, 100, 2),
+    "first_name": _faker_field("Name", "first_name"),
+    "last_name": _faker_field("Last", "last_name"),
+    "provider_name": _faker_field("Clinic", "company"),
+    "procedure_name": _faker_field("Procedure", "bs"),
+    "diagnosis_name": _faker_field("Diagnosis", "catch_phrase"),
+    "branch_name": _faker_field("Branch", "city"),
+    "site_name": _faker_field("Site", "street_name"),
+    "channel_name": _faker_field("Channel", "word"),
+    "visit_name": _prefixed_number_field("Visit ", 1, 20),
+    "product_line": _faker_field("Product", "word"),
+    "policy_id": _prefixed_number_field("POL", 1000, 9999),
+    "coverage_limit": _float_field(10000, 1000000, 2),
+    "deductible": _float_field(500, 5000, 2),
+    "premium_amount": _float_field(100, 2000, 2),
+    "claim_amount": _float_field(100, 50000, 2),
+    "approval_amount": _float_field(100, 45000, 2),
+    "outstanding_balance": _float_field(0, 10000, 2),
+    "credit_limit": _float_field(1000, 50000, 2),
+    "interest_rate": _float_field(0.01, 0.25, 4),
+    "loan_id": _numeric_field(1000000, 9999999),
+    "account_id": _numeric_field(100000, 999999),
+    "transaction_amount": _float_field(1, 10000, 2),
+    "fee_amount": _float_field(0, 100, 2),
     
     # ===== CAMPOS GEOGRÁFICOS LOCALIZADOS =====
-    "city": lambda: _localized_city(),
-    "city_name": lambda: _localized_city(),
-    "state": lambda: _localized_province(),
-    "province": lambda: _localized_province(),
-    "state_province": lambda: _localized_province(),
-    "country": lambda: _localized_country(),
-    "country_name": lambda: _localized_country(),
-    "address": lambda: _localized_address(),
-    "street_address": lambda: _localized_address(),
-    "postal_code": lambda: _localized_postal_code(),
-    "zip_code": lambda: _localized_postal_code(),
-    "currency_code": lambda: _localized_currency(),
-    "phone_number": lambda: _localized_phone(),
+    "city": _localized_city,
+    "city_name": _localized_city,
+    "state": _localized_province,
+    "province": _localized_province,
+    "state_province": _localized_province,
+    "country": _localized_country,
+    "country_name": _localized_country,
+    "address": _localized_address,
+    "street_address": _localized_address,
+    "postal_code": _localized_postal_code,
+    "zip_code": _localized_postal_code,
+    "currency_code": _localized_currency,
+    "phone_number": _PHONE_FIELD,
     
     # Enterprise - HR/RR.HH.
-    "employee_id": lambda: _rand_numeric(10000, 99999),
-    "email_corp": lambda: _fake_or("john.doe@company.com", "company_email"),
-    "email_personal": lambda: _fake_or("john@gmail.com", "email"),
-    "job_title": lambda: _rand_choice(["Analyst", "Manager", "Director", "Specialist", "Coordinator"]),
-    "job_family": lambda: _rand_choice(["Engineering", "Sales", "Marketing", "HR", "Finance"]),
-    "job_level": lambda: _rand_choice(["Junior", "Mid", "Senior", "Lead", "Principal"]),
-    "grade": lambda: _rand_choice(["A", "B", "C", "D", "E"]),
-    "salary_base_annual": lambda: _rand_float(30000, 150000, 2),
-    "org_unit_name": lambda: _rand_choice(["Engineering", "Sales", "Marketing", "HR", "Finance", "Operations"]),
-    "manager_employee_id": lambda: _rand_numeric(10000, 99999),
-    "parent_org_unit_id": lambda: _rand_numeric(100, 999),
-    "headcount_date": lambda: _rand_date(365),
-    "active_flag": lambda: _rand_choice([True, False]),
-    "termination_reason": lambda: _rand_choice(["Resignation", "Layoff", "Performance", "Retirement"]),
-    "voluntary_flag": lambda: _rand_choice([True, False]),
-    "hours_overtime": lambda: _rand_float(0, 20, 2),
-    "overtime_rate": lambda: _rand_float(1.5, 2.0, 2),
-    "pto_type": lambda: _rand_choice(["Vacation", "Sick", "Personal", "Holiday"]),
-    "hours_pto": lambda: _rand_float(1, 8, 2),
-    "approval_status": lambda: _rand_choice(["Approved", "Pending", "Rejected"]),
+    "employee_id": _numeric_field(10000, 99999),
+    "email_corp": _faker_field("john.doe@company.com", "company_email"),
+    "email_personal": _faker_field("john@gmail.com", "email"),
+    "job_title": _choice_field(["Analyst", "Manager", "Director", "Specialist", "Coordinator"]),
+    "job_family": _choice_field(["Engineering", "Sales", "Marketing", "HR", "Finance"]),
+    "job_level": _choice_field(["Junior", "Mid", "Senior", "Lead", "Principal"]),
+    "grade": _choice_field(["A", "B", "C", "D", "E"]),
+    "salary_base_annual": _float_field(30000, 150000, 2),
+    "org_unit_name": _choice_field(["Engineering", "Sales", "Marketing", "HR", "Finance", "Operations"]),
+    "manager_employee_id": _numeric_field(10000, 99999),
+    "parent_org_unit_id": _numeric_field(100, 999),
+    "headcount_date": _date_field(365),
+    "active_flag": _choice_field([True, False]),
+    "termination_reason": _choice_field(["Resignation", "Layoff", "Performance", "Retirement"]),
+    "voluntary_flag": _choice_field([True, False]),
+    "hours_overtime": _float_field(0, 20, 2),
+    "overtime_rate": _float_field(1.5, 2.0, 2),
+    "pto_type": _choice_field(["Vacation", "Sick", "Personal", "Holiday"]),
+    "hours_pto": _float_field(1, 8, 2),
+    "approval_status": _choice_field(["Approved", "Pending", "Rejected"]),
     
     # Microbusiness/Retail - Productos y Ventas  
-    "sku": lambda: f"SKU{_rand_numeric(10000,99999)}",
-    "product_name": lambda: _fake_or("Product Name", "word"),
-    "category": lambda: _rand_choice(["Electronics", "Clothing", "Food", "Books", "Home"]),
-    "brand": lambda: _fake_or("Brand Name", "company"),
-    "unit_size": lambda: f"{_rand_numeric(1,1000)}{_rand_choice(['ml', 'g', 'kg', 'L', 'units'])}",
-    "uom": lambda: _rand_choice(["each", "kg", "liter", "box", "pack"]),
-    "list_price": lambda: _rand_float(5, 500, 2),
-    "cost_unit": lambda: _rand_float(1, 250, 2),
-    "unit_price": lambda: _rand_float(1, 500, 2),
-    "supplier_name": lambda: _fake_or("Supplier Corp", "company"),
-    "contact_phone": lambda: _localized_phone(),
-    "credit_terms_days": lambda: _rand_numeric(15, 90),
-    "lead_time_days": lambda: _rand_numeric(1, 30),
-    "store_name": lambda: _fake_or("Store Name", "street_name"),
-    "store_type": lambda: _rand_choice(["Convenience", "Grocery", "Specialty", "Department"]),
-    "owner_name": lambda: _fake_or("Owner Name", "name"),
-    "customer_name": lambda: _fake_or("Customer Name", "name"),
-    "phone": lambda: _localized_phone(),
-    "loyalty_points": lambda: _rand_numeric(0, 10000),
-    "loyalty_tier": lambda: _rand_choice(["Bronze", "Silver", "Gold", "Platinum"]),
-    "loyalty_points_balance": lambda: _rand_numeric(0, 50000),
-    "registration_date": lambda: _rand_date(1000),
-    "opening_date": lambda: _rand_date(2000),
-    "ticket_id": lambda: _rand_numeric(100000, 999999),
-    "line_total": lambda: _rand_float(1, 1000, 2),
-    "payment_method": lambda: _rand_choice(["Cash", "Credit", "Debit", "Mobile"]),
-    "tax_amount": lambda: _rand_float(0, 50, 2),
-    "discount_amount": lambda: _rand_float(0, 100, 2),
-    "void_reason": lambda: _rand_choice(["Customer Request", "Wrong Item", "Price Error"]),
-    "return_reason": lambda: _rand_choice(["Defective", "Wrong Size", "Customer Change"]),
-    "cashier_id": lambda: _rand_numeric(1000, 9999),
-    "shift_type": lambda: _rand_choice(["Morning", "Afternoon", "Night"]),
-    "ean_upc": lambda: f"{_rand_numeric(100000000000, 999999999999)}",
+    "sku": _prefixed_number_field("SKU", 10000, 99999),
+    "product_name": _faker_field("Product Name", "word"),
+    "category": _choice_field(["Electronics", "Clothing", "Food", "Books", "Home"]),
+    "brand": _faker_field("Brand Name", "company"),
+    "unit_size": lambda: f"{_rand_numeric(1,1000)}{_rand_choice(_UNIT_SIZE_UOMS)}",
+    "uom": _choice_field(["each", "kg", "liter", "box", "pack"]),
+    "list_price": _float_field(5, 500, 2),
+    "cost_unit": _float_field(1, 250, 2),
+    "unit_price": _float_field(1, 500, 2),
+    "supplier_name": _faker_field("Supplier Corp", "company"),
+    "contact_phone": _PHONE_FIELD,
+    "credit_terms_days": _numeric_field(15, 90),
+    "lead_time_days": _numeric_field(1, 30),
+    "store_name": _faker_field("Store Name", "street_name"),
+    "store_type": _choice_field(["Convenience", "Grocery", "Specialty", "Department"]),
+    "owner_name": _faker_field("Owner Name", "name"),
+    "customer_name": _faker_field("Customer Name", "name"),
+    "phone": _PHONE_FIELD,
+    "loyalty_points": _numeric_field(0, 10000),
+    "loyalty_tier": _choice_field(["Bronze", "Silver", "Gold", "Platinum"]),
+    "loyalty_points_balance": _numeric_field(0, 50000),
+    "registration_date": _date_field(1000),
+    "opening_date": _date_field(2000),
+    "ticket_id": _numeric_field(100000, 999999),
+    "line_total": _float_field(1, 1000, 2),
+    "payment_method": _choice_field(["Cash", "Credit", "Debit", "Mobile"]),
+    "tax_amount": _float_field(0, 50, 2),
+    "discount_amount": _float_field(0, 100, 2),
+    "void_reason": _choice_field(["Customer Request", "Wrong Item", "Price Error"]),
+    "return_reason": _choice_field(["Defective", "Wrong Size", "Customer Change"]),
+    "cashier_id": _numeric_field(1000, 9999),
+    "shift_type": _choice_field(["Morning", "Afternoon", "Night"]),
+    "ean_upc": _prefixed_number_field("", 100000000000, 999999999999),
     
     # Education - K-12, EdTech B2B, Higher Education
-    "lead_id": lambda: _rand_numeric(100000, 999999),
-    "student_id": lambda: _rand_numeric(100000, 999999),
-    "parent_id": lambda: _rand_numeric(100000, 999999),
-    "faculty_id": lambda: _rand_numeric(10000, 99999),
-    "course_id": lambda: _rand_numeric(1000, 9999),
-    "account_id": lambda: _rand_numeric(10000, 99999),
-    "program_id": lambda: _rand_numeric(1000, 9999),
-    "enrollment_id": lambda: _rand_numeric(1000000, 9999999),
-    "grade_id": lambda: _rand_numeric(1000000, 9999999),
-    "parent_first_name": lambda: _fake_or("Parent Name", "first_name"),
-    "parent_last_name": lambda: _fake_or("Parent Surname", "last_name"),
-    "parent_email": lambda: _fake_or("parent@email.com", "email"),
-    "parent_phone": lambda: _fake_or("+1234567890", "phone_number"),
-    "student_first_name": lambda: _fake_or("Student Name", "first_name"),
-    "student_last_name": lambda: _fake_or("Student Surname", "last_name"),
-    "student_birth_date": lambda: _rand_date(6570),  # Niños de ~18 años atrás
-    "grade_level": lambda: _rand_choice(["Pre-K", "K", "1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th", "9th", "10th", "11th", "12th"]),
-    "school_interest": lambda: _rand_choice(["Public", "Private", "Charter", "Magnet", "Homeschool"]),
-    "lead_source": lambda: _rand_choice(["Website", "Referral", "Social Media", "Advertisement", "Event", "Cold Call"]),
-    "lead_status": lambda: _rand_choice(["New", "Contacted", "Qualified", "Proposal", "Enrolled", "Lost"]),
-    "inquiry_date": lambda: _rand_date(365),
-    "follow_up_date": lambda: _rand_date(30),
-    "assigned_counselor": lambda: _fake_or("Counselor Name", "name"),
-    "location_preference": lambda: _rand_choice(["Main Campus", "North Campus", "South Campus", "Online", "Hybrid"]),
-    "budget_range": lambda: _rand_choice(["$0-5k", "$5-10k", "$10-15k", "$15-20k", "$20k+"]),
-    "special_needs": lambda: _rand_choice([True, False]),
-    "languages_spoken": lambda: _rand_choice(["English", "Spanish", "French", "Mandarin", "Bilingual"]),
-    "previous_school_type": lambda: _rand_choice(["Public", "Private", "Charter", "Homeschool", "International"]),
-    "program_name": lambda: _rand_choice(["Elementary Program", "Middle School", "High School", "IB Program", "AP Program"]),
-    "program_type": lambda: _rand_choice(["Traditional", "Montessori", "Waldorf", "IB", "STEM", "Arts"]),
-    "grade_levels_served": lambda: _rand_choice(["K-5", "6-8", "9-12", "K-12", "Pre-K-12"]),
-    "curriculum_type": lambda: _rand_choice(["Common Core", "IB", "AP", "Montessori", "Custom"]),
-    "language_instruction": lambda: _rand_choice(["English", "Spanish", "French", "Bilingual", "Immersion"]),
-    "tuition_annual": lambda: _rand_float(5000, 50000, 2),
-    "application_fee": lambda: _rand_float(50, 500, 2),
-    "program_capacity": lambda: _rand_numeric(20, 500),
-    "current_enrollment": lambda: _rand_numeric(15, 450),
-    "waiting_list_count": lambda: _rand_numeric(0, 50),
-    "accreditation_status": lambda: _rand_choice(["Accredited", "Pending", "Not Accredited"]),
-    "facilities_included": lambda: _rand_choice(["Library", "Lab", "Gym", "Cafeteria", "Pool", "Theater"]),
-    "extracurricular_options": lambda: _rand_choice(["Sports", "Arts", "Music", "Drama", "Robotics", "Debate"]),
-    "occupation": lambda: _rand_choice(["Engineer", "Doctor", "Teacher", "Lawyer", "Business", "Other"]),
-    "employer": lambda: _fake_or("Company Name", "company"),
-    "income_range": lambda: _rand_choice(["$0-50k", "$50-100k", "$100-150k", "$150-200k", "$200k+"]),
-    "education_level": lambda: _rand_choice(["High School", "Bachelor's", "Master's", "PhD", "Professional"]),
-    "marital_status": lambda: _rand_choice(["Single", "Married", "Divorced", "Widowed"]),
-    "number_of_children": lambda: _rand_numeric(1, 5),
-    "preferred_communication": lambda: _rand_choice(["Email", "Phone", "Text", "Mail"]),
-    "emergency_contact_name": lambda: _fake_or("Emergency Contact", "name"),
-    "emergency_contact_phone": lambda: _fake_or("+1234567890", "phone_number"),
-    "application_status": lambda: _rand_choice(["Submitted", "Under Review", "Accepted", "Rejected", "Waitlisted"]),
-    "admission_test_score": lambda: _rand_numeric(200, 800),
-    "interview_score": lambda: _rand_numeric(1, 10),
-    "recommendation_score": lambda: _rand_numeric(1, 10),
-    "financial_aid_requested": lambda: _rand_choice([True, False]),
-    "financial_aid_approved": lambda: _rand_choice([True, False]),
-    "scholarship_amount": lambda: _rand_float(0, 10000, 2),
-    "deposit_paid": lambda: _rand_choice([True, False]),
-    "tuition_balance": lambda: _rand_float(0, 50000, 2),
-    "payment_plan_selected": lambda: _rand_choice(["Annual", "Semester", "Monthly", "Quarterly"]),
-    "school_name": lambda: _fake_or("Educational Institution", "company"),
-    "school_type": lambda: _rand_choice(["Public", "Private", "Charter", "Magnet", "Religious"]),
-    "district_name": lambda: _fake_or("School District", "city"),
-    "school_level": lambda: _rand_choice(["Elementary", "Middle", "High", "K-12", "PreK-12"]),
-    "total_students": lambda: _rand_numeric(100, 5000),
-    "total_teachers": lambda: _rand_numeric(10, 300),
-    "total_staff": lambda: _rand_numeric(5, 150),
-    "principal_name": lambda: _fake_or("Principal Name", "name"),
-    "principal_email": lambda: _fake_or("principal@school.edu", "email"),
-    "tech_coordinator_name": lambda: _fake_or("Tech Coordinator", "name"),
-    "tech_coordinator_email": lambda: _fake_or("tech@school.edu", "email"),
-    "procurement_contact_name": lambda: _fake_or("Procurement Contact", "name"),
-    "procurement_contact_email": lambda: _fake_or("procurement@school.edu", "email"),
-    "annual_budget_technology": lambda: _rand_float(10000, 500000, 2),
-    "current_lms_platform": lambda: _rand_choice(["Canvas", "Blackboard", "Moodle", "Google Classroom", "Schoology"]),
-    "internet_bandwidth": lambda: _rand_choice(["100Mbps", "500Mbps", "1Gbps", "10Gbps"]),
-    "device_inventory_count": lambda: _rand_numeric(50, 2000),
-    "contract_start_date": lambda: _rand_date(730),
-    "contract_end_date": lambda: _rand_date(365),
-    "sales_rep_assigned": lambda: _fake_or("Sales Rep", "name"),
-    "product_category": lambda: _rand_choice(["LMS", "Assessment", "Content", "Analytics", "Communication"]),
-    "target_age_group": lambda: _rand_choice(["K-5", "6-8", "9-12", "K-12", "Adult"]),
-    "subject_areas": lambda: _rand_choice(["Math", "Science", "ELA", "Social Studies", "All Subjects"]),
-    "license_type": lambda: _rand_choice(["Site", "Concurrent", "Named User", "Floating"]),
-    "pricing_model": lambda: _rand_choice(["Per Student", "Per Teacher", "Site License", "Concurrent Users"]),
-    "price_per_license": lambda: _rand_float(5, 100, 2),
-    "minimum_licenses": lambda: _rand_numeric(10, 100),
-    "maximum_licenses": lambda: _rand_numeric(1000, 10000),
-    "integration_capabilities": lambda: _rand_choice(["SIS", "LMS", "Google", "Microsoft", "All"]),
-    "training_included": lambda: _rand_choice([True, False]),
-    "support_level": lambda: _rand_choice(["Basic", "Standard", "Premium", "Enterprise"]),
-    "trial_period_days": lambda: _rand_numeric(7, 90),
-    "implementation_time": lambda: _rand_choice(["1 week", "2 weeks", "1 month", "3 months"]),
-    "certification_offered": lambda: _rand_choice([True, False]),
-    "license_id": lambda: _rand_numeric(1000000, 9999999),
-    "user_type": lambda: _rand_choice(["Student", "Teacher", "Administrator", "Parent"]),
-    "session_duration_minutes": lambda: _rand_numeric(5, 240),
-    "features_accessed": lambda: _rand_choice(["Assignments", "Gradebook", "Communication", "Reports", "Analytics"]),
-    "activities_completed": lambda: _rand_numeric(0, 50),
-    "assessments_taken": lambda: _rand_numeric(0, 20),
-    "content_created": lambda: _rand_numeric(0, 100),
-    "content_shared": lambda: _rand_numeric(0, 50),
-    "login_method": lambda: _rand_choice(["SSO", "Direct", "Google", "Microsoft"]),
-    "device_type": lambda: _rand_choice(["Desktop", "Tablet", "Mobile", "Chromebook"]),
-    "browser_type": lambda: _rand_choice(["Chrome", "Safari", "Firefox", "Edge"]),
-    "location_accessed": lambda: _rand_choice(["School", "Home", "Library", "Other"]),
-    "peak_concurrent_users": lambda: _rand_numeric(1, 500),
-    "data_exported": lambda: _rand_choice([True, False]),
-    "support_tickets_created": lambda: _rand_numeric(0, 10),
-    "opportunity_stage": lambda: _rand_choice(["Lead", "Qualified", "Demo", "Trial", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]),
-    "probability_percentage": lambda: _rand_numeric(0, 100),
-    "deal_value": lambda: _rand_float(1000, 100000, 2),
-    "license_quantity": lambda: _rand_numeric(10, 1000),
-    "contract_length_months": lambda: _rand_choice([12, 24, 36]),
-    "decision_maker_name": lambda: _fake_or("Decision Maker", "name"),
-    "decision_maker_role": lambda: _rand_choice(["Principal", "Superintendent", "Tech Director", "Curriculum Director"]),
-    "demo_date": lambda: _rand_date(30),
-    "trial_start_date": lambda: _rand_date(60),
-    "trial_end_date": lambda: _rand_date(30),
-    "proposal_sent_date": lambda: _rand_date(45),
-    "negotiation_start_date": lambda: _rand_date(30),
-    "close_date": lambda: _rand_date(90),
-    "won_lost_reason": lambda: _rand_choice(["Price", "Features", "Timeline", "Budget", "Competitor"]),
-    "competitor_involved": lambda: _rand_choice(["Google", "Microsoft", "Canvas", "Blackboard", "Other"]),
-    "sales_rep_id": lambda: _rand_numeric(1000, 9999),
-    "sales_cycle_days": lambda: _rand_numeric(30, 365),
-    "ethnicity": lambda: _rand_choice(["Caucasian", "Hispanic", "African American", "Asian", "Native American", "Other"]),
-    "citizenship_status": lambda: _rand_choice(["Citizen", "Permanent Resident", "International", "Other"]),
-    "student_status": lambda: _rand_choice(["Active", "Inactive", "Graduated", "Withdrawn", "Transfer"]),
-    "enrollment_type": lambda: _rand_choice(["Full-time", "Part-time", "Audit", "Non-degree"]),
-    "academic_level": lambda: _rand_choice(["Freshman", "Sophomore", "Junior", "Senior", "Graduate"]),
-    "major_primary": lambda: _rand_choice(["Business", "Engineering", "Education", "Arts", "Science", "Medicine"]),
-    "major_secondary": lambda: _rand_choice(["Business", "Engineering", "Education", "Arts", "Science", "None"]),
-    "minor_field": lambda: _rand_choice(["Psychology", "Mathematics", "History", "English", "Computer Science", "None"]),
-    "advisor_faculty_id": lambda: _rand_numeric(10000, 99999),
-    "cumulative_gpa": lambda: _rand_float(0.0, 4.0, 2),
-    "credit_hours_completed": lambda: _rand_numeric(0, 180),
-    "credit_hours_attempted": lambda: _rand_numeric(0, 200),
-    "financial_aid_status": lambda: _rand_choice(["Eligible", "Not Eligible", "Pending", "Denied"]),
-    "work_study_eligible": lambda: _rand_choice([True, False]),
-    "housing_status": lambda: _rand_choice(["On-campus", "Off-campus", "Commuter", "Family Housing"]),
-    "meal_plan_type": lambda: _rand_choice(["Full", "Partial", "Commuter", "None"]),
-    "course_code": lambda: f"{_rand_choice(['MATH', 'ENG', 'SCI', 'HIST', 'ART'])}{_rand_numeric(100, 499)}",
-    "course_title": lambda: _rand_choice(["Introduction to", "Advanced", "Principles of", "Applied", "Contemporary"]) + " " + _rand_choice(["Mathematics", "Science", "Literature", "History", "Art"]),
-    "course_description": lambda: _fake_or("Course description content", "paragraph"),
-    "school_college": lambda: _rand_choice(["Arts & Sciences", "Engineering", "Business", "Education", "Medicine"]),
-    "credit_hours": lambda: _rand_choice([1, 2, 3, 4, 6]),
-    "course_level": lambda: _rand_choice(["Undergraduate", "Graduate", "Doctoral"]),
-    "prerequisites": lambda: _rand_choice(["None", "MATH101", "ENG101", "SCI101", "Multiple"]),
-    "corequisites": lambda: _rand_choice(["None", "Lab Component", "Discussion Section"]),
-    "course_format": lambda: _rand_choice(["Lecture", "Lab", "Seminar", "Independent Study", "Hybrid"]),
-    "instruction_method": lambda: _rand_choice(["In-person", "Online", "Hybrid", "Synchronous", "Asynchronous"]),
-    "max_enrollment": lambda: _rand_numeric(15, 300),
-    "lab_required": lambda: _rand_choice([True, False]),
-    "field_work_required": lambda: _rand_choice([True, False]),
-    "internship_component": lambda: _rand_choice([True, False]),
-    "certification_prep": lambda: _rand_choice([True, False]),
-    "transferable_credits": lambda: _rand_choice([True, False]),
-    "repeatable": lambda: _rand_choice([True, False]),
-    "pass_fail_option": lambda: _rand_choice([True, False]),
-    "honors_section": lambda: _rand_choice([True, False]),
-    "writing_intensive": lambda: _rand_choice([True, False]),
-    "title_rank": lambda: _rand_choice(["Instructor", "Assistant Professor", "Associate Professor", "Professor", "Adjunct"]),
-    "employment_status": lambda: _rand_choice(["Full-time", "Part-time", "Adjunct", "Visiting", "Emeritus"]),
-    "tenure_status": lambda: _rand_choice(["Tenured", "Tenure-track", "Non-tenure", "Clinical"]),
-    "highest_degree": lambda: _rand_choice(["PhD", "Master's", "Professional", "Bachelor's"]),
-    "specialization_area": lambda: _rand_choice(["Research", "Teaching", "Clinical", "Applied", "Theoretical"]),
-    "research_interests": lambda: _fake_or("Research focus area", "catch_phrase"),
-    "office_hours": lambda: _rand_choice(["MWF 2-4pm", "TTh 1-3pm", "By Appointment", "Online Only"]),
-    "teaching_load": lambda: _rand_numeric(2, 8),
-    "administrative_roles": lambda: _rand_choice(["Department Chair", "Committee Member", "Advisor", "Coordinator", "None"]),
-    "committee_memberships": lambda: _rand_numeric(0, 5),
-    "publication_count": lambda: _rand_numeric(0, 100),
-    "grant_funding_total": lambda: _rand_float(0, 500000, 2),
-    "sabbatical_eligible": lambda: _rand_choice([True, False]),
-    "semester_id": lambda: _rand_numeric(1000, 9999),
-    "academic_year": lambda: _rand_choice(["2023-24", "2024-25", "2025-26"]),
-    "term_name": lambda: _rand_choice(["Fall", "Spring", "Summer", "Winter"]),
-    "term_code": lambda: _rand_choice(["F24", "S25", "U25", "W25"]),
-    "registration_start_date": lambda: _rand_date(120),
-    "registration_end_date": lambda: _rand_date(90),
-    "add_drop_deadline": lambda: _rand_date(75),
-    "withdrawal_deadline": lambda: _rand_date(45),
-    "final_exam_start": lambda: _rand_date(20),
-    "final_exam_end": lambda: _rand_date(15),
-    "graduation_date": lambda: _rand_date(30),
-    "term_status": lambda: _rand_choice(["Active", "Completed", "Future", "Cancelled"]),
-    "credit_hour_limit": lambda: _rand_numeric(18, 24),
-    "part_time_threshold": lambda: _rand_numeric(6, 11),
-    "full_time_threshold": lambda: _rand_numeric(12, 15),
-    "section_number": lambda: _rand_numeric(1, 20),
-    "grade_letter": lambda: _rand_choice(["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F", "W", "I"]),
-    "grade_points": lambda: _rand_float(0.0, 4.0, 2),
-    "grade_status": lambda: _rand_choice(["Final", "Temporary", "Incomplete", "Withdrawn"]),
-    "attempt_number": lambda: _rand_numeric(1, 3),
-    "withdrawal_date": lambda: _rand_date(60) if _rand_choice([True, False, False]) else None,
-    "incomplete_date": lambda: _rand_date(30) if _rand_choice([True, False, False, False]) else None,
-    "grade_change_date": lambda: _rand_date(30) if _rand_choice([True, False, False, False]) else None,
-    "grade_change_reason": lambda: _rand_choice(["Calculation Error", "Late Submission", "Grade Appeal", "Administrative"]),
-    "midterm_grade": lambda: _rand_choice(["A", "B", "C", "D", "F", "S", "U"]),
-    "final_exam_score": lambda: _rand_numeric(0, 100),
-    "final_project_score": lambda: _rand_numeric(0, 100),
-    "participation_score": lambda: _rand_numeric(0, 100),
-    "attendance_percentage": lambda: _rand_float(0, 100, 1),
-    "enrollment_status": lambda: _rand_choice(["Enrolled", "Withdrawn", "Completed", "In Progress"]),
-    "enrollment_method": lambda: _rand_choice(["Online", "In-person", "Phone", "Advisor", "Auto-registration"]),
-    "waitlist_position": lambda: _rand_numeric(1, 50) if _rand_choice([True, False, False]) else None,
-    "registration_priority": lambda: _rand_numeric(1, 9),
-    "fees_amount": lambda: _rand_float(100, 2000, 2),
-    "financial_aid_applied": lambda: _rand_float(0, 10000, 2),
-    "add_drop_count": lambda: _rand_numeric(0, 5),
-    "last_attendance_date": lambda: _rand_date(30),
-    "financial_record_id": lambda: _rand_numeric(1000000, 9999999),
-    "transaction_category": lambda: _rand_choice(["Tuition", "Fees", "Housing", "Meals", "Books", "Miscellaneous"]),
-    "room_board_amount": lambda: _rand_float(2000, 15000, 2),
-    "work_study_amount": lambda: _rand_float(0, 3000, 2),
-    "payment_plan_id": lambda: _rand_numeric(1000, 9999),
-    "balance_forward": lambda: _rand_float(0, 5000, 2),
-    "current_balance": lambda: _rand_float(0, 10000, 2),
-    "performance_id": lambda: _rand_numeric(1000000, 9999999),
-    "gpa_semester": lambda: _rand_float(0.0, 4.0, 2),
-    "gpa_cumulative": lambda: _rand_float(0.0, 4.0, 2),
-    "credit_hours_passed": lambda: _rand_numeric(0, 18),
-    "courses_withdrawn": lambda: _rand_numeric(0, 3),
-    "courses_incomplete": lambda: _rand_numeric(0, 2),
-    "academic_standing": lambda: _rand_choice(["Good Standing", "Academic Probation", "Academic Suspension", "Dean's List"]),
-    "probation_status": lambda: _rand_choice(["None", "Academic", "Financial", "Disciplinary"]),
-    "honors_achievement": lambda: _rand_choice(["None", "Dean's List", "President's List", "Magna Cum Laude", "Summa Cum Laude"]),
-    "dean_list_status": lambda: _rand_choice([True, False]),
-    "graduation_progress_percentage": lambda: _rand_float(0, 100, 1),
-    "major_change_count": lambda: _rand_numeric(0, 3),
-    "advisor_meetings_count": lambda: _rand_numeric(0, 10),
-    "retention_id": lambda: _rand_numeric(1000000, 9999999),
-    "cohort_year": lambda: _rand_choice([2020, 2021, 2022, 2023, 2024]),
-    "retention_risk_score": lambda: _rand_float(0, 100, 1),
-    "attendance_rate": lambda: _rand_float(0, 100, 1),
-    "course_completion_rate": lambda: _rand_float(0, 100, 1),
-    "support_services_used": lambda: _rand_choice(["Tutoring", "Counseling", "Career Services", "Financial Aid", "Multiple", "None"]),
-    "housing_changes": lambda: _rand_numeric(0, 3),
-    "major_changes": lambda: _rand_numeric(0, 2),
-    "advisor_changes": lambda: _rand_numeric(0, 2),
-    "academic_interventions": lambda: _rand_choice(["None", "Early Alert", "Academic Coaching", "Tutoring", "Counseling"]),
-    "social_engagement_score": lambda: _rand_float(0, 100, 1),
-    "early_alert_flags": lambda: _rand_numeric(0, 5),
-    "graduation_likelihood": lambda: _rand_float(0, 100, 1),
+    "lead_id": _numeric_field(100000, 999999),
+    "student_id": _numeric_field(100000, 999999),
+    "parent_id": _numeric_field(100000, 999999),
+    "faculty_id": _numeric_field(10000, 99999),
+    "course_id": _numeric_field(1000, 9999),
+    "account_id": _numeric_field(10000, 99999),
+    "program_id": _numeric_field(1000, 9999),
+    "enrollment_id": _numeric_field(1000000, 9999999),
+    "grade_id": _numeric_field(1000000, 9999999),
+    "parent_first_name": _faker_field("Parent Name", "first_name"),
+    "parent_last_name": _faker_field("Parent Surname", "last_name"),
+    "parent_email": _faker_field("parent@email.com", "email"),
+    "parent_phone": _faker_field("+1234567890", "phone_number"),
+    "student_first_name": _faker_field("Student Name", "first_name"),
+    "student_last_name": _faker_field("Student Surname", "last_name"),
+    "student_birth_date": _date_field(6570),  # Niños de ~18 años atrás
+    "grade_level": _choice_field(["Pre-K", "K", "1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th", "9th", "10th", "11th", "12th"]),
+    "school_interest": _choice_field(["Public", "Private", "Charter", "Magnet", "Homeschool"]),
+    "lead_source": _choice_field(["Website", "Referral", "Social Media", "Advertisement", "Event", "Cold Call"]),
+    "lead_status": _choice_field(["New", "Contacted", "Qualified", "Proposal", "Enrolled", "Lost"]),
+    "inquiry_date": _date_field(365),
+    "follow_up_date": _date_field(30),
+    "assigned_counselor": _faker_field("Counselor Name", "name"),
+    "location_preference": _choice_field(["Main Campus", "North Campus", "South Campus", "Online", "Hybrid"]),
+    "budget_range": _choice_field(["$0-5k", "$5-10k", "$10-15k", "$15-20k", "$20k+"]),
+    "special_needs": _choice_field([True, False]),
+    "languages_spoken": _choice_field(["English", "Spanish", "French", "Mandarin", "Bilingual"]),
+    "previous_school_type": _choice_field(["Public", "Private", "Charter", "Homeschool", "International"]),
+    "program_name": _choice_field(["Elementary Program", "Middle School", "High School", "IB Program", "AP Program"]),
+    "program_type": _choice_field(["Traditional", "Montessori", "Waldorf", "IB", "STEM", "Arts"]),
+    "grade_levels_served": _choice_field(["K-5", "6-8", "9-12", "K-12", "Pre-K-12"]),
+    "curriculum_type": _choice_field(["Common Core", "IB", "AP", "Montessori", "Custom"]),
+    "language_instruction": _choice_field(["English", "Spanish", "French", "Bilingual", "Immersion"]),
+    "tuition_annual": _float_field(5000, 50000, 2),
+    "application_fee": _float_field(50, 500, 2),
+    "program_capacity": _numeric_field(20, 500),
+    "current_enrollment": _numeric_field(15, 450),
+    "waiting_list_count": _numeric_field(0, 50),
+    "accreditation_status": _choice_field(["Accredited", "Pending", "Not Accredited"]),
+    "facilities_included": _choice_field(["Library", "Lab", "Gym", "Cafeteria", "Pool", "Theater"]),
+    "extracurricular_options": _choice_field(["Sports", "Arts", "Music", "Drama", "Robotics", "Debate"]),
+    "occupation": _choice_field(["Engineer", "Doctor", "Teacher", "Lawyer", "Business", "Other"]),
+    "employer": _faker_field("Company Name", "company"),
+    "income_range": _choice_field(["$0-50k", "$50-100k", "$100-150k", "$150-200k", "$200k+"]),
+    "education_level": _choice_field(["High School", "Bachelor's", "Master's", "PhD", "Professional"]),
+    "marital_status": _choice_field(["Single", "Married", "Divorced", "Widowed"]),
+    "number_of_children": _numeric_field(1, 5),
+    "preferred_communication": _choice_field(["Email", "Phone", "Text", "Mail"]),
+    "emergency_contact_name": _faker_field("Emergency Contact", "name"),
+    "emergency_contact_phone": _faker_field("+1234567890", "phone_number"),
+    "application_status": _choice_field(["Submitted", "Under Review", "Accepted", "Rejected", "Waitlisted"]),
+    "admission_test_score": _numeric_field(200, 800),
+    "interview_score": _numeric_field(1, 10),
+    "recommendation_score": _numeric_field(1, 10),
+    "financial_aid_requested": _choice_field([True, False]),
+    "financial_aid_approved": _choice_field([True, False]),
+    "scholarship_amount": _float_field(0, 10000, 2),
+    "deposit_paid": _choice_field([True, False]),
+    "tuition_balance": _float_field(0, 50000, 2),
+    "payment_plan_selected": _choice_field(["Annual", "Semester", "Monthly", "Quarterly"]),
+    "school_name": _faker_field("Educational Institution", "company"),
+    "school_type": _choice_field(["Public", "Private", "Charter", "Magnet", "Religious"]),
+    "district_name": _faker_field("School District", "city"),
+    "school_level": _choice_field(["Elementary", "Middle", "High", "K-12", "PreK-12"]),
+    "total_students": _numeric_field(100, 5000),
+    "total_teachers": _numeric_field(10, 300),
+    "total_staff": _numeric_field(5, 150),
+    "principal_name": _faker_field("Principal Name", "name"),
+    "principal_email": _faker_field("principal@school.edu", "email"),
+    "tech_coordinator_name": _faker_field("Tech Coordinator", "name"),
+    "tech_coordinator_email": _faker_field("tech@school.edu", "email"),
+    "procurement_contact_name": _faker_field("Procurement Contact", "name"),
+    "procurement_contact_email": _faker_field("procurement@school.edu", "email"),
+    "annual_budget_technology": _float_field(10000, 500000, 2),
+    "current_lms_platform": _choice_field(["Canvas", "Blackboard", "Moodle", "Google Classroom", "Schoology"]),
+    "internet_bandwidth": _choice_field(["100Mbps", "500Mbps", "1Gbps", "10Gbps"]),
+    "device_inventory_count": _numeric_field(50, 2000),
+    "contract_start_date": _date_field(730),
+    "contract_end_date": _date_field(365),
+    "sales_rep_assigned": _faker_field("Sales Rep", "name"),
+    "product_category": _choice_field(["LMS", "Assessment", "Content", "Analytics", "Communication"]),
+    "target_age_group": _choice_field(["K-5", "6-8", "9-12", "K-12", "Adult"]),
+    "subject_areas": _choice_field(["Math", "Science", "ELA", "Social Studies", "All Subjects"]),
+    "license_type": _choice_field(["Site", "Concurrent", "Named User", "Floating"]),
+    "pricing_model": _choice_field(["Per Student", "Per Teacher", "Site License", "Concurrent Users"]),
+    "price_per_license": _float_field(5, 100, 2),
+    "minimum_licenses": _numeric_field(10, 100),
+    "maximum_licenses": _numeric_field(1000, 10000),
+    "integration_capabilities": _choice_field(["SIS", "LMS", "Google", "Microsoft", "All"]),
+    "training_included": _choice_field([True, False]),
+    "support_level": _choice_field(["Basic", "Standard", "Premium", "Enterprise"]),
+    "trial_period_days": _numeric_field(7, 90),
+    "implementation_time": _choice_field(["1 week", "2 weeks", "1 month", "3 months"]),
+    "certification_offered": _choice_field([True, False]),
+    "license_id": _numeric_field(1000000, 9999999),
+    "user_type": _choice_field(["Student", "Teacher", "Administrator", "Parent"]),
+    "session_duration_minutes": _numeric_field(5, 240),
+    "features_accessed": _choice_field(["Assignments", "Gradebook", "Communication", "Reports", "Analytics"]),
+    "activities_completed": _numeric_field(0, 50),
+    "assessments_taken": _numeric_field(0, 20),
+    "content_created": _numeric_field(0, 100),
+    "content_shared": _numeric_field(0, 50),
+    "login_method": _choice_field(["SSO", "Direct", "Google", "Microsoft"]),
+    "device_type": _choice_field(["Desktop", "Tablet", "Mobile", "Chromebook"]),
+    "browser_type": _choice_field(["Chrome", "Safari", "Firefox", "Edge"]),
+    "location_accessed": _choice_field(["School", "Home", "Library", "Other"]),
+    "peak_concurrent_users": _numeric_field(1, 500),
+    "data_exported": _choice_field([True, False]),
+    "support_tickets_created": _numeric_field(0, 10),
+    "opportunity_stage": _choice_field(["Lead", "Qualified", "Demo", "Trial", "Proposal", "Negotiation", "Closed Won", "Closed Lost"]),
+    "probability_percentage": _numeric_field(0, 100),
+    "deal_value": _float_field(1000, 100000, 2),
+    "license_quantity": _numeric_field(10, 1000),
+    "contract_length_months": _choice_field([12, 24, 36]),
+    "decision_maker_name": _faker_field("Decision Maker", "name"),
+    "decision_maker_role": _choice_field(["Principal", "Superintendent", "Tech Director", "Curriculum Director"]),
+    "demo_date": _date_field(30),
+    "trial_start_date": _date_field(60),
+    "trial_end_date": _date_field(30),
+    "proposal_sent_date": _date_field(45),
+    "negotiation_start_date": _date_field(30),
+    "close_date": _date_field(90),
+    "won_lost_reason": _choice_field(["Price", "Features", "Timeline", "Budget", "Competitor"]),
+    "competitor_involved": _choice_field(["Google", "Microsoft", "Canvas", "Blackboard", "Other"]),
+    "sales_rep_id": _numeric_field(1000, 9999),
+    "sales_cycle_days": _numeric_field(30, 365),
+    "ethnicity": _choice_field(["Caucasian", "Hispanic", "African American", "Asian", "Native American", "Other"]),
+    "citizenship_status": _choice_field(["Citizen", "Permanent Resident", "International", "Other"]),
+    "student_status": _choice_field(["Active", "Inactive", "Graduated", "Withdrawn", "Transfer"]),
+    "enrollment_type": _choice_field(["Full-time", "Part-time", "Audit", "Non-degree"]),
+    "academic_level": _choice_field(["Freshman", "Sophomore", "Junior", "Senior", "Graduate"]),
+    "major_primary": _choice_field(["Business", "Engineering", "Education", "Arts", "Science", "Medicine"]),
+    "major_secondary": _choice_field(["Business", "Engineering", "Education", "Arts", "Science", "None"]),
+    "minor_field": _choice_field(["Psychology", "Mathematics", "History", "English", "Computer Science", "None"]),
+    "advisor_faculty_id": _numeric_field(10000, 99999),
+    "cumulative_gpa": _float_field(0.0, 4.0, 2),
+    "credit_hours_completed": _numeric_field(0, 180),
+    "credit_hours_attempted": _numeric_field(0, 200),
+    "financial_aid_status": _choice_field(["Eligible", "Not Eligible", "Pending", "Denied"]),
+    "work_study_eligible": _choice_field([True, False]),
+    "housing_status": _choice_field(["On-campus", "Off-campus", "Commuter", "Family Housing"]),
+    "meal_plan_type": _choice_field(["Full", "Partial", "Commuter", "None"]),
+    "course_code": lambda: f"{_rand_choice(_COURSE_CODE_SUBJECTS)}{_rand_numeric(100, 499)}",
+    "course_title": lambda: f"{_rand_choice(_COURSE_TITLE_PREFIXES)} {_rand_choice(_COURSE_TITLE_SUBJECTS)}",
+    "course_description": _faker_field("Course description content", "paragraph"),
+    "school_college": _choice_field(["Arts & Sciences", "Engineering", "Business", "Education", "Medicine"]),
+    "credit_hours": _choice_field([1, 2, 3, 4, 6]),
+    "course_level": _choice_field(["Undergraduate", "Graduate", "Doctoral"]),
+    "prerequisites": _choice_field(["None", "MATH101", "ENG101", "SCI101", "Multiple"]),
+    "corequisites": _choice_field(["None", "Lab Component", "Discussion Section"]),
+    "course_format": _choice_field(["Lecture", "Lab", "Seminar", "Independent Study", "Hybrid"]),
+    "instruction_method": _choice_field(["In-person", "Online", "Hybrid", "Synchronous", "Asynchronous"]),
+    "max_enrollment": _numeric_field(15, 300),
+    "lab_required": _choice_field([True, False]),
+    "field_work_required": _choice_field([True, False]),
+    "internship_component": _choice_field([True, False]),
+    "certification_prep": _choice_field([True, False]),
+    "transferable_credits": _choice_field([True, False]),
+    "repeatable": _choice_field([True, False]),
+    "pass_fail_option": _choice_field([True, False]),
+    "honors_section": _choice_field([True, False]),
+    "writing_intensive": _choice_field([True, False]),
+    "title_rank": _choice_field(["Instructor", "Assistant Professor", "Associate Professor", "Professor", "Adjunct"]),
+    "employment_status": _choice_field(["Full-time", "Part-time", "Adjunct", "Visiting", "Emeritus"]),
+    "tenure_status": _choice_field(["Tenured", "Tenure-track", "Non-tenure", "Clinical"]),
+    "highest_degree": _choice_field(["PhD", "Master's", "Professional", "Bachelor's"]),
+    "specialization_area": _choice_field(["Research", "Teaching", "Clinical", "Applied", "Theoretical"]),
+    "research_interests": _faker_field("Research focus area", "catch_phrase"),
+    "office_hours": _choice_field(["MWF 2-4pm", "TTh 1-3pm", "By Appointment", "Online Only"]),
+    "teaching_load": _numeric_field(2, 8),
+    "administrative_roles": _choice_field(["Department Chair", "Committee Member", "Advisor", "Coordinator", "None"]),
+    "committee_memberships": _numeric_field(0, 5),
+    "publication_count": _numeric_field(0, 100),
+    "grant_funding_total": _float_field(0, 500000, 2),
+    "sabbatical_eligible": _choice_field([True, False]),
+    "semester_id": _numeric_field(1000, 9999),
+    "academic_year": _choice_field(["2023-24", "2024-25", "2025-26"]),
+    "term_name": _choice_field(["Fall", "Spring", "Summer", "Winter"]),
+    "term_code": _choice_field(["F24", "S25", "U25", "W25"]),
+    "registration_start_date": _date_field(120),
+    "registration_end_date": _date_field(90),
+    "add_drop_deadline": _date_field(75),
+    "withdrawal_deadline": _date_field(45),
+    "final_exam_start": _date_field(20),
+    "final_exam_end": _date_field(15),
+    "graduation_date": _date_field(30),
+    "term_status": _choice_field(["Active", "Completed", "Future", "Cancelled"]),
+    "credit_hour_limit": _numeric_field(18, 24),
+    "part_time_threshold": _numeric_field(6, 11),
+    "full_time_threshold": _numeric_field(12, 15),
+    "section_number": _numeric_field(1, 20),
+    "grade_letter": _choice_field(["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D", "F", "W", "I"]),
+    "grade_points": _float_field(0.0, 4.0, 2),
+    "grade_status": _choice_field(["Final", "Temporary", "Incomplete", "Withdrawn"]),
+    "attempt_number": _numeric_field(1, 3),
+    "withdrawal_date": _optional_field(_date_field(60), 1, 3),
+    "incomplete_date": _optional_field(_date_field(30), 1, 4),
+    "grade_change_date": _optional_field(_date_field(30), 1, 4),
+    "grade_change_reason": _choice_field(["Calculation Error", "Late Submission", "Grade Appeal", "Administrative"]),
+    "midterm_grade": _choice_field(["A", "B", "C", "D", "F", "S", "U"]),
+    "final_exam_score": _numeric_field(0, 100),
+    "final_project_score": _numeric_field(0, 100),
+    "participation_score": _numeric_field(0, 100),
+    "attendance_percentage": _float_field(0, 100, 1),
+    "enrollment_status": _choice_field(["Enrolled", "Withdrawn", "Completed", "In Progress"]),
+    "enrollment_method": _choice_field(["Online", "In-person", "Phone", "Advisor", "Auto-registration"]),
+    "waitlist_position": _optional_field(_numeric_field(1, 50), 1, 3),
+    "registration_priority": _numeric_field(1, 9),
+    "fees_amount": _float_field(100, 2000, 2),
+    "financial_aid_applied": _float_field(0, 10000, 2),
+    "add_drop_count": _numeric_field(0, 5),
+    "last_attendance_date": _date_field(30),
+    "financial_record_id": _numeric_field(1000000, 9999999),
+    "transaction_category": _choice_field(["Tuition", "Fees", "Housing", "Meals", "Books", "Miscellaneous"]),
+    "room_board_amount": _float_field(2000, 15000, 2),
+    "work_study_amount": _float_field(0, 3000, 2),
+    "payment_plan_id": _numeric_field(1000, 9999),
+    "balance_forward": _float_field(0, 5000, 2),
+    "current_balance": _float_field(0, 10000, 2),
+    "performance_id": _numeric_field(1000000, 9999999),
+    "gpa_semester": _float_field(0.0, 4.0, 2),
+    "gpa_cumulative": _float_field(0.0, 4.0, 2),
+    "credit_hours_passed": _numeric_field(0, 18),
+    "courses_withdrawn": _numeric_field(0, 3),
+    "courses_incomplete": _numeric_field(0, 2),
+    "academic_standing": _choice_field(["Good Standing", "Academic Probation", "Academic Suspension", "Dean's List"]),
+    "probation_status": _choice_field(["None", "Academic", "Financial", "Disciplinary"]),
+    "honors_achievement": _choice_field(["None", "Dean's List", "President's List", "Magna Cum Laude", "Summa Cum Laude"]),
+    "dean_list_status": _choice_field([True, False]),
+    "graduation_progress_percentage": _float_field(0, 100, 1),
+    "major_change_count": _numeric_field(0, 3),
+    "advisor_meetings_count": _numeric_field(0, 10),
+    "retention_id": _numeric_field(1000000, 9999999),
+    "cohort_year": _choice_field([2020, 2021, 2022, 2023, 2024]),
+    "retention_risk_score": _float_field(0, 100, 1),
+    "attendance_rate": _float_field(0, 100, 1),
+    "course_completion_rate": _float_field(0, 100, 1),
+    "support_services_used": _choice_field(["Tutoring", "Counseling", "Career Services", "Financial Aid", "Multiple", "None"]),
+    "housing_changes": _numeric_field(0, 3),
+    "major_changes": _numeric_field(0, 2),
+    "advisor_changes": _numeric_field(0, 2),
+    "academic_interventions": _choice_field(["None", "Early Alert", "Academic Coaching", "Tutoring", "Counseling"]),
+    "social_engagement_score": _float_field(0, 100, 1),
+    "early_alert_flags": _numeric_field(0, 5),
+    "graduation_likelihood": _float_field(0, 100, 1),
     
     # Finance - Campos específicos ya cubiertos
-    "risk_factors": lambda: _rand_choice(["LOW", "MED", "HIGH"]),
-    "specialty": lambda: _rand_choice(["CARDIO", "DERMA", "GEN", "PED"]),
-    "department": lambda: _rand_choice(["HR","FIN","OPS","IT"]),
-    "chronic_conditions": lambda: _rand_choice(["NONE","DM2","HTA","ASTHMA"]),
+    "risk_factors": _choice_field(["LOW", "MED", "HIGH"]),
+    "specialty": _choice_field(["CARDIO", "DERMA", "GEN", "PED"]),
+    "department": _choice_field(["HR","FIN","OPS","IT"]),
+    "chronic_conditions": _choice_field(["NONE","DM2","HTA","ASTHMA"]),
     
     # Healthcare - Campos específicos ya cubiertos
-    "procedure_category": lambda: _rand_choice(["LAB","IMG","CONSULT","SURG"]),
-    "encounter_type": lambda: _rand_choice(["INPATIENT","OUTPATIENT","ER"]),
-    "gender": lambda: _rand_choice(["M","F"]),
-    "phase": lambda: _rand_choice(["I","II","III","IV"]),
-    "arm": lambda: _rand_choice(["A","B","C"]),
-    "channel_type": lambda: _rand_choice(["VIDEO","PHONE","CHAT"]),
-    "severity_level": lambda: _rand_choice(["LOW","MED","HIGH"]),
-    "chronic_flag": lambda: _rand_choice(["Y","N"]),
-    "abnormal_flag": lambda: _rand_choice(["Y","N"]),
-    "related_to_study": lambda: _rand_choice(["Y","N"]),
-    "completion_status": lambda: _rand_choice(["DONE","CANCEL","NO_SHOW"]),
-    "payment_status": lambda: _rand_choice(["PAID","PENDING","LATE"]),
-    "claim_status": lambda: _rand_choice(["OPEN","CLOSED","IN_REVIEW"]),
+    "procedure_category": _choice_field(["LAB","IMG","CONSULT","SURG"]),
+    "encounter_type": _choice_field(["INPATIENT","OUTPATIENT","ER"]),
+    "gender": _choice_field(["M","F"]),
+    "phase": _choice_field(["I","II","III","IV"]),
+    "arm": _choice_field(["A","B","C"]),
+    "channel_type": _choice_field(["VIDEO","PHONE","CHAT"]),
+    "severity_level": _choice_field(["LOW","MED","HIGH"]),
+    "chronic_flag": _choice_field(["Y","N"]),
+    "abnormal_flag": _choice_field(["Y","N"]),
+    "related_to_study": _choice_field(["Y","N"]),
+    "completion_status": _choice_field(["DONE","CANCEL","NO_SHOW"]),
+    "payment_status": _choice_field(["PAID","PENDING","LATE"]),
+    "claim_status": _choice_field(["OPEN","CLOSED","IN_REVIEW"]),
     
     # Valores numéricos - Ampliados
-    "base_cost": lambda: _rand_float(50, 5000, 2),
-    "duration_min": lambda: _rand_numeric(5, 480),
-    "loan_amount": lambda: _rand_float(1000, 50000, 2),
-    "interest_rate": lambda: _rand_float(0, 0.25, 4),
-    "interest_rate_apr": lambda: _rand_float(0, 0.35, 4),
-    "premium_amount": lambda: _rand_float(10, 1000, 2),
-    "claim_amount": lambda: _rand_float(10, 15000, 2),
-    "paid_amount": lambda: _rand_float(0, 15000, 2),
-    "reserve_amount": lambda: _rand_float(0, 20000, 2),
-    "risk_score": lambda: _rand_float(0, 1, 3),
-    "fraud_score": lambda: _rand_float(0, 1, 3),
-    "credit_score": lambda: _rand_numeric(300, 850),
-    "pd_score": lambda: _rand_float(0, 1, 3),
-    "medication_taken_pct": lambda: _rand_float(0,100,2),
-    "compliance_score": lambda: _rand_float(0,100,2),
-    "dose_mg": lambda: _rand_numeric(1,1000),
-    "duration_days": lambda: _rand_numeric(1,180),
-    "quantity": lambda: _rand_numeric(1,60),
-    "refills": lambda: _rand_numeric(0,5),
-    "rating": lambda: _rand_numeric(1,5),
-    "nps_score": lambda: _rand_numeric(0,10),
+    "base_cost": _float_field(50, 5000, 2),
+    "duration_min": _numeric_field(5, 480),
+    "loan_amount": _float_field(1000, 50000, 2),
+    "interest_rate": _float_field(0, 0.25, 4),
+    "interest_rate_apr": _float_field(0, 0.35, 4),
+    "premium_amount": _float_field(10, 1000, 2),
+    "claim_amount": _float_field(10, 15000, 2),
+    "paid_amount": _float_field(0, 15000, 2),
+    "reserve_amount": _float_field(0, 20000, 2),
+    "risk_score": _float_field(0, 1, 3),
+    "fraud_score": _float_field(0, 1, 3),
+    "credit_score": _numeric_field(300, 850),
+    "pd_score": _float_field(0, 1, 3),
+    "medication_taken_pct": _float_field(0,100,2),
+    "compliance_score": _float_field(0,100,2),
+    "dose_mg": _numeric_field(1,1000),
+    "duration_days": _numeric_field(1,180),
+    "quantity": _numeric_field(1,60),
+    "refills": _numeric_field(0,5),
+    "rating": _numeric_field(1,5),
+    "nps_score": _numeric_field(0,10),
     
     # Fechas (ISO) - Ampliadas
-    "start_date": lambda: _rand_date(900),
-    "end_date": lambda: _rand_date(700),
-    "hire_date": lambda: _rand_date(1500),
-    "termination_date": lambda: _rand_date(365) if _rand_choice([True, False, False]) else None,
-    "admission_date": lambda: _rand_date(400),
-    "discharge_date": lambda: _rand_date(400),
-    "score_date": lambda: _rand_date(180),
-    "assessment_date": lambda: _rand_date(180),
-    "loss_date": lambda: _rand_date(400),
-    "claim_date": lambda: _rand_date(400),
-    "reserve_date": lambda: _rand_date(200),
-    "measurement_date": lambda: _rand_date(180),
-    "randomization_date": lambda: _rand_date(180),
-    "visit_window_start": lambda: _rand_date(90),
-    "visit_window_end": lambda: _rand_date(90),
-    "appointment_date": lambda: _rand_date(60),
-    "due_date": lambda: _rand_date(90),
-    "paid_date": lambda: _rand_date(30),
-    "disbursement_date": lambda: _rand_date(500),
+    "start_date": _date_field(900),
+    "end_date": _date_field(700),
+    "hire_date": _date_field(1500),
+    "termination_date": _optional_field(_date_field(365), 1, 3),
+    "admission_date": _date_field(400),
+    "discharge_date": _date_field(400),
+    "score_date": _date_field(180),
+    "assessment_date": _date_field(180),
+    "loss_date": _date_field(400),
+    "claim_date": _date_field(400),
+    "reserve_date": _date_field(200),
+    "measurement_date": _date_field(180),
+    "randomization_date": _date_field(180),
+    "visit_window_start": _date_field(90),
+    "visit_window_end": _date_field(90),
+    "appointment_date": _date_field(60),
+    "due_date": _date_field(90),
+    "paid_date": _date_field(30),
+    "disbursement_date": _date_field(500),
     
     # Micronegocios Especializados - Panadería
-    "recipe_id": lambda: _rand_numeric(1000, 9999),
-    "product_name": lambda: _rand_choice([
+    "recipe_id": _numeric_field(1000, 9999),
+    "product_name": _choice_field([
         "Pan de Molde", "Croissant", "Baguette", "Pan Integral", "Torta de Chocolate", 
         "Empanadas", "Galletas de Avena", "Muffins de Arándanos", "Pan Dulce", "Facturas",
         "Medialunas", "Pan de Centeno", "Torta Tres Leches", "Cupcakes", "Pan Francés",
         "Rosca de Reyes", "Donas Glaseadas", "Pan de Ajo", "Tartaletas", "Bizcochuelo"
     ]),
-    "ingredients_main": lambda: _rand_choice([
+    "ingredients_main": _choice_field([
         "Harina, Agua, Levadura, Sal", "Huevos, Azúcar, Mantequilla, Harina", 
         "Chocolate, Crema, Vainilla, Azúcar", "Masa Hojaldre, Mantequilla", 
         "Harina Integral, Semillas, Miel", "Queso, Jamón, Masa", "Avena, Miel, Nueces"
     ]),
-    "preparation_time_hours": lambda: _rand_float(0.5, 6.0, 1),
-    "baking_time_minutes": lambda: _rand_numeric(15, 180),
-    "shelf_life_days": lambda: _rand_numeric(1, 14),
-    "storage_requirements": lambda: _rand_choice(["Temperatura ambiente", "Refrigerado", "Congelado", "Lugar seco"]),
-    "allergen_info": lambda: _rand_choice(["Gluten", "Lactosa", "Huevos", "Frutos secos", "Sin alérgenos"]),
-    "weight_grams": lambda: _rand_numeric(50, 2000),
-    "profit_margin_pct": lambda: _rand_float(20, 80, 1),
-    "seasonal_item": lambda: _rand_choice([True, False]),
-    "custom_order_available": lambda: _rand_choice([True, False]),
-    "decoration_level": lambda: _rand_choice(["Básico", "Intermedio", "Avanzado", "Personalizado"]),
-    "difficulty_level": lambda: _rand_choice(["Fácil", "Medio", "Difícil", "Experto"]),
-    "equipment_required": lambda: _rand_choice(["Horno básico", "Batidora", "Moldes especiales", "Equipo decoración", "Horno especializado"]),
-    "ingredient_category": lambda: _rand_choice(["Harinas", "Azúcares", "Grasas", "Lácteos", "Conservantes", "Saborizantes"]),
-    "ingredient_name": lambda: _rand_choice([
+    "preparation_time_hours": _float_field(0.5, 6.0, 1),
+    "baking_time_minutes": _numeric_field(15, 180),
+    "shelf_life_days": _numeric_field(1, 14),
+    "storage_requirements": _choice_field(["Temperatura ambiente", "Refrigerado", "Congelado", "Lugar seco"]),
+    "allergen_info": _choice_field(["Gluten", "Lactosa", "Huevos", "Frutos secos", "Sin alérgenos"]),
+    "weight_grams": _numeric_field(50, 2000),
+    "profit_margin_pct": _float_field(20, 80, 1),
+    "seasonal_item": _choice_field([True, False]),
+    "custom_order_available": _choice_field([True, False]),
+    "decoration_level": _choice_field(["Básico", "Intermedio", "Avanzado", "Personalizado"]),
+    "difficulty_level": _choice_field(["Fácil", "Medio", "Difícil", "Experto"]),
+    "equipment_required": _choice_field(["Horno básico", "Batidora", "Moldes especiales", "Equipo decoración", "Horno especializado"]),
+    "ingredient_category": _choice_field(["Harinas", "Azúcares", "Grasas", "Lácteos", "Conservantes", "Saborizantes"]),
+    "ingredient_name": _choice_field([
         "Harina 000", "Harina Leudante", "Azúcar Blanca", "Mantequilla", "Huevos", 
         "Levadura Fresca", "Sal Fina", "Vainilla", "Chocolate", "Crema de Leche",
         "Queso Crema", "Nueces", "Almendras", "Coco Rallado", "Miel"
     ]),
-    "unit_of_measure": lambda: _rand_choice(["kg", "litros", "unidades", "gramos", "ml"]),
-    "minimum_stock_level": lambda: _rand_numeric(5, 50),
-    "maximum_stock_level": lambda: _rand_numeric(100, 500),
-    "current_stock_quantity": lambda: _rand_numeric(10, 300),
-    "expiration_tracking_required": lambda: _rand_choice([True, False]),
-    "storage_temperature": lambda: _rand_choice(["Ambiente", "2-8°C", "-18°C", "Seco"]),
-    "organic_certified": lambda: _rand_choice([True, False]),
-    "allergen_category": lambda: _rand_choice(["Gluten", "Lactosa", "Huevos", "Frutos secos", "Ninguno"]),
-    "substitution_available": lambda: _rand_choice([True, False]),
-    "seasonal_availability": lambda: _rand_choice([True, False]),
-    "import_domestic": lambda: _rand_choice(["Importado", "Nacional", "Local"]),
-    "quality_grade": lambda: _rand_choice(["Premium", "Estándar", "Económico"]),
-    "batch_number": lambda: f"LOTE{_rand_numeric(1000, 9999)}",
-    "quantity_produced": lambda: _rand_numeric(10, 500),
-    "quantity_sold": lambda: _rand_numeric(5, 450),
-    "quantity_waste": lambda: _rand_numeric(0, 50),
-    "production_start_time": lambda: f"{_rand_numeric(6, 18)}:{_rand_numeric(0, 59):02d}",
-    "production_end_time": lambda: f"{_rand_numeric(7, 22)}:{_rand_numeric(0, 59):02d}",
-    "baker_staff_id": lambda: _rand_numeric(100, 999),
-    "oven_used": lambda: _rand_choice(["Horno 1", "Horno 2", "Horno Industrial", "Horno Especializado"]),
-    "temperature_celsius": lambda: _rand_numeric(150, 250),
-    "humidity_percentage": lambda: _rand_float(40, 80, 1),
-    "quality_score": lambda: _rand_numeric(1, 10),
-    "cost_materials": lambda: _rand_float(5, 100, 2),
-    "cost_labor": lambda: _rand_float(10, 200, 2),
-    "energy_cost": lambda: _rand_float(2, 50, 2),
-    "total_production_cost": lambda: _rand_float(20, 400, 2),
-    "revenue_generated": lambda: _rand_float(30, 800, 2),
-    "profit_loss": lambda: _rand_float(-50, 400, 2),
-    "customer_type": lambda: _rand_choice(["Minorista", "Mayorista", "Institucional", "Individual"]),
-    "sale_time": lambda: f"{_rand_numeric(7, 20)}:{_rand_numeric(0, 59):02d}",
-    "delivery_pickup": lambda: _rand_choice(["Entrega", "Recogida", "En tienda"]),
-    "special_occasion": lambda: _rand_choice(["Cumpleaños", "Boda", "Graduación", "Ninguna", "Corporativo"]),
-    "customer_satisfaction": lambda: _rand_numeric(1, 10),
-    "repeat_customer": lambda: _rand_choice([True, False]),
-    "promotional_sale": lambda: _rand_choice([True, False]),
+    "unit_of_measure": _choice_field(["kg", "litros", "unidades", "gramos", "ml"]),
+    "minimum_stock_level": _numeric_field(5, 50),
+    "maximum_stock_level": _numeric_field(100, 500),
+    "current_stock_quantity": _numeric_field(10, 300),
+    "expiration_tracking_required": _choice_field([True, False]),
+    "storage_temperature": _choice_field(["Ambiente", "2-8°C", "-18°C", "Seco"]),
+    "organic_certified": _choice_field([True, False]),
+    "allergen_category": _choice_field(["Gluten", "Lactosa", "Huevos", "Frutos secos", "Ninguno"]),
+    "substitution_available": _choice_field([True, False]),
+    "seasonal_availability": _choice_field([True, False]),
+    "import_domestic": _choice_field(["Importado", "Nacional", "Local"]),
+    "quality_grade": _choice_field(["Premium", "Estándar", "Económico"]),
+    "batch_number": _prefixed_number_field("LOTE", 1000, 9999),
+    "quantity_produced": _numeric_field(10, 500),
+    "quantity_sold": _numeric_field(5, 450),
+    "quantity_waste": _numeric_field(0, 50),
+    "production_start_time": _time_of_day_field(6, 18),
+    "production_end_time": _time_of_day_field(7, 22),
+    "baker_staff_id": _numeric_field(100, 999),
+    "oven_used": _choice_field(["Horno 1", "Horno 2", "Horno Industrial", "Horno Especializado"]),
+    "temperature_celsius": _numeric_field(150, 250),
+    "humidity_percentage": _float_field(40, 80, 1),
+    "quality_score": _numeric_field(1, 10),
+    "cost_materials": _float_field(5, 100, 2),
+    "cost_labor": _float_field(10, 200, 2),
+    "energy_cost": _float_field(2, 50, 2),
+    "total_production_cost": _float_field(20, 400, 2),
+    "revenue_generated": _float_field(30, 800, 2),
+    "profit_loss": _float_field(-50, 400, 2),
+    "customer_type": _choice_field(["Minorista", "Mayorista", "Institucional", "Individual"]),
+    "sale_time": _time_of_day_field(7, 20),
+    "delivery_pickup": _choice_field(["Entrega", "Recogida", "En tienda"]),
+    "special_occasion": _choice_field(["Cumpleaños", "Boda", "Graduación", "Ninguna", "Corporativo"]),
+    "customer_satisfaction": _numeric_field(1, 10),
+    "repeat_customer": _choice_field([True, False]),
+    "promotional_sale": _choice_field([True, False]),
     
     # Micronegocios Especializados - Ferretería
-    "product_subcategory": lambda: _rand_choice(["Tornillería", "Electricidad", "Plomería", "Jardinería", "Pintura"]),
-    "hardware_product_name": lambda: _rand_choice([
+    "product_subcategory": _choice_field(["Tornillería", "Electricidad", "Plomería", "Jardinería", "Pintura"]),
+    "hardware_product_name": _choice_field([
         "Tornillos Autorroscantes", "Cable Eléctrico", "Tubería PVC", "Martillo", "Destornillador",
         "Pintura Látex", "Cemento Contacto", "Lija", "Candado", "Bisagras",
         "Interruptor", "Llave Inglesa", "Manguera", "Taladro", "Clavos"
     ]),
-    "model_number": lambda: f"MOD-{_rand_numeric(1000, 9999)}",
-    "markup_percentage": lambda: _rand_float(20, 100, 1),
-    "reorder_point": lambda: _rand_numeric(10, 100),
-    "lead_time_days": lambda: _rand_numeric(1, 30),
-    "warranty_months": lambda: _rand_choice([0, 6, 12, 24, 36]),
-    "weight_kg": lambda: _rand_float(0.1, 50.0, 2),
+    "model_number": _prefixed_number_field("MOD-", 1000, 9999),
+    "markup_percentage": _float_field(20, 100, 1),
+    "reorder_point": _numeric_field(10, 100),
+    "lead_time_days": _numeric_field(1, 30),
+    "warranty_months": _choice_field([0, 6, 12, 24, 36]),
+    "weight_kg": _float_field(0.1, 50.0, 2),
     "dimensions_cm": lambda: f"{_rand_numeric(5, 100)}x{_rand_numeric(5, 100)}x{_rand_numeric(5, 100)}",
-    "material_type": lambda: _rand_choice(["Metal", "Plástico", "Madera", "Cerámica", "Compuesto"]),
-    "usage_category": lambda: _rand_choice(["Profesional", "Doméstico", "Industrial", "Especializado"]),
-    "safety_certification": lambda: _rand_choice(["CE", "ISO", "UL", "ANSI", "Ninguna"]),
-    "environmental_rating": lambda: _rand_choice(["A", "B", "C", "D", "No aplica"]),
-    "bulk_discount_available": lambda: _rand_choice([True, False]),
-    "supplier_name": lambda: _rand_choice([
+    "material_type": _choice_field(["Metal", "Plástico", "Madera", "Cerámica", "Compuesto"]),
+    "usage_category": _choice_field(["Profesional", "Doméstico", "Industrial", "Especializado"]),
+    "safety_certification": _choice_field(["CE", "ISO", "UL", "ANSI", "Ninguna"]),
+    "environmental_rating": _choice_field(["A", "B", "C", "D", "No aplica"]),
+    "bulk_discount_available": _choice_field([True, False]),
+    "supplier_name": _choice_field([
         "Ferretería Central", "Distribuidora Norte", "Suministros Sur", "Importadora Este",
         "Comercial Oeste", "Proveedora Nacional", "Distribuciones Locales"
     ]),
-    "contact_person": lambda: _fake_or("Contacto Proveedor", "name"),
-    "payment_terms": lambda: _rand_choice(["30 días", "60 días", "Contado", "15 días"]),
-    "credit_limit": lambda: _rand_float(1000, 50000, 2),
-    "delivery_frequency": lambda: _rand_choice(["Semanal", "Quincenal", "Mensual", "Bajo demanda"]),
-    "minimum_order_amount": lambda: _rand_float(100, 5000, 2),
-    "discount_percentage": lambda: _rand_float(5, 25, 1),
-    "reliability_score": lambda: _rand_numeric(1, 10),
-    "quality_rating": lambda: _rand_numeric(1, 10),
-    "delivery_performance": lambda: _rand_float(70, 100, 1),
-    "product_categories_supplied": lambda: _rand_choice(["Herramientas", "Electricidad", "Plomería", "Múltiples"]),
-    "contract_expiry_date": lambda: _rand_date(365),
-    "transaction_type": lambda: _rand_choice(["Entrada", "Salida", "Ajuste", "Devolución"]),
-    "quantity_change": lambda: _rand_numeric(-100, 100),
-    "reason_code": lambda: _rand_choice(["Compra", "Venta", "Ajuste", "Devolución", "Merma"]),
-    "purchase_order_id": lambda: _rand_numeric(10000, 99999),
-    "lot_batch_number": lambda: f"LOTE{_rand_numeric(1000, 9999)}",
-    "location_warehouse": lambda: _rand_choice(["Almacén A", "Almacén B", "Mostrador", "Bodega"]),
-    "inventory_status": lambda: _rand_choice(["Disponible", "Reservado", "Dañado", "Obsoleto"]),
-    "quality_check_passed": lambda: _rand_choice([True, False]),
-    "project_type": lambda: _rand_choice(["Construcción", "Reparación", "Mantenimiento", "Jardinería"]),
-    "delivery_required": lambda: _rand_choice([True, False]),
-    "installation_service": lambda: _rand_choice([True, False]),
-    "warranty_sold": lambda: _rand_choice([True, False]),
-    "referral_source": lambda: _rand_choice(["Recomendación", "Internet", "Publicidad", "Cliente habitual"]),
+    "contact_person": _faker_field("Contacto Proveedor", "name"),
+    "payment_terms": _choice_field(["30 días", "60 días", "Contado", "15 días"]),
+    "credit_limit": _float_field(1000, 50000, 2),
+    "delivery_frequency": _choice_field(["Semanal", "Quincenal", "Mensual", "Bajo demanda"]),
+    "minimum_order_amount": _float_field(100, 5000, 2),
+    "discount_percentage": _float_field(5, 25, 1),
+    "reliability_score": _numeric_field(1, 10),
+    "quality_rating": _numeric_field(1, 10),
+    "delivery_performance": _float_field(70, 100, 1),
+    "product_categories_supplied": _choice_field(["Herramientas", "Electricidad", "Plomería", "Múltiples"]),
+    "contract_expiry_date": _date_field(365),
+    "transaction_type": _choice_field(["Entrada", "Salida", "Ajuste", "Devolución"]),
+    "quantity_change": _numeric_field(-100, 100),
+    "reason_code": _choice_field(["Compra", "Venta", "Ajuste", "Devolución", "Merma"]),
+    "purchase_order_id": _numeric_field(10000, 99999),
+    "lot_batch_number": _prefixed_number_field("LOTE", 1000, 9999),
+    "location_warehouse": _choice_field(["Almacén A", "Almacén B", "Mostrador", "Bodega"]),
+    "inventory_status": _choice_field(["Disponible", "Reservado", "Dañado", "Obsoleto"]),
+    "quality_check_passed": _choice_field([True, False]),
+    "project_type": _choice_field(["Construcción", "Reparación", "Mantenimiento", "Jardinería"]),
+    "delivery_required": _choice_field([True, False]),
+    "installation_service": _choice_field([True, False]),
+    "warranty_sold": _choice_field([True, False]),
+    "referral_source": _choice_field(["Recomendación", "Internet", "Publicidad", "Cliente habitual"]),
     
     # Micronegocios Especializados - Laboratorio
-    "test_name": lambda: _rand_choice([
+    "test_name": _choice_field([
         "Hemograma Completo", "Glucosa", "Colesterol Total", "Creatinina", "Urea",
         "Triglicéridos", "TSH", "PSA", "Examen de Orina", "Hepatitis B",
         "VIH", "Cultivo de Garganta", "Perfil Lipídico", "HbA1c", "Vitamina D"
     ]),
-    "test_category": lambda: _rand_choice(["Hematología", "Química clínica", "Microbiología", "Inmunología", "Urianálisis"]),
-    "test_type": lambda: _rand_choice(["Rutina", "Urgente", "Especializado", "Perfil"]),
-    "specimen_type": lambda: _rand_choice(["Sangre", "Orina", "Heces", "Saliva", "Tejido"]),
-    "collection_method": lambda: _rand_choice(["Venopunción", "Punción capilar", "Muestra espontánea", "Biopsia"]),
-    "processing_time_hours": lambda: _rand_float(0.5, 72.0, 1),
-    "reference_range_min": lambda: _rand_float(0, 100, 2),
-    "reference_range_max": lambda: _rand_float(100, 500, 2),
-    "units_measurement": lambda: _rand_choice(["mg/dL", "g/L", "UI/L", "mmol/L", "células/μL"]),
-    "equipment_name": lambda: _rand_choice([
+    "test_category": _choice_field(["Hematología", "Química clínica", "Microbiología", "Inmunología", "Urianálisis"]),
+    "test_type": _choice_field(["Rutina", "Urgente", "Especializado", "Perfil"]),
+    "specimen_type": _choice_field(["Sangre", "Orina", "Heces", "Saliva", "Tejido"]),
+    "collection_method": _choice_field(["Venopunción", "Punción capilar", "Muestra espontánea", "Biopsia"]),
+    "processing_time_hours": _float_field(0.5, 72.0, 1),
+    "reference_range_min": _float_field(0, 100, 2),
+    "reference_range_max": _float_field(100, 500, 2),
+    "units_measurement": _choice_field(["mg/dL", "g/L", "UI/L", "mmol/L", "células/μL"]),
+    "equipment_name": _choice_field([
         "Analizador Hematológico", "Microscopio", "Centrífuga", "Incubadora", 
         "Espectrofotómetro", "Analizador Químico", "Contador de Células"
     ]),
-    "equipment_required": lambda: _rand_choice(["Analizador", "Microscopio", "Centrífuga", "Incubadora", "Espectrofotómetro"]),
-    "reagent_required": lambda: _rand_choice(["Kit específico", "Reactivos múltiples", "Colorante", "Buffer"]),
-    "certification_level": lambda: _rand_choice(["Básico", "Intermedio", "Avanzado", "Especialista"]),
-    "fasting_required": lambda: _rand_choice([True, False]),
-    "special_preparation": lambda: _rand_choice(["Ayuno 12h", "Dieta especial", "Suspender medicamentos", "Ninguna"]),
-    "critical_value_low": lambda: _rand_float(0, 50, 2),
-    "critical_value_high": lambda: _rand_float(200, 1000, 2),
-    "turnaround_time_hours": lambda: _rand_numeric(1, 48),
-    "quality_control_frequency": lambda: _rand_choice(["Diario", "Por lote", "Semanal", "Mensual"]),
-    "equipment_type": lambda: _rand_choice(["Analizador automático", "Manual", "Semi-automático", "Especializado"]),
-    "manufacturer": lambda: _rand_choice(["Roche", "Abbott", "Siemens", "Beckman", "Sysmex"]),
-    "serial_number": lambda: f"SN{_rand_numeric(100000, 999999)}",
-    "purchase_date": lambda: _rand_date(1825),
-    "warranty_expiry": lambda: _rand_date(365),
-    "last_calibration_date": lambda: _rand_date(90),
-    "next_calibration_due": lambda: _rand_date(30),
-    "maintenance_frequency": lambda: _rand_choice(["Diario", "Semanal", "Mensual", "Trimestral"]),
-    "operational_status": lambda: _rand_choice(["Operativo", "Mantenimiento", "Fuera de servicio", "Calibración"]),
-    "location_lab": lambda: _rand_choice(["Lab 1", "Lab 2", "Urgencias", "Especialidades"]),
-    "cost_per_hour": lambda: _rand_float(10, 200, 2),
-    "technician_certification_required": lambda: _rand_choice([True, False]),
-    "daily_capacity": lambda: _rand_numeric(50, 1000),
-    "accuracy_percentage": lambda: _rand_float(95, 99.9, 1),
-    "precision_level": lambda: _rand_choice(["Alta", "Media", "Estándar"]),
-    "patient_id": lambda: _rand_numeric(100000, 999999),
-    "order_date": lambda: _rand_date(30),
-    "collection_date": lambda: _rand_date(7),
-    "processing_date": lambda: _rand_date(3),
-    "report_date": lambda: _rand_date(1),
-    "technician_id": lambda: _rand_numeric(1000, 9999),
-    "specimen_quality": lambda: _rand_choice(["Excelente", "Buena", "Aceptable", "Rechazada"]),
-    "test_result_value": lambda: _rand_float(1, 500, 2),
-    "test_result_status": lambda: _rand_choice(["Normal", "Anormal", "Crítico", "Indeterminado"]),
-    "reference_range_status": lambda: _rand_choice(["Dentro", "Bajo", "Alto", "Crítico"]),
-    "critical_value_flag": lambda: _rand_choice([True, False]),
-    "repeat_required": lambda: _rand_choice([True, False]),
-    "quality_control_passed": lambda: _rand_choice([True, False]),
-    "processing_time_actual": lambda: _rand_float(0.5, 24.0, 1),
-    "cost_actual": lambda: _rand_float(5, 200, 2),
-    "patient_satisfaction": lambda: _rand_numeric(1, 10),
-    "doctor_feedback": lambda: _rand_choice(["Excelente", "Bueno", "Regular", "Malo"]),
-    "shift_type": lambda: _rand_choice(["Mañana", "Tarde", "Noche", "24 horas"]),
-    "staff_count": lambda: _rand_numeric(2, 15),
-    "tests_processed": lambda: _rand_numeric(50, 500),
-    "specimens_received": lambda: _rand_numeric(60, 600),
-    "specimens_rejected": lambda: _rand_numeric(0, 50),
-    "equipment_downtime_minutes": lambda: _rand_numeric(0, 480),
-    "quality_control_tests": lambda: _rand_numeric(5, 50),
-    "turnaround_time_avg": lambda: _rand_float(2, 24, 1),
-    "customer_complaints": lambda: _rand_numeric(0, 10),
-    "revenue_daily": lambda: _rand_float(1000, 20000, 2),
-    "costs_daily": lambda: _rand_float(500, 15000, 2),
-    "efficiency_score": lambda: _rand_float(70, 100, 1),
+    "equipment_required": _choice_field(["Analizador", "Microscopio", "Centrífuga", "Incubadora", "Espectrofotómetro"]),
+    "reagent_required": _choice_field(["Kit específico", "Reactivos múltiples", "Colorante", "Buffer"]),
+    "certification_level": _choice_field(["Básico", "Intermedio", "Avanzado", "Especialista"]),
+    "fasting_required": _choice_field([True, False]),
+    "special_preparation": _choice_field(["Ayuno 12h", "Dieta especial", "Suspender medicamentos", "Ninguna"]),
+    "critical_value_low": _float_field(0, 50, 2),
+    "critical_value_high": _float_field(200, 1000, 2),
+    "turnaround_time_hours": _numeric_field(1, 48),
+    "quality_control_frequency": _choice_field(["Diario", "Por lote", "Semanal", "Mensual"]),
+    "equipment_type": _choice_field(["Analizador automático", "Manual", "Semi-automático", "Especializado"]),
+    "manufacturer": _choice_field(["Roche", "Abbott", "Siemens", "Beckman", "Sysmex"]),
+    "serial_number": _prefixed_number_field("SN", 100000, 999999),
+    "purchase_date": _date_field(1825),
+    "warranty_expiry": _date_field(365),
+    "last_calibration_date": _date_field(90),
+    "next_calibration_due": _date_field(30),
+    "maintenance_frequency": _choice_field(["Diario", "Semanal", "Mensual", "Trimestral"]),
+    "operational_status": _choice_field(["Operativo", "Mantenimiento", "Fuera de servicio", "Calibración"]),
+    "location_lab": _choice_field(["Lab 1", "Lab 2", "Urgencias", "Especialidades"]),
+    "cost_per_hour": _float_field(10, 200, 2),
+    "technician_certification_required": _choice_field([True, False]),
+    "daily_capacity": _numeric_field(50, 1000),
+    "accuracy_percentage": _float_field(95, 99.9, 1),
+    "precision_level": _choice_field(["Alta", "Media", "Estándar"]),
+    "patient_id": _numeric_field(100000, 999999),
+    "order_date": _date_field(30),
+    "collection_date": _date_field(7),
+    "processing_date": _date_field(3),
+    "report_date": _date_field(1),
+    "technician_id": _numeric_field(1000, 9999),
+    "specimen_quality": _choice_field(["Excelente", "Buena", "Aceptable", "Rechazada"]),
+    "test_result_value": _float_field(1, 500, 2),
+    "test_result_status": _choice_field(["Normal", "Anormal", "Crítico", "Indeterminado"]),
+    "reference_range_status": _choice_field(["Dentro", "Bajo", "Alto", "Crítico"]),
+    "critical_value_flag": _choice_field([True, False]),
+    "repeat_required": _choice_field([True, False]),
+    "quality_control_passed": _choice_field([True, False]),
+    "processing_time_actual": _float_field(0.5, 24.0, 1),
+    "cost_actual": _float_field(5, 200, 2),
+    "patient_satisfaction": _numeric_field(1, 10),
+    "doctor_feedback": _choice_field(["Excelente", "Bueno", "Regular", "Malo"]),
+    "shift_type": _choice_field(["Mañana", "Tarde", "Noche", "24 horas"]),
+    "staff_count": _numeric_field(2, 15),
+    "tests_processed": _numeric_field(50, 500),
+    "specimens_received": _numeric_field(60, 600),
+    "specimens_rejected": _numeric_field(0, 50),
+    "equipment_downtime_minutes": _numeric_field(0, 480),
+    "quality_control_tests": _numeric_field(5, 50),
+    "turnaround_time_avg": _float_field(2, 24, 1),
+    "customer_complaints": _numeric_field(0, 10),
+    "revenue_daily": _float_field(1000, 20000, 2),
+    "costs_daily": _float_field(500, 15000, 2),
+    "efficiency_score": _float_field(70, 100, 1),
     
     # Micronegocios Especializados - Jabonería
-    "soap_product_name": lambda: _rand_choice([
+    "soap_product_name": _choice_field([
         "Jabón de Lavanda", "Jabón de Rosa", "Jabón de Miel", "Jabón de Avena",
         "Jabón Artesanal", "Jabón de Coco", "Jabón Exfoliante", "Jabón Hidratante",
         "Jabón Antibacterial", "Jabón de Glicerina", "Jabón de Carbón", "Jabón de Té Verde"
     ]),
-    "fragrance_type": lambda: _rand_choice(["Lavanda", "Rosa", "Cítrico", "Menta", "Vainilla", "Sin fragancia"]),
-    "skin_type_target": lambda: _rand_choice(["Todo tipo", "Piel seca", "Piel grasa", "Piel sensible", "Piel mixta"]),
-    "ingredients_natural_pct": lambda: _rand_float(50, 100, 1),
-    "cruelty_free": lambda: _rand_choice([True, False]),
-    "ph_level": lambda: _rand_float(5.5, 9.0, 1),
-    "packaging_type": lambda: _rand_choice(["Barra", "Líquido", "Espuma", "Gel", "Polvo"]),
-    "shelf_life_months": lambda: _rand_numeric(6, 36),
-    "seasonal_demand": lambda: _rand_choice([True, False]),
-    "custom_formulation": lambda: _rand_choice([True, False]),
-    "gift_packaging_available": lambda: _rand_choice([True, False]),
-    "wholesale_available": lambda: _rand_choice([True, False]),
-    "retail_channel": lambda: _rand_choice(["Tienda física", "Online", "Mayorista", "Ferias"]),
-    "age_group_target": lambda: _rand_choice(["Niños", "Adolescentes", "Adultos", "Tercera edad", "Todas las edades"]),
-    "ingredient_type": lambda: _rand_choice(["Base", "Fragancia", "Colorante", "Conservante", "Activo"]),
-    "origin_country": lambda: _rand_choice(["Local", "Francia", "España", "Brasil", "India"]),
-    "fair_trade_certified": lambda: _rand_choice([True, False]),
-    "cost_per_kg": lambda: _rand_float(10, 500, 2),
-    "minimum_order_kg": lambda: _rand_numeric(1, 50),
-    "concentration_percentage": lambda: _rand_float(0.1, 50.0, 2),
-    "sustainability_rating": lambda: _rand_choice(["A", "B", "C", "D", "No calificado"]),
-    "alternative_available": lambda: _rand_choice([True, False]),
-    "batch_size_units": lambda: _rand_numeric(50, 1000),
-    "curing_time_days": lambda: _rand_numeric(7, 60),
-    "ph_test_result": lambda: _rand_float(5.0, 9.5, 1),
-    "hardness_test_result": lambda: _rand_choice(["Suave", "Medio", "Duro", "Muy duro"]),
-    "fragrance_intensity": lambda: _rand_choice(["Suave", "Medio", "Intenso", "Muy intenso"]),
-    "color_consistency": lambda: _rand_choice(["Uniforme", "Ligeramente irregular", "Irregular"]),
-    "production_time_hours": lambda: _rand_float(2, 12, 1),
-    "yield_percentage": lambda: _rand_float(85, 98, 1),
-    "waste_percentage": lambda: _rand_float(2, 15, 1),
-    "defect_count": lambda: _rand_numeric(0, 50),
-    "approved_units": lambda: _rand_numeric(40, 950),
-    "sale_channel": lambda: _rand_choice(["Tienda", "Online", "Feria", "Mayorista", "Catálogo"]),
-    "shipping_cost": lambda: _rand_float(0, 50, 2),
-    "gift_purchase": lambda: _rand_choice([True, False]),
-    "seasonal_promotion": lambda: _rand_choice([True, False]),
-    "packaging_preference": lambda: _rand_choice(["Estándar", "Eco-friendly", "De lujo", "Minimalista"]),
-    "delivery_method": lambda: _rand_choice(["Domicilio", "Punto de recogida", "Tienda", "Correo"]),
-    "customer_feedback_score": lambda: _rand_numeric(1, 10),
+    "fragrance_type": _choice_field(["Lavanda", "Rosa", "Cítrico", "Menta", "Vainilla", "Sin fragancia"]),
+    "skin_type_target": _choice_field(["Todo tipo", "Piel seca", "Piel grasa", "Piel sensible", "Piel mixta"]),
+    "ingredients_natural_pct": _float_field(50, 100, 1),
+    "cruelty_free": _choice_field([True, False]),
+    "ph_level": _float_field(5.5, 9.0, 1),
+    "packaging_type": _choice_field(["Barra", "Líquido", "Espuma", "Gel", "Polvo"]),
+    "shelf_life_months": _numeric_field(6, 36),
+    "seasonal_demand": _choice_field([True, False]),
+    "custom_formulation": _choice_field([True, False]),
+    "gift_packaging_available": _choice_field([True, False]),
+    "wholesale_available": _choice_field([True, False]),
+    "retail_channel": _choice_field(["Tienda física", "Online", "Mayorista", "Ferias"]),
+    "age_group_target": _choice_field(["Niños", "Adolescentes", "Adultos", "Tercera edad", "Todas las edades"]),
+    "ingredient_type": _choice_field(["Base", "Fragancia", "Colorante", "Conservante", "Activo"]),
+    "origin_country": _choice_field(["Local", "Francia", "España", "Brasil", "India"]),
+    "fair_trade_certified": _choice_field([True, False]),
+    "cost_per_kg": _float_field(10, 500, 2),
+    "minimum_order_kg": _numeric_field(1, 50),
+    "concentration_percentage": _float_field(0.1, 50.0, 2),
+    "sustainability_rating": _choice_field(["A", "B", "C", "D", "No calificado"]),
+    "alternative_available": _choice_field([True, False]),
+    "batch_size_units": _numeric_field(50, 1000),
+    "curing_time_days": _numeric_field(7, 60),
+    "ph_test_result": _float_field(5.0, 9.5, 1),
+    "hardness_test_result": _choice_field(["Suave", "Medio", "Duro", "Muy duro"]),
+    "fragrance_intensity": _choice_field(["Suave", "Medio", "Intenso", "Muy intenso"]),
+    "color_consistency": _choice_field(["Uniforme", "Ligeramente irregular", "Irregular"]),
+    "production_time_hours": _float_field(2, 12, 1),
+    "yield_percentage": _float_field(85, 98, 1),
+    "waste_percentage": _float_field(2, 15, 1),
+    "defect_count": _numeric_field(0, 50),
+    "approved_units": _numeric_field(40, 950),
+    "sale_channel": _choice_field(["Tienda", "Online", "Feria", "Mayorista", "Catálogo"]),
+    "shipping_cost": _float_field(0, 50, 2),
+    "gift_purchase": _choice_field([True, False]),
+    "seasonal_promotion": _choice_field([True, False]),
+    "packaging_preference": _choice_field(["Estándar", "Eco-friendly", "De lujo", "Minimalista"]),
+    "delivery_method": _choice_field(["Domicilio", "Punto de recogida", "Tienda", "Correo"]),
+    "customer_feedback_score": _numeric_field(1, 10),
     
     # Creator Intelligence - Plataformas y Canales
-    "platform_name": lambda: _rand_choice(["YouTube", "TikTok", "Instagram", "Twitter", "Facebook", "LinkedIn"]),
-    "api_source": lambda: _rand_choice(["YouTube Data API v3", "TikTok Business API", "Instagram Basic Display API", "Meta Graph API"]),
-    "url_base": lambda: _rand_choice(["https://www.googleapis.com/youtube/v3", "https://open-api.tiktok.com", "https://graph.instagram.com"]),
-    "tz_default": lambda: _rand_choice(["UTC", "America/New_York", "America/Los_Angeles", "Europe/London", "America/Mexico_City"]),
-    "data_freshness_sla": lambda: _rand_choice(["24h", "12h", "6h", "1h", "real-time"]),
+    "platform_name": _choice_field(["YouTube", "TikTok", "Instagram", "Twitter", "Facebook", "LinkedIn"]),
+    "api_source": _choice_field(["YouTube Data API v3", "TikTok Business API", "Instagram Basic Display API", "Meta Graph API"]),
+    "url_base": _choice_field(["https://www.googleapis.com/youtube/v3", "https://open-api.tiktok.com", "https://graph.instagram.com"]),
+    "tz_default": _choice_field(["UTC", "America/New_York", "America/Los_Angeles", "Europe/London", "America/Mexico_City"]),
+    "data_freshness_sla": _choice_field(["24h", "12h", "6h", "1h", "real-time"]),
     "handle": lambda: f"@{_fake_or('handle', 'user_name').lower().replace('.', '').replace(' ', '')}",
-    "channel_name": lambda: _rand_choice([
+    "channel_name": _choice_field([
         "Tech Reviews Pro", "Daily Life Vlogs", "Gaming Central", "Beauty Secrets", "Fitness Journey",
         "Cooking Adventures", "Travel Diaries", "Music Covers", "Comedy Sketches", "Educational Hub",
         "Art Tutorials", "Business Tips", "Health & Wellness", "Fashion Forward", "DIY Projects"
     ]),
-    "niche_topic": lambda: _rand_choice([
+    "niche_topic": _choice_field([
         "Technology", "Lifestyle", "Gaming", "Beauty", "Fitness", "Food", "Travel", "Music", 
         "Comedy", "Education", "Art", "Business", "Health", "Fashion", "DIY", "Science", "Sports"
     ]),
-    "lang": lambda: _rand_choice(["es", "en", "pt", "fr", "de", "it", "ja", "ko"]),
-    "subs_current": lambda: _rand_numeric(100, 10000000),
-    "join_date": lambda: _rand_date(2000),
+    "lang": _choice_field(["es", "en", "pt", "fr", "de", "it", "ja", "ko"]),
+    "subs_current": _numeric_field(100, 10000000),
+    "join_date": _date_field(2000),
     
     # Creator Intelligence - Contenido
-    "content_type": lambda: _rand_choice(["video", "short", "reel", "post", "story", "live"]),
-    "title": lambda: _rand_choice([
+    "content_type": _choice_field(["video", "short", "reel", "post", "story", "live"]),
+    "title": _choice_field([
         "10 Tips que CAMBIARÁN tu vida", "El SECRETO que nadie te cuenta", "Reaccionando a...", 
         "Tutorial COMPLETO paso a paso", "Mi RUTINA diaria REAL", "Lo que NADIE esperaba",
         "PROBANDO productos VIRALES", "La VERDAD sobre...", "Cómo conseguir... en 30 días",
         "EPIC FAIL compilación", "Antes vs Después INCREÍBLE", "Top 5 mejores...",
         "RESPONDIENDO a sus preguntas", "Detrás de cámaras", "Mi mayor ERROR"
     ]),
-    "title_tokens_json": lambda: _rand_choice([
+    "title_tokens_json": _choice_field([
         '["tips", "cambiarán", "vida"]', '["secreto", "nadie", "cuenta"]', 
         '["tutorial", "completo", "paso"]', '["rutina", "diaria", "real"]'
     ]),
-    "description_len": lambda: _rand_numeric(50, 5000),
-    "duration_s": lambda: _rand_numeric(15, 3600),
-    "aspect_ratio": lambda: _rand_choice(["16:9", "9:16", "1:1", "4:3", "21:9"]),
-    "hashtags_json": lambda: _rand_choice([
+    "description_len": _numeric_field(50, 5000),
+    "duration_s": _numeric_field(15, 3600),
+    "aspect_ratio": _choice_field(["16:9", "9:16", "1:1", "4:3", "21:9"]),
+    "hashtags_json": _choice_field([
         '["#viral", "#trending", "#fyp"]', '["#tutorial", "#howto", "#tips"]',
         '["#lifestyle", "#daily", "#vlog"]', '["#gaming", "#gameplay", "#gamer"]',
         '["#beauty", "#makeup", "#skincare"]', '["#food", "#recipe", "#cooking"]'
     ]),
-    "tags_json": lambda: _rand_choice([
+    "tags_json": _choice_field([
         '["entertainment", "trending"]', '["educational", "tutorial"]',
         '["lifestyle", "personal"]', '["technology", "review"]'
     ]),
-    "publish_ts_utc": lambda: _rand_datetime_utc(365),
-    "collab_flag": lambda: _rand_choice([True, False]),
-    "series_id": lambda: _rand_numeric(1000, 9999) if _rand_choice([True, False]) else None,
-    "evergreen_flag": lambda: _rand_choice([True, False]),
+    "publish_ts_utc": _datetime_utc_field(365),
+    "collab_flag": _choice_field([True, False]),
+    "series_id": _optional_field(_numeric_field(1000, 9999), 1, 2),
+    "evergreen_flag": _choice_field([True, False]),
     
     # Creator Intelligence - Taxonomía y Hashtags
-    "level1": lambda: _rand_choice(["Entertainment", "Education", "Technology", "Lifestyle", "Business", "Arts", "Sports"]),
-    "level2": lambda: _rand_choice(["Gaming", "Comedy", "Music", "Tutorials", "Reviews", "Vlogs", "News"]),
-    "level3": lambda: _rand_choice(["Mobile Games", "PC Gaming", "Stand-up", "Music Covers", "Tech Reviews", "Daily Life"]),
-    "keywords_json": lambda: _rand_choice([
+    "level1": _choice_field(["Entertainment", "Education", "Technology", "Lifestyle", "Business", "Arts", "Sports"]),
+    "level2": _choice_field(["Gaming", "Comedy", "Music", "Tutorials", "Reviews", "Vlogs", "News"]),
+    "level3": _choice_field(["Mobile Games", "PC Gaming", "Stand-up", "Music Covers", "Tech Reviews", "Daily Life"]),
+    "keywords_json": _choice_field([
         '["gaming", "gameplay", "review"]', '["tutorial", "howto", "guide"]',
         '["comedy", "funny", "humor"]', '["music", "cover", "song"]'
     ]),
-    "hashtag_text": lambda: _rand_choice([
+    "hashtag_text": _choice_field([
         "#fyp", "#viral", "#trending", "#foryou", "#explore", "#reels", "#shorts",
         "#tutorial", "#tips", "#howto", "#diy", "#lifestyle", "#daily", "#vlog",
         "#gaming", "#gamer", "#gameplay", "#streamer", "#esports",
@@ -958,124 +1307,124 @@ GENERAL_MAP: Dict[str, Callable[[], Any]] = {
     ]),
     
     # Creator Intelligence - Thumbnails y Títulos
-    "variant_code": lambda: _rand_choice(["A", "B", "C", "D", "E"]),
-    "style": lambda: _rand_choice(["meme", "clean", "face", "object", "text", "dramatic", "minimal"]),
-    "main_color": lambda: _rand_choice(["red", "blue", "yellow", "green", "orange", "purple", "black", "white"]),
-    "text_len": lambda: _rand_numeric(0, 100),
-    "face_detected_flag": lambda: _rand_choice([True, False]),
-    "sentiment": lambda: _rand_choice(["positive", "negative", "neutral", "excited", "curious", "urgent"]),
-    "word_count": lambda: _rand_numeric(3, 20),
-    "clickbait_score": lambda: _rand_float(0, 100, 1),
+    "variant_code": _choice_field(["A", "B", "C", "D", "E"]),
+    "style": _choice_field(["meme", "clean", "face", "object", "text", "dramatic", "minimal"]),
+    "main_color": _choice_field(["red", "blue", "yellow", "green", "orange", "purple", "black", "white"]),
+    "text_len": _numeric_field(0, 100),
+    "face_detected_flag": _choice_field([True, False]),
+    "sentiment": _choice_field(["positive", "negative", "neutral", "excited", "curious", "urgent"]),
+    "word_count": _numeric_field(3, 20),
+    "clickbait_score": _float_field(0, 100, 1),
     
     # Creator Intelligence - Experimentos
-    "objective": lambda: _rand_choice(["CTR", "retention", "conversion", "engagement", "watch_time", "subscribers"]),
-    "hypothesis": lambda: _rand_choice([
+    "objective": _choice_field(["CTR", "retention", "conversion", "engagement", "watch_time", "subscribers"]),
+    "hypothesis": _choice_field([
         "Thumbnails con caras aumentan CTR en 15%",
         "Títulos con números mejoran clicks en 20%",
         "Videos de 8-12 min tienen mejor retención",
         "Publicar en horarios peak aumenta views",
         "Colaboraciones incrementan suscriptores"
     ]),
-    "start_ts_utc": lambda: _rand_datetime_utc(30),
-    "end_ts_utc": lambda: _rand_datetime_utc(-30),
-    "owner": lambda: _fake_or("owner", "name"),
+    "start_ts_utc": _datetime_utc_field(30),
+    "end_ts_utc": _datetime_utc_field(-30),
+    "owner": _faker_field("owner", "name"),
     
     # Creator Intelligence - Scheduling
-    "dow": lambda: _rand_choice(["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]),
-    "hour_local": lambda: _rand_numeric(0, 23),
-    "is_peak_flag": lambda: _rand_choice([True, False]),
-    "historical_avg_ctr_pct": lambda: _rand_float(2, 15, 2),
-    "historical_watch_time_s": lambda: _rand_numeric(30, 600),
+    "dow": _choice_field(["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]),
+    "hour_local": _numeric_field(0, 23),
+    "is_peak_flag": _choice_field([True, False]),
+    "historical_avg_ctr_pct": _float_field(2, 15, 2),
+    "historical_watch_time_s": _numeric_field(30, 600),
     
     # Creator Intelligence - Métricas de Performance
-    "impressions": lambda: _rand_numeric(1000, 10000000),
-    "views": lambda: _rand_numeric(100, 5000000),
-    "unique_viewers": lambda: _rand_numeric(80, 3000000),
-    "avg_view_duration_s": lambda: _rand_numeric(15, 600),
-    "avg_percentage_viewed_pct": lambda: _rand_float(20, 80, 1),
-    "retention_30s_pct": lambda: _rand_float(40, 90, 1),
-    "retention_60s_pct": lambda: _rand_float(20, 70, 1),
-    "retention_50pct_mark_s": lambda: _rand_numeric(30, 300),
-    "watch_time_min": lambda: _rand_numeric(10, 100000),
-    "likes": lambda: _rand_numeric(10, 500000),
-    "comments": lambda: _rand_numeric(5, 50000),
-    "shares": lambda: _rand_numeric(2, 25000),
-    "saves": lambda: _rand_numeric(1, 10000),
-    "dislikes": lambda: _rand_numeric(0, 5000),
-    "ctr_thumb_pct": lambda: _rand_float(2, 15, 2),
-    "end_screen_clicks": lambda: _rand_numeric(0, 5000),
-    "card_clicks": lambda: _rand_numeric(0, 2000),
-    "subs_gained": lambda: _rand_numeric(0, 10000),
-    "subs_lost": lambda: _rand_numeric(0, 1000),
-    "revenue_ad_usd": lambda: _rand_float(0.5, 5000, 2),
-    "rpm_usd": lambda: _rand_float(0.5, 10, 2),
-    "cpm_usd": lambda: _rand_float(0.1, 5, 2),
+    "impressions": _numeric_field(1000, 10000000),
+    "views": _numeric_field(100, 5000000),
+    "unique_viewers": _numeric_field(80, 3000000),
+    "avg_view_duration_s": _numeric_field(15, 600),
+    "avg_percentage_viewed_pct": _float_field(20, 80, 1),
+    "retention_30s_pct": _float_field(40, 90, 1),
+    "retention_60s_pct": _float_field(20, 70, 1),
+    "retention_50pct_mark_s": _numeric_field(30, 300),
+    "watch_time_min": _numeric_field(10, 100000),
+    "likes": _numeric_field(10, 500000),
+    "comments": _numeric_field(5, 50000),
+    "shares": _numeric_field(2, 25000),
+    "saves": _numeric_field(1, 10000),
+    "dislikes": _numeric_field(0, 5000),
+    "ctr_thumb_pct": _float_field(2, 15, 2),
+    "end_screen_clicks": _numeric_field(0, 5000),
+    "card_clicks": _numeric_field(0, 2000),
+    "subs_gained": _numeric_field(0, 10000),
+    "subs_lost": _numeric_field(0, 1000),
+    "revenue_ad_usd": _float_field(0.5, 5000, 2),
+    "rpm_usd": _float_field(0.5, 10, 2),
+    "cpm_usd": _float_field(0.1, 5, 2),
     
     # Creator Intelligence - Retención y Fuentes
-    "second_mark": lambda: _rand_numeric(0, 600),
-    "viewers_remaining_pct": lambda: _rand_float(10, 100, 1),
-    "drop_delta_pct": lambda: _rand_float(-20, 5, 1),
-    "key_moment_flag": lambda: _rand_choice(["hook", "valley", "peak", "normal"]),
-    "source": lambda: _rand_choice(["search", "home", "suggested", "shorts", "external", "playlist", "browse", "notifications"]),
-    "ctr_pct": lambda: _rand_float(1, 20, 2),
+    "second_mark": _numeric_field(0, 600),
+    "viewers_remaining_pct": _float_field(10, 100, 1),
+    "drop_delta_pct": _float_field(-20, 5, 1),
+    "key_moment_flag": _choice_field(["hook", "valley", "peak", "normal"]),
+    "source": _choice_field(["search", "home", "suggested", "shorts", "external", "playlist", "browse", "notifications"]),
+    "ctr_pct": _float_field(1, 20, 2),
     
     # Creator Intelligence - Audiencia
-    "subs_total": lambda: _rand_numeric(100, 10000000),
-    "returning_viewers": lambda: _rand_numeric(50, 1000000),
-    "new_viewers": lambda: _rand_numeric(20, 500000),
-    "gender_mix_json": lambda: _rand_choice([
+    "subs_total": _numeric_field(100, 10000000),
+    "returning_viewers": _numeric_field(50, 1000000),
+    "new_viewers": _numeric_field(20, 500000),
+    "gender_mix_json": _choice_field([
         '{"male": 65, "female": 35}', '{"male": 45, "female": 55}',
         '{"male": 50, "female": 50}', '{"male": 40, "female": 60}'
     ]),
-    "age_brackets_json": lambda: _rand_choice([
+    "age_brackets_json": _choice_field([
         '{"13-17": 15, "18-24": 35, "25-34": 30, "35-44": 15, "45+": 5}',
         '{"13-17": 25, "18-24": 40, "25-34": 25, "35-44": 8, "45+": 2}',
         '{"13-17": 5, "18-24": 20, "25-34": 40, "35-44": 25, "45+": 10}'
     ]),
-    "geo_top_json": lambda: _rand_choice([
+    "geo_top_json": _choice_field([
         '{"US": 35, "MX": 25, "ES": 15, "AR": 10, "CO": 8, "other": 7}',
         '{"MX": 40, "US": 20, "ES": 15, "AR": 12, "PE": 8, "other": 5}',
         '{"ES": 45, "MX": 20, "AR": 15, "US": 10, "CO": 5, "other": 5}'
     ]),
-    "device_mix_json": lambda: _rand_choice([
+    "device_mix_json": _choice_field([
         '{"mobile": 75, "desktop": 20, "tablet": 5}',
         '{"mobile": 85, "desktop": 12, "tablet": 3}',
         '{"mobile": 65, "desktop": 30, "tablet": 5}'
     ]),
     
     # Creator Intelligence - Testing y Pacing
-    "hour_since_publish": lambda: _rand_numeric(0, 48),
-    "uplift_ctr_pct": lambda: _rand_float(-10, 50, 1),
-    "winner_flag": lambda: _rand_choice([True, False]),
+    "hour_since_publish": _numeric_field(0, 48),
+    "uplift_ctr_pct": _float_field(-10, 50, 1),
+    "winner_flag": _choice_field([True, False]),
     
     # Creator Intelligence - NLP y Comentarios
-    "comments_count": lambda: _rand_numeric(5, 50000),
-    "sentiment_avg": lambda: _rand_float(-1, 1, 2),
-    "topics_json": lambda: _rand_choice([
+    "comments_count": _numeric_field(5, 50000),
+    "sentiment_avg": _float_field(-1, 1, 2),
+    "topics_json": _choice_field([
         '["positive_feedback", "requests", "questions"]',
         '["criticism", "suggestions", "praise"]',
         '["funny_reactions", "memes", "appreciation"]'
     ]),
-    "toxicity_rate_pct": lambda: _rand_float(0, 15, 1),
-    "questions_count": lambda: _rand_numeric(0, 500),
-    "suggestions_count": lambda: _rand_numeric(0, 200),
+    "toxicity_rate_pct": _float_field(0, 15, 1),
+    "questions_count": _numeric_field(0, 500),
+    "suggestions_count": _numeric_field(0, 200),
     
     # Creator Intelligence - Scheduling y Competencia
-    "posted_ts_local": lambda: _rand_datetime_local(),
-    "delay_min": lambda: _rand_numeric(-30, 120),
-    "within_peak_flag": lambda: _rand_choice([True, False]),
-    "competitor_content_id": lambda: _rand_numeric(100000, 999999),
-    "competitor_channel": lambda: _rand_choice([
+    "posted_ts_local": _rand_datetime_local,
+    "delay_min": _numeric_field(-30, 120),
+    "within_peak_flag": _choice_field([True, False]),
+    "competitor_content_id": _numeric_field(100000, 999999),
+    "competitor_channel": _choice_field([
         "TechReviewer", "LifestyleGuru", "GamingPro", "BeautyExpert", "FoodieChannel",
         "TravelAddict", "FitnessCoach", "MusicMaker", "ComedyCentral", "EducationHub"
     ]),
-    "velocity_views_24h": lambda: _rand_numeric(1000, 1000000),
-    "ctr_proxy_pct": lambda: _rand_float(2, 12, 1),
-    "avg_duration_proxy_s": lambda: _rand_numeric(30, 900),
+    "velocity_views_24h": _numeric_field(1000, 1000000),
+    "ctr_proxy_pct": _float_field(2, 12, 1),
+    "avg_duration_proxy_s": _numeric_field(30, 900),
     
     # Creator Intelligence - Recomendaciones y Reportes
-    "category": lambda: _rand_choice(["hook", "title", "thumbnail", "format", "length", "hashtag", "schedule", "content"]),
-    "action_text": lambda: _rand_choice([
+    "category": _choice_field(["hook", "title", "thumbnail", "format", "length", "hashtag", "schedule", "content"]),
+    "action_text": _choice_field([
         "Mejorar hook en primeros 5 segundos",
         "Usar thumbnails con caras expresivas",
         "Optimizar títulos con números específicos",
@@ -1084,27 +1433,27 @@ GENERAL_MAP: Dict[str, Callable[[], Any]] = {
         "Incluir hashtags trending del nicho",
         "Agregar llamadas a acción más claras"
     ]),
-    "expected_uplift_metric": lambda: _rand_choice(["CTR", "watch_time", "retention", "engagement", "subscribers"]),
-    "expected_uplift_pct": lambda: _rand_float(5, 50, 1),
-    "priority": lambda: _rand_choice(["high", "medium", "low", "critical"]),
-    "due_date": lambda: _rand_date(30),
-    "report_type": lambda: _rand_choice(["diagnosis", "guide", "recommendations", "experiment_results", "monthly_review"]),
+    "expected_uplift_metric": _choice_field(["CTR", "watch_time", "retention", "engagement", "subscribers"]),
+    "expected_uplift_pct": _float_field(5, 50, 1),
+    "priority": _choice_field(["high", "medium", "low", "critical"]),
+    "due_date": _date_field(30),
+    "report_type": _choice_field(["diagnosis", "guide", "recommendations", "experiment_results", "monthly_review"]),
     "storage_uri": lambda: f"s3://creator-intelligence/reports/{_rand_numeric(1000, 9999)}.pdf",
     "summary_md": lambda: "## Resumen Ejecutivo\n\nAnálisis de performance del canal...",
     
     # Creator Intelligence - Gestión de Proyectos
-    "client_id": lambda: _rand_numeric(1000, 9999),
-    "scope": lambda: _rand_choice(["diagnosis", "retainer", "audit", "optimization", "strategy"]),
-    "pricing_model": lambda: _rand_choice(["hourly", "monthly", "project", "performance"]),
-    "milestone_date": lambda: _rand_date(90),
-    "milestone_name": lambda: _rand_choice([
+    "client_id": _numeric_field(1000, 9999),
+    "scope": _choice_field(["diagnosis", "retainer", "audit", "optimization", "strategy"]),
+    "pricing_model": _choice_field(["hourly", "monthly", "project", "performance"]),
+    "milestone_date": _date_field(90),
+    "milestone_name": _choice_field([
         "Initial Assessment", "Strategy Development", "Implementation Phase 1", 
         "Mid-point Review", "Optimization Round", "Final Delivery"
     ]),
-    "deliverable_type": lambda: _rand_choice(["diagnosis", "guide", "recommendations", "report", "strategy"]),
-    "delivered_date": lambda: _rand_date(30),
-    "acceptance_status": lambda: _rand_choice(["pending", "accepted", "revision_requested", "approved"]),
-    "meeting_ts_utc": lambda: _rand_datetime_utc(7),
+    "deliverable_type": _choice_field(["diagnosis", "guide", "recommendations", "report", "strategy"]),
+    "delivered_date": _date_field(30),
+    "acceptance_status": _choice_field(["pending", "accepted", "revision_requested", "approved"]),
+    "meeting_ts_utc": _datetime_utc_field(7),
     "attendees_json": lambda: '["client_lead", "creator_manager", "analyst", "strategist"]',
     "agenda_md": lambda: "## Agenda\n1. Review metrics\n2. Discuss recommendations\n3. Plan next steps",
     "outcomes_md": lambda: "## Outcomes\n- Agreed on CTR optimization strategy\n- Set targets for next month",
@@ -1112,142 +1461,241 @@ GENERAL_MAP: Dict[str, Callable[[], Any]] = {
     
     # Creator Intelligence - Raw Data
     "payload_json": lambda: '{"metrics": {"views": 12500, "ctr": 8.5}, "timestamp": "2024-01-01T12:00:00Z"}',
-    "pulled_ts_utc": lambda: _rand_datetime_utc(1),
-    "api_endpoint": lambda: _rand_choice([
+    "pulled_ts_utc": _datetime_utc_field(1),
+    "api_endpoint": _choice_field([
         "/youtube/v3/analytics", "/tiktok/v1/business/insights", 
         "/instagram/v1/insights", "/facebook/v12.0/insights"
     ]),
-    "rate_limit_ms": lambda: _rand_numeric(100, 5000),
-    "schema_version": lambda: _rand_choice(["v1.0", "v1.1", "v2.0", "v2.1"]),
+    "rate_limit_ms": _numeric_field(100, 5000),
+    "schema_version": _choice_field(["v1.0", "v1.1", "v2.0", "v2.1"]),
     
     # Campos common/metadata 
-    "pii_sensitivity": lambda: _rand_choice(["PUBLIC", "INTERNAL", "CONFIDENTIAL", "RESTRICTED"]),
-    "source_table": lambda: f"table_{_rand_numeric(100, 999)}",
-    "source_system": lambda: f"SYS_{_rand_choice(['PROD', 'STG', 'DEV'])}",
-    "geo_region": lambda: _rand_choice(["North", "South", "East", "West", "Central"]),
-    "geo_lat": lambda: _rand_float(-90, 90, 6),
-    "geo_lon": lambda: _rand_float(-180, 180, 6),
-    "fx_rate_to_usd": lambda: _rand_float(0.5, 2.0, 4),
-    "notes": lambda: _fake_or("System generated note", "sentence"),
-    "valid_from_utc": lambda: _rand_date(1000),
-    "valid_to_utc": lambda: _rand_date(200),
-    "created_at_utc": lambda: _rand_date(800),
+    "pii_sensitivity": _choice_field(["PUBLIC", "INTERNAL", "CONFIDENTIAL", "RESTRICTED"]),
+    "source_table": _prefixed_number_field("table_", 100, 999),
+    "source_system": _choice_field(["SYS_PROD", "SYS_STG", "SYS_DEV"]),
+    "geo_region": _choice_field(["North", "South", "East", "West", "Central"]),
+    "geo_lat": _float_field(-90, 90, 6),
+    "geo_lon": _float_field(-180, 180, 6),
+    "fx_rate_to_usd": _float_field(0.5, 2.0, 4),
+    "notes": _faker_field("System generated note", "sentence"),
+    "valid_from_utc": _date_field(1000),
+    "valid_to_utc": _date_field(200),
+    "created_at_utc": _date_field(800),
 }
 
 import hashlib
-def hashlib_sha(seed: str) -> str:
+# Generadores por columna: nombre de campo -> callable(n) con n valores
+BATCH_MAP: Dict[str, Callable[[int], list]] = {
+    name: spec.batch for name, spec in GENERAL_MAP.items()
+    if isinstance(spec, (_NumericField, _FloatField, _ChoiceField, _PrefixedNumberField,
+                         _FakerField, _OptionalField, _TimeOfDayField, _DateField, _DatetimeUtcField,
+                         _PhoneField))
+}
+
+def hashlib_sha(seed: str, secure: bool = False) -> str:
+    """Hash hexadecimal de 16 caracteres; xxh3-64 si está disponible (no criptográfico)"""
+    if not secure and xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(seed.encode())
     return hashlib.sha256(seed.encode()).hexdigest()[:16]
 
-# Variable global para contexto de tabla
-_CURRENT_TABLE_CONTEXT = None
+# Contexto de tabla por hilo (los ecosistemas pueden generar tablas en paralelo)
+_TABLE_CONTEXT = threading.local()
 
 def set_table_context(table_name: str):
     """Establece el contexto de la tabla actual para generación específica."""
-    global _CURRENT_TABLE_CONTEXT
-    _CURRENT_TABLE_CONTEXT = table_name
+    _TABLE_CONTEXT.name = table_name
 
-def _resolve_field(name: str) -> Any:
-    global _CURRENT_TABLE_CONTEXT
-    
-    # Resolución específica por contexto de tabla
-    if _CURRENT_TABLE_CONTEXT and name == "product_name":
-        if "bakery" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice([
-                "Pan de Molde", "Croissant", "Baguette", "Pan Integral", "Torta de Chocolate", 
-                "Empanadas", "Galletas de Avena", "Muffins de Arándanos", "Pan Dulce", "Facturas",
-                "Medialunas", "Pan de Centeno", "Torta Tres Leches", "Cupcakes", "Pan Francés",
-                "Rosca de Reyes", "Donas Glaseadas", "Pan de Ajo", "Tartaletas", "Bizcochuelo"
-            ])
-        elif "hardware" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice([
-                "Tornillos Autorroscantes", "Cable Eléctrico", "Tubería PVC", "Martillo", "Destornillador",
-                "Pintura Látex", "Cemento Contacto", "Lija", "Candado", "Bisagras",
-                "Interruptor", "Llave Inglesa", "Manguera", "Taladro", "Clavos"
-            ])
-        elif "soap" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice([
-                "Jabón de Lavanda", "Jabón de Rosa", "Jabón de Miel", "Jabón de Avena",
-                "Jabón Artesanal", "Jabón de Coco", "Jabón Exfoliante", "Jabón Hidratante",
-                "Jabón Antibacterial", "Jabón de Glicerina", "Jabón de Carbón", "Jabón de Té Verde"
-            ])
-    
-    if _CURRENT_TABLE_CONTEXT and name == "test_name" and "lab" in _CURRENT_TABLE_CONTEXT:
-        return _rand_choice([
+# Opciones propias de ciertos campos según la tabla activa; se evalúan en orden
+# y gana la primera palabra clave contenida en el nombre de la tabla
+_TABLE_CONTEXT_CHOICES: Dict[str, tuple] = {
+    "product_name": (
+        ("bakery", _choice_field([
+            "Pan de Molde", "Croissant", "Baguette", "Pan Integral", "Torta de Chocolate", 
+            "Empanadas", "Galletas de Avena", "Muffins de Arándanos", "Pan Dulce", "Facturas",
+            "Medialunas", "Pan de Centeno", "Torta Tres Leches", "Cupcakes", "Pan Francés",
+            "Rosca de Reyes", "Donas Glaseadas", "Pan de Ajo", "Tartaletas", "Bizcochuelo"
+        ])),
+        ("hardware", _choice_field([
+            "Tornillos Autorroscantes", "Cable Eléctrico", "Tubería PVC", "Martillo", "Destornillador",
+            "Pintura Látex", "Cemento Contacto", "Lija", "Candado", "Bisagras",
+            "Interruptor", "Llave Inglesa", "Manguera", "Taladro", "Clavos"
+        ])),
+        ("soap", _choice_field([
+            "Jabón de Lavanda", "Jabón de Rosa", "Jabón de Miel", "Jabón de Avena",
+            "Jabón Artesanal", "Jabón de Coco", "Jabón Exfoliante", "Jabón Hidratante",
+            "Jabón Antibacterial", "Jabón de Glicerina", "Jabón de Carbón", "Jabón de Té Verde"
+        ])),
+    ),
+    "test_name": (
+        ("lab", _choice_field([
             "Hemograma Completo", "Glucosa", "Colesterol Total", "Creatinina", "Urea",
             "Triglicéridos", "TSH", "PSA", "Examen de Orina", "Hepatitis B",
             "VIH", "Cultivo de Garganta", "Perfil Lipídico", "HbA1c", "Vitamina D"
-        ])
-    
-    if _CURRENT_TABLE_CONTEXT and name == "equipment_name" and "lab" in _CURRENT_TABLE_CONTEXT:
-        return _rand_choice([
+        ])),
+    ),
+    "equipment_name": (
+        ("lab", _choice_field([
             "Analizador Hematológico", "Microscopio", "Centrífuga", "Incubadora", 
             "Espectrofotómetro", "Analizador Químico", "Contador de Células"
-        ])
-    
-    if _CURRENT_TABLE_CONTEXT and name == "equipment_required":
-        if "bakery" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice(["Horno básico", "Batidora", "Moldes especiales", "Equipo decoración", "Horno especializado"])
-        elif "hardware" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice(["Herramientas básicas", "Equipo especializado", "Maquinaria pesada", "Instrumentos medición"])
-        elif "lab" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice(["Analizador", "Microscopio", "Centrífuga", "Incubadora", "Espectrofotómetro"])
-        elif "soap" in _CURRENT_TABLE_CONTEXT:
-            return _rand_choice(["Mezcladora", "Moldes", "Caldero", "Prensa", "Equipo curado"])
+        ])),
+    ),
+    "equipment_required": (
+        ("bakery", _choice_field(["Horno básico", "Batidora", "Moldes especiales", "Equipo decoración", "Horno especializado"])),
+        ("hardware", _choice_field(["Herramientas básicas", "Equipo especializado", "Maquinaria pesada", "Instrumentos medición"])),
+        ("lab", _choice_field(["Analizador", "Microscopio", "Centrífuga", "Incubadora", "Espectrofotómetro"])),
+        ("soap", _choice_field(["Mezcladora", "Moldes", "Caldero", "Prensa", "Equipo curado"])),
+    ),
+}
+
+def _table_context_choice(name: str, table: str) -> _ChoiceField | None:
+    for keyword, spec in _TABLE_CONTEXT_CHOICES[name]:
+        if keyword in table:
+            return spec
+    return None
+
+# Heurísticas por palabras clave del nombre, en orden de prioridad
+_HEURISTIC_KEYWORDS = (
+    ("date", ("date", "time", "timestamp")),                                   # Fechas
+    ("amount", ("price", "cost", "amount", "total", "balance", "salary")),      # Precios y cantidades
+    ("quantity", ("quantity", "qty", "count", "hours", "days", "points")),      # Cantidades enteras
+    ("name", ("name", "title", "description")),                                # Nombres
+    ("flag", ("flag", "active", "enabled", "voluntary")),                      # Flags y booleanos
+    ("status", ("status", "type", "category", "method", "reason")),            # Status y tipos
+    ("email", ("email",)),
+    ("phone", ("phone",)),
+)
+# Categorías que se generan sin Faker y admiten generación por columna
+_HEURISTIC_FIELDS: Dict[str, Any] = {
+    "date": _GENERIC_DATE_FIELD,
+    "amount": _float_field(1, 1000, 2),
+    "quantity": _numeric_field(1, 100),
+    "flag": _choice_field((True, False)),
+    "status": _choice_field(("Active", "Pending", "Closed", "Type_A", "Category_1")),
+}
+
+_FALLBACK_FIELD = _prefixed_number_field("value_", 1, 9999)
+
+@lru_cache(maxsize=4096)
+def _heuristic_kind(name_lower: str) -> str | None:
+    """Categoría heurística de un nombre de campo (se calcula una vez por nombre)"""
+    for kind, keywords in _HEURISTIC_KEYWORDS:
+        if any(kw in name_lower for kw in keywords):
+            return kind
+    return None
+
+@lru_cache(maxsize=4096)
+def _field_generator(name: str, table: str | None = None) -> Callable[[], Any]:
+    """Resolver una vez el generador de un campo para la tabla activa.
+
+    Lo usan tanto las filas (`_row_generator`) como las columnas; si el callable
+    tiene `batch(n)`, la columna completa puede generarse en bloque.
+    """
+    # Resolución específica por contexto de tabla
+    if table and name in _TABLE_CONTEXT_CHOICES:
+        spec = _table_context_choice(name, table)
+        if spec is not None:
+            return spec
     
     # Coincidencia exacta primero
     if name in GENERAL_MAP:
-        return GENERAL_MAP[name]()
+        return GENERAL_MAP[name]
     
     # Coincidencia por sufijos comunes
-    if name.endswith("_id") and "*_id" in GENERAL_MAP:
-        return GENERAL_MAP["*_id"]()
-    if name.endswith("_id_hash") and "*_id_hash" in GENERAL_MAP:
-        return GENERAL_MAP["*_id_hash"]()
-    if name.endswith("_code") and "*_code" in GENERAL_MAP:
-        return GENERAL_MAP["*_code"]()
-    if name.endswith("_number") and "*_number" in GENERAL_MAP:
-        return GENERAL_MAP["*_number"]()
+    for suffix in ("_id", "_id_hash", "_code", "_number"):
+        if name.endswith(suffix) and f"*{suffix}" in GENERAL_MAP:
+            return GENERAL_MAP[f"*{suffix}"]
     
     # Heurísticas por contenido de nombre (palabras clave)
-    name_lower = name.lower()
-    
-    # Fechas
-    if any(kw in name_lower for kw in ["date", "time", "timestamp"]):
-        return _rand_date(365)
-    
-    # Precios y cantidades
-    if any(kw in name_lower for kw in ["price", "cost", "amount", "total", "balance", "salary"]):
-        return _rand_float(1, 1000, 2)
-    
-    # Cantidades enteras
-    if any(kw in name_lower for kw in ["quantity", "qty", "count", "hours", "days", "points"]):
-        return _rand_numeric(1, 100)
-    
-    # Nombres
-    if any(kw in name_lower for kw in ["name", "title", "description"]):
-        return _fake_or(f"Generic {name}", "word")
-    
-    # Flags y booleanos
-    if any(kw in name_lower for kw in ["flag", "active", "enabled", "voluntary"]):
-        return _rand_choice([True, False])
-    
-    # Status y tipos
-    if any(kw in name_lower for kw in ["status", "type", "category", "method", "reason"]):
-        return _rand_choice(["Active", "Pending", "Closed", "Type_A", "Category_1"])
-    
-    # Emails
-    if "email" in name_lower:
-        return _fake_or("example@company.com", "email")
-    
-    # Teléfonos
-    if "phone" in name_lower:
-        return _fake_or("+1234567890", "phone_number")
+    kind = _heuristic_kind(name.lower())
+    spec = _HEURISTIC_FIELDS.get(kind)
+    if spec is not None:
+        return spec
+    if kind == "name":
+        return _faker_field(f"Generic {name}", "word")
+    if kind == "email":
+        return _faker_field("example@company.com", "email")
+    if kind == "phone":
+        return _faker_field("+1234567890", "phone_number")
     
     # Fallback para evitar None
-    return f"value_{_rand_numeric(1, 9999)}"
+    return _FALLBACK_FIELD
 
 def generate_row(field_names: list[str]) -> Dict[str, Any]:
-    row: Dict[str, Any] = {}
-    for f in field_names:
-        row[f] = _resolve_field(f)
-    return row
+    return _row_generator(tuple(field_names), getattr(_TABLE_CONTEXT, "name", None))()
+
+@lru_cache(maxsize=256)
+def _row_generator(names: tuple, table: str | None) -> Callable[[], Dict[str, Any]]:
+    """Compilar, por esquema y tabla, una función que genera una fila completa.
+
+    Cada generador queda como global del código compilado (`g0`, `g1`, ...), así
+    que cada celda es una sola llamada sin búsquedas en diccionarios.
+    """
+    namespace: Dict[str, Any] = {}
+    items = []
+    for i, name in enumerate(dict.fromkeys(names)):
+        namespace[f"g{i}"] = _field_generator(name, table)
+        items.append(f"{name!r}: g{i}()")
+    source = f"def _gen_row():\n    return {{{', '.join(items)}}}\n"
+    exec(compile(source, "<row_generator>", "exec"), namespace)
+    return namespace["_gen_row"]
+
+def generate_column(name: str, n: int) -> list:
+    """Generar los `n` valores de un campo de una vez.
+
+    Usa el `batch(n)` del generador del campo cuando lo tiene y, si no, lo
+    invoca valor a valor.
+    """
+    gen = _field_generator(name, getattr(_TABLE_CONTEXT, "name", None))
+    batch = getattr(gen, "batch", None)
+    return batch(n) if batch else [gen() for _ in range(n)]
+
+def generate_columns(field_names: list[str], n: int, categorical: bool = False) -> Dict[str, Any]:
+    """Generar `n` valores por campo en formato columnar (campo -> lista).
+
+    Los campos cuyo generador tiene `batch(n)` se generan en bloque; el resto
+    valor a valor. Todas las columnas comparten el mismo "ahora" de referencia.
+    Con `categorical=True` los campos de opciones de texto se devuelven como
+    `pd.Categorical` construido directamente desde los códigos sorteados.
+    """
+    columns: Dict[str, Any] = {}
+    table = getattr(_TABLE_CONTEXT, "name", None)
+    _NOW.utc = datetime.now(UTC)
+    _NOW.local = _NOW.utc.astimezone().replace(tzinfo=None)
+    try:
+        for f in field_names:
+            gen = _field_generator(f, table)
+            if categorical and pd is not None and isinstance(gen, _ChoiceField) and gen.categorical:
+                columns[f] = pd.Categorical.from_codes(gen.codes(n), categories=gen.opts)
+            else:
+                columns[f] = generate_column(f, n)
+    finally:
+        _NOW.utc = _NOW.local = None
+    return columns
+
+def generate_rows(field_names: list[str], n: int) -> list[Dict[str, Any]]:
+    """Generar `n` filas: columnas con `generate_columns` y luego filas"""
+    columns = generate_columns(field_names, n)
+    if not columns:
+        return [{} for _ in range(n)]
+    return columns_to_rows(columns)
+
+def columns_to_rows(columns: Dict[str, list]) -> list[Dict[str, Any]]:
+    """Convertir columnas (campo -> lista de igual longitud) en filas"""
+    return _row_assembler(tuple(columns))(list(columns.values()))
+
+@lru_cache(maxsize=256)
+def _row_assembler(names: tuple) -> Callable[[list], list]:
+    """Compilar, por conjunto de columnas, una función que arma las filas.
+
+    Un literal de diccionario con las claves fijas es bastante más rápido que
+    `dict(zip(names, values))` fila a fila.
+    """
+    values = [f"v{i}" for i in range(len(names))]
+    items = ", ".join(f"{name!r}: {v}" for name, v in zip(names, values))
+    source = (
+        "def _assemble(columns):\n"
+        f"    return [{{{items}}} for {', '.join(values)}, in zip(*columns)]\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<row_assembler>", "exec"), namespace)
+    return namespace["_assemble"]
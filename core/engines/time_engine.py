@@ -3,10 +3,22 @@ from __future__ import annotations
 import numpy as np
 from typing import Dict, Any
 
+from core.sampling import distributions
 
-def generate_time_series(length: int = 100, seasonal: bool = True) -> Dict[str, Any]:
+
+def generate_time_series(length: int = 100, seasonal: bool = True, seed: int | None = None) -> Dict[str, np.ndarray]:
     idx = np.arange(length)
-    base = np.sin(idx / 12 * 2 * np.pi) if seasonal else np.zeros_like(idx)
-    noise = np.random.normal(0, 0.2, size=length)
+    base = np.sin(idx / 12 * 2 * np.pi) if seasonal else np.zeros(length)
+    if seed is None:
+        # Sin semilla propia: generador del módulo, reiniciado por `set_seed`
+        noise = distributions.normal(0.0, 0.2, length)
+    else:
+        noise = np.random.default_rng(seed).standard_normal(length)
+        noise *= 0.2
     values = base + noise
-    return {"t": idx.tolist(), "value": values.tolist()}
+    return {"t": idx, "value": values}
+
+
+def time_series_to_lists(series: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Adaptador para JSON: convertir los arreglos de la serie en listas"""
+    return {k: v.tolist() for k, v in series.items()}
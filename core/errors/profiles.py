@@ -6,6 +6,8 @@ from typing import Dict, Any, List, Callable
 import random
 import string
 
+import numpy as np
+
 # Perfiles predefinidos
 ERROR_PROFILES = {
     "none": {
@@ -38,74 +40,164 @@ def get_profile(name: str) -> Dict[str, float]:
     """Get error profile by name."""
     return ERROR_PROFILES.get(name, ERROR_PROFILES["none"]).copy()
 
+def _apply_to_rows(rows: List[Dict[str, Any]], apply: Callable[..., Dict[str, list]], *args) -> List[Dict[str, Any]]:
+    """Aplicar una función columnar sobre filas y reescribir solo las columnas cambiadas.
+
+    Las filas sin un campo lo ven como None (nunca se elige ni se modifica) y al
+    reescribir no se les añade.
+    """
+    if not rows:
+        return rows
+    fields = dict.fromkeys(k for row in rows for k in row)
+    columns = {f: [row.get(f) for row in rows] for f in fields}
+    original = dict(columns)
+    for field, col in apply(columns, *args).items():
+        if col is not original[field]:
+            for row, value in zip(rows, col):
+                if field in row:
+                    row[field] = value
+    return rows
+
 def apply_null_errors(rows: List[Dict[str, Any]], null_pct: float, exclude_fields: List[str] = None) -> List[Dict[str, Any]]:
     """Inject null errors randomly."""
-    if exclude_fields is None:
-        exclude_fields = ["id", "natural_key"]
-    for row in rows:
-        for field in row:
-            if field not in exclude_fields and random.random() < null_pct:
-                row[field] = None
-    return rows
+    return _apply_to_rows(rows, apply_null_errors_columns, null_pct, exclude_fields)
 
 def apply_duplicate_errors(rows: List[Dict[str, Any]], duplicate_pct: float, key_fields: List[str] = None) -> List[Dict[str, Any]]:
     """Inject duplicate values in key fields."""
+    return _apply_to_rows(rows, apply_duplicate_errors_columns, duplicate_pct, key_fields)
+
+def apply_typo_errors(rows: List[Dict[str, Any]], typo_pct: float, string_fields: List[str] = None) -> List[Dict[str, Any]]:
+    """Inject typos in string fields."""
+    return _apply_to_rows(rows, apply_typo_errors_columns, typo_pct, string_fields)
+
+def apply_out_of_range_errors(rows: List[Dict[str, Any]], out_of_range_pct: float, numeric_fields: List[str] = None) -> List[Dict[str, Any]]:
+    """Inject out-of-range values in numeric fields."""
+    return _apply_to_rows(rows, apply_out_of_range_errors_columns, out_of_range_pct, numeric_fields)
+
+def apply_error_profile(rows: List[Dict[str, Any]], profile_name: str) -> List[Dict[str, Any]]:
+    """Apply a complete error profile to rows."""
+    return _apply_to_rows(rows, apply_error_profile_columns, profile_name)
+
+# ===== VERSIÓN COLUMNAR (campo -> lista) =====
+# Implementación única de los errores: las funciones por fila de arriba la
+# reutilizan. Las máscaras completas se sortean con NumPy en lugar de un
+# `random.random()` por celda.
+
+def _error_rng(rng: "np.random.Generator | None") -> "np.random.Generator":
+    # Sin generador explícito se deriva del módulo `random` (sembrado por set_seed)
+    return rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+
+def apply_null_errors_columns(columns: Dict[str, list], null_pct: float, exclude_fields: List[str] = None,
+                              rng: "np.random.Generator | None" = None) -> Dict[str, list]:
+    """Inject null errors column by column using a boolean mask."""
+    if exclude_fields is None:
+        exclude_fields = ["id", "natural_key"]
+    if null_pct <= 0:
+        return columns
+    rng = _error_rng(rng)
+    for field, col in columns.items():
+        if field in exclude_fields or not col:
+            continue
+        hits = np.flatnonzero(rng.random(len(col)) < null_pct)
+        if len(hits):
+            col = list(col)
+            for i in hits.tolist():
+                col[i] = None
+            columns[field] = col
+    return columns
+
+def apply_duplicate_errors_columns(columns: Dict[str, list], duplicate_pct: float, key_fields: List[str] = None,
+                                   rng: "np.random.Generator | None" = None) -> Dict[str, list]:
+    """Inject duplicate values in key fields, column by column."""
     if key_fields is None:
         key_fields = ["email_corp", "first_name", "last_name"]
-    if not rows:
-        return rows
+    if duplicate_pct <= 0:
+        return columns
+    rng = _error_rng(rng)
     for field in key_fields:
-        if field in rows[0]:
-            values = [r[field] for r in rows if r[field] is not None]
-            if values:
-                for row in rows:
-                    if random.random() < duplicate_pct and row[field] is not None:
-                        row[field] = random.choice(values)
-    return rows
+        col = columns.get(field)
+        if not col:
+            continue
+        values = [v for v in col if v is not None]
+        if not values:
+            continue
+        hits = [i for i in np.flatnonzero(rng.random(len(col)) < duplicate_pct).tolist() if col[i] is not None]
+        if hits:
+            col = list(col)
+            for i, j in zip(hits, rng.integers(0, len(values), size=len(hits)).tolist()):
+                col[i] = values[j]
+            columns[field] = col
+    return columns
 
-def apply_typo_errors(rows: List[Dict[str, Any]], typo_pct: float, string_fields: List[str] = None) -> List[Dict[str, Any]]:
-    """Inject typos in string fields."""
+_TYPO_TYPES = ("swap", "delete", "insert", "replace")
+
+def _add_typo(s: str, rng: "np.random.Generator") -> str:
+    if len(s) < 2:
+        return s
+    pos = int(rng.integers(0, len(s)))
+    typo_type = _TYPO_TYPES[int(rng.integers(0, len(_TYPO_TYPES)))]
+    if typo_type == "swap" and pos < len(s) - 1:
+        return s[:pos] + s[pos+1] + s[pos] + s[pos+2:]
+    elif typo_type == "delete":
+        return s[:pos] + s[pos+1:]
+    elif typo_type == "insert":
+        return s[:pos] + string.ascii_lowercase[int(rng.integers(0, 26))] + s[pos:]
+    elif typo_type == "replace":
+        return s[:pos] + string.ascii_lowercase[int(rng.integers(0, 26))] + s[pos+1:]
+    return s
+
+
+def apply_typo_errors_columns(columns: Dict[str, list], typo_pct: float, string_fields: List[str] = None,
+                              rng: "np.random.Generator | None" = None) -> Dict[str, list]:
+    """Inject typos in string fields, column by column."""
     if string_fields is None:
         string_fields = ["first_name", "last_name", "email_corp"]
-    def add_typo(s: str) -> str:
-        if len(s) < 2:
-            return s
-        pos = random.randint(0, len(s) - 1)
-        typo_type = random.choice(["swap", "delete", "insert", "replace"])
-        if typo_type == "swap" and pos < len(s) - 1:
-            return s[:pos] + s[pos+1] + s[pos] + s[pos+2:]
-        elif typo_type == "delete":
-            return s[:pos] + s[pos+1:]
-        elif typo_type == "insert":
-            char = random.choice(string.ascii_lowercase)
-            return s[:pos] + char + s[pos:]
-        elif typo_type == "replace":
-            char = random.choice(string.ascii_lowercase)
-            return s[:pos] + char + s[pos+1:]
-        return s
-    for row in rows:
-        for field in string_fields:
-            if field in row and isinstance(row[field], str) and random.random() < typo_pct:
-                row[field] = add_typo(row[field])
-    return rows
+    if typo_pct <= 0:
+        return columns
+    rng = _error_rng(rng)
+    for field in string_fields:
+        col = columns.get(field)
+        if not col:
+            continue
+        hits = [i for i in np.flatnonzero(rng.random(len(col)) < typo_pct).tolist() if isinstance(col[i], str)]
+        if hits:
+            col = list(col)
+            for i in hits:
+                col[i] = _add_typo(col[i], rng)
+            columns[field] = col
+    return columns
 
-def apply_out_of_range_errors(rows: List[Dict[str, Any]], out_of_range_pct: float, numeric_fields: List[str] = None) -> List[Dict[str, Any]]:
-    """Inject out-of-range values in numeric fields."""
+_OUT_OF_RANGE_FACTORS = np.array([10, 100, -1, -10])
+
+def apply_out_of_range_errors_columns(columns: Dict[str, list], out_of_range_pct: float, numeric_fields: List[str] = None,
+                                      rng: "np.random.Generator | None" = None) -> Dict[str, list]:
+    """Inject out-of-range values in numeric fields, column by column."""
     if numeric_fields is None:
         numeric_fields = ["qty", "unit_price"]
-    for row in rows:
-        for field in numeric_fields:
-            if field in row and isinstance(row[field], (int, float)) and random.random() < out_of_range_pct:
-                # Make it out of range by multiplying by large factor or negative
-                factor = random.choice([10, 100, -1, -10])
-                row[field] = row[field] * factor
-    return rows
+    if out_of_range_pct <= 0:
+        return columns
+    rng = _error_rng(rng)
+    for field in numeric_fields:
+        col = columns.get(field)
+        if not col:
+            continue
+        hits = [i for i in np.flatnonzero(rng.random(len(col)) < out_of_range_pct).tolist()
+                if isinstance(col[i], (int, float))]
+        if hits:
+            col = list(col)
+            factors = _OUT_OF_RANGE_FACTORS[rng.integers(0, len(_OUT_OF_RANGE_FACTORS), size=len(hits))].tolist()
+            for i, factor in zip(hits, factors):
+                col[i] = col[i] * factor
+            columns[field] = col
+    return columns
 
-def apply_error_profile(rows: List[Dict[str, Any]], profile_name: str) -> List[Dict[str, Any]]:
-    """Apply a complete error profile to rows."""
+def apply_error_profile_columns(columns: Dict[str, list], profile_name: str,
+                                rng: "np.random.Generator | None" = None) -> Dict[str, list]:
+    """Apply a complete error profile to columns (field -> list)."""
     profile = get_profile(profile_name)
-    rows = apply_null_errors(rows, profile["null_pct"])
-    rows = apply_duplicate_errors(rows, profile["duplicate_pct"])
-    rows = apply_typo_errors(rows, profile["typo_pct"])
-    rows = apply_out_of_range_errors(rows, profile["out_of_range_pct"])
-    return rows
\ No newline at end of file
+    rng = _error_rng(rng)
+    columns = apply_null_errors_columns(columns, profile["null_pct"], rng=rng)
+    columns = apply_duplicate_errors_columns(columns, profile["duplicate_pct"], rng=rng)
+    columns = apply_typo_errors_columns(columns, profile["typo_pct"], rng=rng)
+    columns = apply_out_of_range_errors_columns(columns, profile["out_of_range_pct"], rng=rng)
+    return columns
@@ -3,86 +3,287 @@ from __future__ import annotations
 from typing import List, Dict, Any
 from datetime import datetime, UTC
 import hashlib
+import os
 import random
 
+import numpy as np
+
+try:  # pragma: no cover
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+
 from core.utils.schemas import load_table_schema
-from core.engines.faker_engine import generate_row, set_table_context
-from core.utils.seed import set_seed
-from core.utils.geo import sample_city
-from core.utils.fx import get_fx_rate
-from core.errors.profiles import apply_error_profile
+from core.engines import faker_engine
+from core.engines.faker_engine import columns_to_rows, generate_columns, set_table_context, seed_random_pool
+from core.utils.seed import set_seed, resolve_seed
+from core.scaling.multiproc import parallel_map
+from core.utils.geo import City, sample_city
+from core.utils.fx import FXRate, get_fx_rate
+from core.errors.profiles import apply_error_profile_columns
 
 _COMMON_EXCLUDE_HASH = {"record_hash", "dq_completeness_pct", "dq_validity_pct"}
+# Campos que pueden ser nulos sin marcar la fila como "warn"
+_NULL_STATUS_EXCLUDE = frozenset({"valid_to_utc", "tags", "notes"})
+
+
+def _hash_keys(fields) -> List[str]:
+    """Campos que entran en el hash, en orden, calculados una vez por lote"""
+    return [k for k in sorted(fields) if k not in _COMMON_EXCLUDE_HASH]
+
+
+def _compute_hash(row: Dict[str, Any], keys: List[str] | None = None) -> str:
+    if keys is None:
+        keys = _hash_keys(row)
+    return hashlib.sha256("".join([str(row[k]) for k in keys]).encode()).hexdigest()
 
 
-def _compute_hash(row: Dict[str, Any]) -> str:
-    h = hashlib.sha256()
-    for k in sorted(row.keys()):
-        if k in _COMMON_EXCLUDE_HASH:
-            continue
-        h.update(str(row[k]).encode())
-    return h.hexdigest()
+def generate(domain: str, table: str, rows: int, seed: int | None = None, error_profile: str = "none",
+             workers: int = 1) -> List[Dict[str, Any]]:
+    if workers > 1 and rows > 1:
+        # Un bloque contiguo de filas por proceso
+        return generate_parallel(domain, table, rows, seed=seed, error_profile=error_profile,
+                                 workers=workers, chunk_size=-(-rows // workers))
+    columns = generate_columnar(domain, table, rows, seed=seed, error_profile=error_profile)
+    return columns_to_rows(columns) if rows > 0 else []
 
 
-def generate(domain: str, table: str, rows: int, seed: int | None = None, error_profile: str = "none") -> List[Dict[str, Any]]:
-    set_seed(seed)
+def generate_arrow(domain: str, table: str, rows: int, seed: int | None = None, error_profile: str = "none") -> "pa.Table":
+    """Generar una tabla como `pyarrow.Table` sin pasar por diccionarios por fila"""
+    if pa is None:
+        raise ImportError("pyarrow es necesario para generate_arrow")
+    return pa.Table.from_pydict(generate_columnar(domain, table, rows, seed=seed, error_profile=error_profile))
+
+
+def generate_many(jobs: List[tuple], seed: int | None = None, error_profile: str = "none") -> Dict[str, List[Dict[str, Any]]]:
+    """Generar varias tablas `(domain, table, rows)` compartiendo la preparación.
+
+    Cada esquema se carga una vez, la ciudad y el tipo de cambio se resuelven una
+    sola vez para todo el lote y cada tabla recibe una semilla propia derivada
+    con `SeedSequence.spawn`. Devuelve `{tabla: filas}`.
+    """
+    if not jobs:
+        return {}
+    base_seed = set_seed(seed)
+    city = sample_city()
+    fx = get_fx_rate("USD", "USD")
+    schemas: Dict[tuple, Dict[str, Any]] = {}
+    children = np.random.SeedSequence(base_seed).spawn(len(jobs))
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for (domain, table, rows), child in zip(jobs, children):
+        schema = schemas.get((domain, table))
+        if schema is None:
+            schema = schemas[(domain, table)] = load_table_schema(domain, table)
+        columns = generate_columnar(domain, table, rows, seed=int(child.generate_state(1)[0]),
+                                    error_profile=error_profile, schema=schema, city=city, fx=fx)
+        out[table] = columns_to_rows(columns) if rows > 0 else []
+    return out
+
+
+def _fill_default(columns: Dict[str, list], name: str, value: Any, rows: int) -> None:
+    # Igual que `if row.get(name) is None: row[name] = value`, pero por columna
+    col = columns.get(name)
+    if col is None:
+        columns[name] = [value] * rows
+    elif None in col:
+        columns[name] = [value if v is None else v for v in col]
+
+
+def generate_columnar(domain: str, table: str, rows: int, seed: int | None = None,
+                      error_profile: str = "none", *, schema: Dict[str, Any] | None = None,
+                      city: City | None = None, fx: FXRate | None = None) -> Dict[str, list]:
+    """Generar una tabla en formato columnar (campo -> lista de `rows` valores).
+
+    Campos comunes, perfil de errores, métricas DQ y hash se calculan columna a
+    columna; `generate` solo arma las filas al final. `schema`, `city` y `fx`
+    permiten reutilizar lo ya cargado por `generate_many`.
+    """
+    seed_value = set_seed(seed)
+    seed_random_pool(seed_value)
+    # Faker también parte de la semilla: mismos valores para la misma semilla
+    faker_engine.seed_faker(seed_value)
     # Establecer contexto de tabla para generación específica
     set_table_context(table)
-    
-    schema = load_table_schema(domain, table)
+
+    if schema is None:
+        schema = load_table_schema(domain, table)
     fields = schema["fields"]
 
-    out: List[Dict[str, Any]] = []
+    columns = generate_columns(fields, rows)
     batch_time = datetime.now(UTC).isoformat()
-    city = sample_city()
-    for i in range(rows):
-        base = generate_row(fields)
-        # Campos comunes completos (placeholder simple)
-        if base.get("id") is None: base["id"] = i + 1
-        if base.get("natural_key") is None:
-            base["natural_key"] = base.get("employee_id") or base.get("transaction_id") or base.get("ticket_id") or base["id"]
-        if base.get("tenant_id") is None: base["tenant_id"] = 1
-        if base.get("source_system") is None: base["source_system"] = domain
-        if base.get("source_table") is None: base["source_table"] = table
-        if base.get("batch_id") is None: base["batch_id"] = 1
-        if base.get("batch_time_utc") is None: base["batch_time_utc"] = batch_time
-        if base.get("is_active") is None: base["is_active"] = True
-        if base.get("valid_from_utc") is None: base["valid_from_utc"] = batch_time
-        if base.get("valid_to_utc") is None: base["valid_to_utc"] = None
-        if base.get("created_at_utc") is None: base["created_at_utc"] = batch_time
-        if base.get("created_by") is None: base["created_by"] = "synthedata"
-        if base.get("updated_at_utc") is None: base["updated_at_utc"] = batch_time
-        if base.get("updated_by") is None: base["updated_by"] = "synthedata"
-        if base.get("pii_sensitivity") is None: base["pii_sensitivity"] = "low"
-        if base.get("geo_country") is None: base["geo_country"] = city.country
-        if base.get("geo_region") is None: base["geo_region"] = city.region
-        if base.get("geo_city") is None: base["geo_city"] = city.name
-        if base.get("geo_lat") is None: base["geo_lat"] = city.lat
-        if base.get("geo_lon") is None: base["geo_lon"] = city.lon
-        if base.get("currency_code") is None: base["currency_code"] = "USD"
+    if city is None:
+        city = sample_city()
+    if fx is None:
         fx = get_fx_rate("USD", "USD")
-        if base.get("fx_rate_to_usd") is None: base["fx_rate_to_usd"] = fx.rate
-        if base.get("processing_status") is None:
-            base["processing_status"] = "ok"
-        if base.get("tags") is None: base["tags"] = None
-        if base.get("notes") is None: base["notes"] = None
-        out.append(base)
-    
-    # Aplicar perfil de errores después de generar todas las filas
+
+    # Campos comunes completos (placeholder simple)
+    ids = columns.get("id")
+    if ids is None:
+        columns["id"] = list(range(1, rows + 1))
+    elif None in ids:
+        columns["id"] = [i if v is None else v for i, v in enumerate(ids, 1)]
+    natural_key = columns.get("natural_key")
+    if natural_key is None or None in natural_key:
+        empty = [None] * rows
+        columns["natural_key"] = [
+            nk if nk is not None else (emp or txn or ticket or rid)
+            for nk, emp, txn, ticket, rid in zip(
+                natural_key or empty, columns.get("employee_id", empty), columns.get("transaction_id", empty),
+                columns.get("ticket_id", empty), columns["id"],
+            )
+        ]
+    for name, value in (
+        ("tenant_id", 1), ("source_system", domain), ("source_table", table), ("batch_id", 1),
+        ("batch_time_utc", batch_time), ("is_active", True), ("valid_from_utc", batch_time),
+        ("valid_to_utc", None), ("created_at_utc", batch_time), ("created_by", "synthedata"),
+        ("updated_at_utc", batch_time), ("updated_by", "synthedata"), ("pii_sensitivity", "low"),
+        ("geo_country", city.country), ("geo_region", city.region), ("geo_city", city.name),
+        ("geo_lat", city.lat), ("geo_lon", city.lon), ("currency_code", "USD"),
+        ("fx_rate_to_usd", fx.rate), ("processing_status", "ok"), ("tags", None), ("notes", None),
+    ):
+        _fill_default(columns, name, value, rows)
+
+    # Aplicar perfil de errores después de generar todas las columnas
+    if error_profile != "none":
+        columns = apply_error_profile_columns(columns, error_profile)
+
+    # Máscara de nulos por columna, calculada una vez para el estado y para DQ;
+    # las columnas sin ningún None (`None in col` es un recorrido en C) se omiten
+    null_masks: Dict[str, np.ndarray] = {
+        k: np.fromiter((v is None for v in col), dtype=bool, count=rows)
+        for k, col in columns.items() if None in col
+    }
     if error_profile != "none":
-        out = apply_error_profile(out, error_profile)
         # Actualizar processing_status para filas con errores
-        for row in out:
-            has_nulls = any(v is None for k, v in row.items() if k not in ["valid_to_utc", "tags", "notes"])
-            if has_nulls:
-                row["processing_status"] = "warn"
-    
+        has_nulls = np.zeros(rows, dtype=bool)
+        for k, mask in null_masks.items():
+            if k not in _NULL_STATUS_EXCLUDE:
+                has_nulls |= mask
+        if has_nulls.any():
+            columns["processing_status"] = [
+                "warn" if warn else status for warn, status in zip(has_nulls.tolist(), columns["processing_status"])
+            ]
+            # Toda fila con processing_status nulo acaba de pasar a "warn"
+            null_masks.pop("processing_status", None)
+
     # Calcular métricas DQ después de aplicar errores
-    for row in out:
-        non_null = sum(1 for f in fields if row.get(f) is not None)
-        completeness = non_null / len(fields) if fields else 1.0
-        row["dq_completeness_pct"] = round(completeness * 100, 2)
-        row["dq_validity_pct"] = row["dq_completeness_pct"]  # placeholder
-        row["record_hash"] = _compute_hash(row)
-    
+    non_null = np.full(rows, len(fields), dtype=np.int64)
+    for f in fields:
+        if f not in columns:
+            non_null -= 1
+        elif f in null_masks:
+            non_null -= null_masks[f]
+    # Solo hay len(fields) + 1 valores posibles de completitud
+    pct = [round(k / len(fields) * 100, 2) for k in range(len(fields) + 1)] if fields else [100.0]
+    columns["dq_completeness_pct"] = [pct[k] for k in non_null.tolist()]
+    columns["dq_validity_pct"] = list(columns["dq_completeness_pct"])  # placeholder
+    columns["record_hash"] = _compute_hashes(columns, rows)
+    return columns
+
+
+def _text_column(col: list, rows: int) -> list:
+    # Las columnas que repiten un mismo objeto (campos comunes rellenados con
+    # `[valor] * rows`) se formatean una sola vez
+    if rows and col[0] is col[-1] and len(set(map(id, col))) == 1:
+        return [str(col[0])] * rows
+    return list(map(str, col))
+
+
+def _compute_hashes(columns: Dict[str, list], rows: int) -> List[str]:
+    """`_compute_hash` de cada fila calculado directamente sobre las columnas.
+
+    Cada columna se convierte a texto una sola vez y cada fila se resume con un
+    único `sha256` sobre la concatenación, equivalente a los `update` sucesivos.
+    """
+    keys = _hash_keys(columns)
+    if not keys:
+        return [hashlib.sha256().hexdigest()] * rows
+    text_columns = [_text_column(columns[k], rows) for k in keys]
+    sha256 = hashlib.sha256
+    return [sha256("".join(parts).encode()).hexdigest() for parts in zip(*text_columns)]
+
+
+def _worker_context(table: str | None = None) -> tuple:
+    """Contexto del proceso padre que necesita cada trabajo en paralelo.
+
+    Los procesos del pool persisten entre llamadas (y con spawn no heredan nada),
+    así que tabla, contexto geográfico y rango de fechas viajan en cada trabajo.
+    """
+    start, end = faker_engine._CURRENT_DATE_RANGE_START, faker_engine._CURRENT_DATE_RANGE_END
+    date_range = (start.isoformat(), end.isoformat()) if start and end else (None, None)
+    table = table or getattr(faker_engine._TABLE_CONTEXT, "name", None)
+    return table, faker_engine.get_current_geographic_context(), date_range
+
+
+def _apply_worker_context(context: tuple, seed: int) -> None:
+    table, geo_context, date_range = context
+    faker_engine.set_geographic_context(geo_context)
+    faker_engine.set_date_range(*date_range)
+    set_table_context(table)
+    # El proceso puede venir de un trabajo anterior: Faker parte de la semilla del trabajo
+    faker_engine.seed_faker(seed)
+
+
+def _generate_chunk(job: tuple) -> List[Dict[str, Any]]:
+    domain, table, rows, seed, error_profile, context = job
+    _apply_worker_context(context, seed)
+    return generate(domain, table, rows, seed=seed, error_profile=error_profile)
+
+
+def generate_parallel(domain: str, table: str, rows: int, seed: int | None = None, error_profile: str = "none",
+                      workers: int | None = None, chunk_size: int = 50_000) -> List[Dict[str, Any]]:
+    """Generar una tabla grande repartiendo bloques de filas entre procesos.
+
+    Cada bloque usa una semilla propia derivada con `SeedSequence.spawn`, de modo
+    que los procesos no comparten estado aleatorio y el resultado es reproducible.
+    El contexto geográfico y el rango de fechas del proceso padre viajan en cada
+    bloque, igual que en `generate_columns_parallel`.
+    """
+    if rows <= chunk_size:
+        return generate(domain, table, rows, seed=seed, error_profile=error_profile)
+    sizes = [min(chunk_size, rows - offset) for offset in range(0, rows, chunk_size)]
+    children = np.random.SeedSequence(resolve_seed(seed)).spawn(len(sizes))
+    context = _worker_context(table)
+    jobs = [
+        (domain, table, size, int(child.generate_state(1)[0]), error_profile, context)
+        for size, child in zip(sizes, children)
+    ]
+    out: List[Dict[str, Any]] = []
+    for part in parallel_map(_generate_chunk, jobs, workers=workers or os.cpu_count() or 1):
+        out.extend(part)
     return out
+
+
+def _generate_column_group(job: tuple) -> Dict[str, Any]:
+    fields, rows, seed, context = job
+    _apply_worker_context(context, seed)
+    seed_random_pool(set_seed(seed))
+    return generate_columns(fields, rows)
+
+
+def generate_columns_parallel(fields: List[str], rows: int, seed: int | None = None, table: str | None = None,
+                              workers: int | None = None, min_fields_per_worker: int = 8) -> Dict[str, Any]:
+    """Generar columnas en paralelo repartiendo grupos de campos entre procesos.
+
+    Los generadores de columna son independientes entre sí; cada grupo recibe
+    una semilla propia derivada con `SeedSequence.spawn` y el contexto actual
+    (tabla, contexto geográfico y rango de fechas) del proceso padre.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(fields) // max(1, min_fields_per_worker)))
+    if workers == 1:
+        seed_random_pool(set_seed(seed))
+        if table:
+            set_table_context(table)
+        return generate_columns(fields, rows)
+    context = _worker_context(table)
+    groups = [fields[i::workers] for i in range(workers)]
+    children = np.random.SeedSequence(resolve_seed(seed)).spawn(workers)
+    jobs = [
+        (group, rows, int(child.generate_state(1)[0]), context)
+        for group, child in zip(groups, children)
+    ]
+    parts: Dict[str, Any] = {}
+    for part in parallel_map(_generate_column_group, jobs, workers=workers):
+        parts.update(part)
+    # Conservar el orden original de los campos
+    return {f: parts[f] for f in fields}
@@ -1,15 +1,18 @@
 """Foreign key manager stub."""
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, Iterable, Tuple
+
+_EMPTY: Tuple[str, ...] = ()
 
 class FKRegistry:
     def __init__(self):
-        self._keys: Dict[str, List[str]] = {}
+        self._keys: Dict[str, Tuple[str, ...]] = {}
 
-    def register(self, table: str, keys: List[str]):
-        self._keys[table] = keys
+    def register(self, table: str, keys: Iterable[str]):
+        # Tupla inmutable: `get` la devuelve tal cual, sin copias defensivas
+        self._keys[table] = tuple(keys)
 
-    def get(self, table: str) -> List[str]:
-        return self._keys.get(table, [])
+    def get(self, table: str) -> Tuple[str, ...]:
+        return self._keys.get(table, _EMPTY)
 
 REGISTRY = FKRegistry()
@@ -4,29 +4,67 @@ from datetime import datetime, timedelta, UTC
 from typing import Iterable, Dict, Any, List
 import random
 
+import numpy as np
+
+try:  # pragma: no cover
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None  # type: ignore
+
+# Campos que nunca se mutan al crear una nueva versión
+_SCD2_KEEP_FIELDS = frozenset({"id", "natural_key", "created_at_utc", "updated_at_utc", "record_hash"})
+
 def scd2_version_rows(base_rows: Iterable[Dict[str, Any]], change_prob: float = 0.1) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
+    append, rand = out.append, random.random
+    # Un único instante para toda la llamada: el cierre y la nueva versión son simultáneos
+    now_iso = datetime.now(UTC).isoformat()
     for r in base_rows:
-        current = r.copy()
-        current["valid_from_utc"] = datetime.now(UTC).isoformat()
-        current["valid_to_utc"] = None
-        current["is_active"] = True
-        out.append(current)
-        if random.random() < change_prob:
-            # Cerrar versión actual
-            current["is_active"] = False
-            current["valid_to_utc"] = datetime.now(UTC).isoformat()
-            # Nueva versión
-            new_version = current.copy()
-            new_version["is_active"] = True
-            new_version["valid_from_utc"] = datetime.now(UTC).isoformat()
-            new_version["valid_to_utc"] = None
-            # Intentar mutar un campo string no común
-            for field, value in list(new_version.items()):
-                if field in ("id","natural_key","created_at_utc","updated_at_utc","record_hash"):
-                    continue
-                if isinstance(value, str) and value and field.startswith("last_"):
-                    new_version[field] = value + "_v2"
-                    break
-            out.append(new_version)
+        if rand() >= change_prob:
+            append({**r, "valid_from_utc": now_iso, "valid_to_utc": None, "is_active": True})
+            continue
+        # Versión actual ya cerrada y nueva versión abierta
+        append({**r, "valid_from_utc": now_iso, "valid_to_utc": now_iso, "is_active": False})
+        new_version = {**r, "valid_from_utc": now_iso, "valid_to_utc": None, "is_active": True}
+        # Intentar mutar un campo string no común
+        for field in new_version:
+            if field in _SCD2_KEEP_FIELDS or not field.startswith("last_"):
+                continue
+            value = new_version[field]
+            if isinstance(value, str) and value:
+                new_version[field] = value + "_v2"
+                break
+        append(new_version)
     return out
+
+
+
+def scd2_version_frame(df: "pd.DataFrame", change_prob: float = 0.1) -> "pd.DataFrame":
+    """Versión por columnas de `scd2_version_rows` para un DataFrame.
+
+    Sortea de una vez qué filas cambian, cierra esas versiones y añade la nueva
+    versión justo detrás de cada una, en el mismo orden que la versión por filas.
+    """
+    if pd is None:
+        raise ImportError("pandas es necesario para scd2_version_frame")
+    now_iso = datetime.now(UTC).isoformat()
+    current = df.assign(valid_from_utc=now_iso, valid_to_utc=None, is_active=True).reset_index(drop=True)
+    rng = np.random.default_rng(random.getrandbits(64))
+    mask = rng.random(len(current)) < change_prob
+    current.loc[mask, "is_active"] = False
+    current.loc[mask, "valid_to_utc"] = now_iso
+    new = current[mask].assign(is_active=True, valid_from_utc=now_iso, valid_to_utc=None)
+    # Mutar en cada fila la primera columna last_* de texto no vacío
+    pending = np.ones(len(new), dtype=bool)
+    for col in new.columns:
+        if not col.startswith("last_") or col in _SCD2_KEEP_FIELDS:
+            continue
+        values = new[col]
+        hit = pending & np.fromiter((isinstance(v, str) and v != "" for v in values), dtype=bool, count=len(new))
+        if hit.any():
+            new.loc[hit, col] = values[hit] + "_v2"
+            pending &= ~hit
+    # Intercalar: cada versión nueva va inmediatamente después de la cerrada
+    order = np.concatenate([np.arange(len(current)) * 2, np.flatnonzero(mask) * 2 + 1])
+    out = pd.concat([current, new], ignore_index=True)
+    return out.iloc[np.argsort(order, kind="stable")].reset_index(drop=True)
@@ -13,6 +13,8 @@ from .geographic_contexts import (
     get_context_data,
     get_random_city,
     get_random_province,
+    sample_cities,
+    sample_provinces,
     get_phone_format,
     get_currency,
     get_contexts_by_region,
@@ -25,7 +27,9 @@ from .i18n import (
     translate_categorical_value,
     translate_schema_fields,
     translate_data_row,
+    translate_data_row_inplace,
     translate_complete_dataset,
+    translate_dataframe,
     get_available_languages,
     get_language_display_names,
     COLUMN_TRANSLATIONS,
@@ -40,6 +44,8 @@ __all__ = [
     "get_context_data", 
     "get_random_city",
     "get_random_province",
+    "sample_cities",
+    "sample_provinces",
     "get_phone_format",
     "get_currency",
     "get_contexts_by_region",
@@ -51,7 +57,9 @@ __all__ = [
     "translate_categorical_value",
     "translate_schema_fields",
     "translate_data_row",
+    "translate_data_row_inplace",
     "translate_complete_dataset",
+    "translate_dataframe",
     "get_available_languages",
     "get_language_display_names",
     "COLUMN_TRANSLATIONS",
@@ -2,9 +2,21 @@
 Sistema de Contextos Geográficos para Generación de Datos Sintéticos
 Soporta múltiples países y regiones con datos específicos locales
 """
+from __future__ import annotations
 from typing import Dict, List, Any
 import random
 
+import numpy as np
+
+# Generador para los muestreos por lote (las funciones escalares usan `random`)
+_RNG = np.random.default_rng()
+# Flujo propio derivado de la semilla global (distinto del de `distributions` y `geo`)
+_STREAM = 2
+
+def reseed(seed: int) -> None:
+    """Reiniciar el generador del módulo (lo invoca `set_seed`)"""
+    _RNG.bit_generator.state = np.random.PCG64([seed, _STREAM]).state
+
 # ===== CONTEXTOS GEOGRÁFICOS COMPLETOS =====
 
 GEOGRAPHIC_CONTEXTS: Dict[str, Dict[str, Any]] = {
@@ -272,6 +284,15 @@ GEOGRAPHIC_CONTEXTS: Dict[str, Dict[str, Any]] = {
 
 # ===== FUNCIONES DE UTILIDAD =====
 
+# Las listas de cada contexto son datos fijos: se congelan como tuplas (sin
+# holgura de redimensionado) y se indexan por contexto para el camino caliente
+for _data in GEOGRAPHIC_CONTEXTS.values():
+    for _key, _value in _data.items():
+        if isinstance(_value, list):
+            _data[_key] = tuple(_value)
+_CITIES_BY_CTX: Dict[str, tuple] = {name: data["cities"] for name, data in GEOGRAPHIC_CONTEXTS.items()}
+_PROVINCES_BY_CTX: Dict[str, tuple] = {name: data.get("provinces", ()) for name, data in GEOGRAPHIC_CONTEXTS.items()}
+
 def get_available_contexts() -> List[str]:
     """Obtener lista de contextos geográficos disponibles"""
     return list(GEOGRAPHIC_CONTEXTS.keys())
@@ -282,16 +303,29 @@ def get_context_data(context_name: str) -> Dict[str, Any]:
 
 def get_random_city(context_name: str = "global") -> str:
     """Obtener ciudad aleatoria del contexto especificado"""
-    context = get_context_data(context_name)
-    return random.choice(context["cities"])
+    return random.choice(_CITIES_BY_CTX.get(context_name, _CITIES_BY_CTX["global"]))
 
 def get_random_province(context_name: str = "global") -> str:
     """Obtener provincia/estado aleatorio del contexto especificado"""
-    context = get_context_data(context_name)
-    if "provinces" in context:
-        return random.choice(context["provinces"])
+    provinces = _PROVINCES_BY_CTX.get(context_name, _PROVINCES_BY_CTX["global"])
+    if provinces:
+        return random.choice(provinces)
     return "N/A"
 
+def sample_cities(context_name: str = "global", n: int = 1, rng: np.random.Generator | None = None) -> List[str]:
+    """Obtener `n` ciudades aleatorias del contexto con un solo sorteo"""
+    cities = _CITIES_BY_CTX.get(context_name, _CITIES_BY_CTX["global"])
+    idx = (rng or _RNG).integers(0, len(cities), size=n)
+    return [cities[i] for i in idx.tolist()]
+
+def sample_provinces(context_name: str = "global", n: int = 1, rng: np.random.Generator | None = None) -> List[str]:
+    """Obtener `n` provincias/estados aleatorios del contexto con un solo sorteo"""
+    provinces = _PROVINCES_BY_CTX.get(context_name, _PROVINCES_BY_CTX["global"])
+    if not provinces:
+        return ["N/A"] * n
+    idx = (rng or _RNG).integers(0, len(provinces), size=n)
+    return [provinces[i] for i in idx.tolist()]
+
 def get_phone_format(context_name: str = "global") -> str:
     """Obtener formato de teléfono del contexto especificado"""
     context = get_context_data(context_name)
@@ -302,12 +336,14 @@ def get_currency(context_name: str = "global") -> str:
     context = get_context_data(context_name)
     return context.get("currency", "USD")
 
+# Índice región (en minúsculas) -> contextos, construido una vez al importar
+_BY_REGION: Dict[str, List[str]] = {}
+for _name, _data in GEOGRAPHIC_CONTEXTS.items():
+    _BY_REGION.setdefault(_data.get("region", "").lower(), []).append(_name)
+
 def get_contexts_by_region(region: str) -> List[str]:
     """Obtener contextos de una región específica"""
-    return [
-        name for name, data in GEOGRAPHIC_CONTEXTS.items()
-        if data.get("region", "").lower() == region.lower()
-    ]
+    return list(_BY_REGION.get(region.lower(), ()))
 
 # ===== CONFIGURACIÓN REGIONAL =====
 
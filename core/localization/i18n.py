@@ -2,8 +2,15 @@
 Sistema de Internacionalización (i18n) para Nombres de Columnas y Tablas
 Soporta traducción de esquemas completos al español
 """
-from typing import Dict, List, Any
-import copy
+from __future__ import annotations
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any
+
+try:  # pragma: no cover
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None  # type: ignore
 
 # ===== TRADUCCIONES DE COLUMNAS =====
 
@@ -326,58 +333,154 @@ CATEGORICAL_VALUE_TRANSLATIONS = {
     "Post": "Publicación"
 }
 
+# Los diccionarios de traducción son de solo lectura: una mutación accidental
+# invalidaría las traducciones ya cacheadas. Los `get` de los dicts originales
+# se conservan para el camino caliente.
+_COLUMN_GET = COLUMN_TRANSLATIONS.get
+_TABLE_GET = TABLE_TRANSLATIONS.get
+_CATEGORICAL_GET = CATEGORICAL_VALUE_TRANSLATIONS.get
+COLUMN_TRANSLATIONS = MappingProxyType(COLUMN_TRANSLATIONS)
+TABLE_TRANSLATIONS = MappingProxyType(TABLE_TRANSLATIONS)
+CATEGORICAL_VALUE_TRANSLATIONS = MappingProxyType(CATEGORICAL_VALUE_TRANSLATIONS)
+
 # ===== FUNCIONES DE TRADUCCIÓN =====
 
 def translate_column_name(column_name: str, target_language: str = "es") -> str:
     """Traducir nombre de columna al idioma objetivo"""
     if target_language == "es":
-        return COLUMN_TRANSLATIONS.get(column_name, column_name)
+        return _COLUMN_GET(column_name, column_name)
     return column_name
 
 def translate_table_name(table_name: str, target_language: str = "es") -> str:
     """Traducir nombre de tabla al idioma objetivo"""
     if target_language == "es":
-        return TABLE_TRANSLATIONS.get(table_name, table_name)
+        return _TABLE_GET(table_name, table_name)
     return table_name
 
 def translate_categorical_value(value: str, target_language: str = "es") -> str:
     """Traducir valor categórico al idioma objetivo"""
     if target_language == "es" and isinstance(value, str):
-        return CATEGORICAL_VALUE_TRANSLATIONS.get(value, value)
+        return _CATEGORICAL_GET(value, value)
     return value
 
+@lru_cache(maxsize=256)
+def _translate_keyset(keys: tuple, target_language: str) -> tuple:
+    """Nombres de columna traducidos para un conjunto de claves (una vez por esquema)"""
+    return tuple(translate_column_name(key, target_language) for key in keys)
+
 def translate_schema_fields(fields: List[str], target_language: str = "es") -> List[str]:
     """Traducir lista completa de campos de esquema"""
     if target_language == "es":
-        return [translate_column_name(field, target_language) for field in fields]
+        return list(_translate_keyset(tuple(fields), target_language))
     return fields
 
+@lru_cache(maxsize=128)
+def _row_translator(keys: tuple, target_language: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Compilar, por conjunto de claves, una función que traduce una fila.
+
+    La función devuelve un literal de diccionario con las claves ya traducidas
+    y solo busca en la tabla de valores los campos que llegan como texto
+    (`type(v) is str` primero; `isinstance` solo para subclases como np.str_).
+    """
+    items = ", ".join(
+        f"{new_key!r}: (cat(v, v) if type(v := row[{key!r}]) is str or isinstance(v, str) else v)"
+        for key, new_key in zip(keys, _translate_keyset(keys, target_language))
+    )
+    source = f"def _translate(row, cat=cat, isinstance=isinstance):\n    return {{{items}}}\n"
+    namespace: Dict[str, Any] = {"cat": _CATEGORICAL_GET}
+    exec(compile(source, "<row_translator>", "exec"), namespace)
+    return namespace["_translate"]
+
 def translate_data_row(row: Dict[str, Any], target_language: str = "es") -> Dict[str, Any]:
     """Traducir una fila de datos completa (nombres de columnas y valores categóricos)"""
     if target_language != "es":
         return row
-        
-    translated_row = {}
-    for key, value in row.items():
-        # Traducir nombre de columna
-        new_key = translate_column_name(key, target_language)
-        
-        # Traducir valor si es categórico string
-        if isinstance(value, str):
-            new_value = translate_categorical_value(value, target_language)
+    return _row_translator(tuple(row), target_language)(row)
+
+@lru_cache(maxsize=128)
+def _inplace_plan(keys: tuple, target_language: str) -> tuple:
+    """(claves traducidas, índice de la primera renombrada) o None si renombrar
+    en el sitio pisaría otra clave original"""
+    new_keys = _translate_keyset(keys, target_language)
+    originals = set(keys)
+    first = len(keys)
+    for i, (key, new_key) in enumerate(zip(keys, new_keys)):
+        if new_key != key:
+            if new_key in originals:
+                return None
+            first = min(first, i)
+    return new_keys, first
+
+def translate_data_row_inplace(row: Dict[str, Any], target_language: str = "es") -> Dict[str, Any]:
+    """Como `translate_data_row`, pero modificando la fila recibida.
+
+    Desde la primera clave renombrada se reinsertan las claves en orden, así que
+    el resultado conserva el orden de columnas sin crear un segundo diccionario.
+    """
+    if target_language != "es":
+        return row
+    keys = tuple(row)
+    plan = _inplace_plan(keys, target_language)
+    if plan is None:
+        translated = translate_data_row(row, target_language)
+        row.clear()
+        row.update(translated)
+        return row
+    new_keys, first = plan
+    cat = _CATEGORICAL_GET
+    for i, (key, new_key) in enumerate(zip(keys, new_keys)):
+        if i < first:
+            value = row[key]
+            if isinstance(value, str):
+                row[key] = cat(value, value)
         else:
-            new_value = value
-            
-        translated_row[new_key] = new_value
-    
-    return translated_row
+            value = row.pop(key)
+            row[new_key] = cat(value, value) if isinstance(value, str) else value
+    return row
 
 def translate_complete_dataset(data: List[Dict[str, Any]], target_language: str = "es") -> List[Dict[str, Any]]:
-    """Traducir dataset completo (todos los registros)"""
+    """Traducir dataset completo (todos los registros o un DataFrame)"""
     if target_language != "es":
         return data
-        
-    return [translate_data_row(row, target_language) for row in data]
+    if pd is not None and isinstance(data, pd.DataFrame):
+        return translate_dataframe(data, target_language)
+
+    # Las filas de un dataset suelen compartir claves: el traductor compilado
+    # se resuelve una vez por conjunto de claves
+    out: List[Dict[str, Any]] = []
+    last_keys: tuple | None = None
+    translate = None
+    for row in data:
+        keys = tuple(row)
+        if keys != last_keys:
+            last_keys, translate = keys, _row_translator(keys, target_language)
+        out.append(translate(row))
+    return out
+
+def translate_dataframe(df: Any, target_language: str = "es") -> Any:
+    """Traducir un DataFrame por columnas: cada valor único se traduce una sola vez
+
+    Equivale a `translate_complete_dataset` sobre las filas, pero el trabajo es
+    proporcional a los valores distintos de cada columna y no al número de filas.
+    """
+    if target_language != "es":
+        return df
+    out = df.rename(columns=lambda c: translate_column_name(c, target_language))
+    if out.columns.duplicated().any():
+        # Igual que translate_data_row: si dos columnas se traducen igual, gana la última
+        out = out.loc[:, ~out.columns.duplicated(keep="last")]
+    for column in out.columns:
+        values = out[column]
+        if values.dtype.kind != "O":
+            continue
+        changed = {}
+        for value in values.dropna().unique():
+            translated = translate_categorical_value(value, target_language)
+            if translated != value:
+                changed[value] = translated
+        if changed:
+            out[column] = values.replace(changed)
+    return out
 
 def get_available_languages() -> List[str]:
     """Obtener lista de idiomas disponibles"""
@@ -1,6 +1,10 @@
 """Generación multi-tabla sencilla con soporte opcional SCD2 para tabla primaria."""
 from __future__ import annotations
+from itertools import repeat
 from typing import Dict, Any, List, Tuple
+
+import numpy as np
+
 from core.generators import generate
 from core.integrity.scd2 import scd2_version_rows
 
@@ -11,10 +15,11 @@ def generate_two_tables(primary: Tuple[str,str,str], secondary: Tuple[str,str,st
     if scd2:
         prim = scd2_version_rows(prim)
     # crear índice de ids primarios
-    prim_ids = [r["id"] for r in prim if r.get("id") is not None]
+    prim_ids = [v for v in map(dict.get, prim, repeat("id")) if v is not None]
     sec = generate(s_domain, s_table, secondary_rows, error_profile=error_profile)
-    # asignar FK simple round-robin
-    for i, r in enumerate(sec):
-        if prim_ids:
-            r[s_ref_field] = prim_ids[i % len(prim_ids)]
+    # asignar FK simple round-robin (gather vectorizado de ids)
+    if prim_ids and sec:
+        fks = np.asarray(prim_ids, dtype=object)[np.arange(len(sec)) % len(prim_ids)].tolist()
+        for r, fk in zip(sec, fks):
+            r[s_ref_field] = fk
     return {p_table: prim, s_table: sec}
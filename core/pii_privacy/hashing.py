@@ -1,10 +1,35 @@
 """PII hashing stub."""
 from __future__ import annotations
 import hashlib, os
+from functools import lru_cache
+from typing import Iterable, List
+
+
+@lru_cache(maxsize=8)
+def _primed_hasher(salt_env: str):
+    # La sal se lee del entorno una vez por variable; cada valor parte de una
+    # copia del SHA-256 que ya la procesó (reset_salt_cache() si cambia)
+    return hashlib.sha256(os.getenv(salt_env, "default_salt").encode())
+
+def reset_salt_cache() -> None:
+    """Volver a leer las sales del entorno en la próxima llamada"""
+    _primed_hasher.cache_clear()
+
+def hash_value_bytes(value: str, salt_env: str = "SYNTHE_PII_SALT") -> bytes:
+    """Digest SHA-256 crudo (32 bytes) para columnas binarias (BLOB/bytea/Parquet)"""
+    h = _primed_hasher(salt_env).copy()
+    h.update((value if isinstance(value, str) else str(value)).encode())
+    return h.digest()
 
 def hash_value(value: str, salt_env: str = "SYNTHE_PII_SALT") -> str:
-    salt = os.getenv(salt_env, "default_salt")
-    h = hashlib.sha256()
-    h.update(salt.encode())
-    h.update(str(value).encode())
-    return h.hexdigest()
+    return hash_value_bytes(value, salt_env).hex()
+
+def hash_values(values: Iterable[str], salt_env: str = "SYNTHE_PII_SALT") -> List[str]:
+    """`hash_value` para una columna completa, leyendo la sal una sola vez"""
+    copy = _primed_hasher(salt_env).copy
+    out: List[str] = []
+    for value in values:
+        h = copy()
+        h.update((value if isinstance(value, str) else str(value)).encode())
+        out.append(h.hexdigest())
+    return out
@@ -1,17 +1,84 @@
 """PII tagging stub."""
 from __future__ import annotations
-from typing import Dict
+from typing import Any, Callable, List, Tuple
 import re
 
-_PATTERNS = {
-    "email": re.compile(r"@"),
-    "phone": re.compile(r"\d{7,}"),
+import numpy as np
+
+try:  # pragma: no cover
+    import re2
+except ImportError:  # pragma: no cover
+    re2 = None  # type: ignore
+
+try:  # pragma: no cover
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = pc = None  # type: ignore
+
+# Orden = prioridad: si varios patrones coinciden gana el primero
+_PATTERN_SOURCES = {
+    "email": r"@",
+    "phone": r"\d{7,}",
 }
 
+_PATTERNS = {tag: re.compile(src) for tag, src in _PATTERN_SOURCES.items()}
+
+def _matcher(src: str, pattern: re.Pattern) -> Callable[[str], Any]:
+    # Los patrones sin metacaracteres se resuelven con `in` (búsqueda de
+    # subcadena en C) sin pasar por el motor de expresiones regulares
+    if re.escape(src) == src:
+        return lambda value: src in value
+    return pattern.search
+
+# Sin re2: matchers precompilados en orden de prioridad
+_MATCHERS: List[Tuple[str, Callable[[str], Any]]] = [
+    (tag, _matcher(_PATTERN_SOURCES[tag], pattern)) for tag, pattern in _PATTERNS.items()
+]
+
+_SET = None
+_ID_TO_TAG: list = []
+if re2 is not None:
+    # Todos los patrones en un único autómata RE2: una sola pasada por valor
+    _SET = re2.Set.SearchSet()
+    for _tag, _src in _PATTERN_SOURCES.items():
+        _SET.Add(_src)
+        _ID_TO_TAG.append(_tag)
+    _SET.Compile()
+
 def tag_field(name: str, sample_value: str | None) -> str | None:
     if sample_value is None:
         return None
-    for tag, pattern in _PATTERNS.items():
-        if pattern.search(sample_value):
+    if _SET is not None:
+        matches = _SET.Match(sample_value)
+        return _ID_TO_TAG[min(matches)] if matches else None
+    for tag, match in _MATCHERS:
+        if match(sample_value):
             return tag
     return None
+
+def tag_column(values: Any) -> "pa.Array":
+    """`tag_field` para una columna completa (`pa.Array`, `pd.Series` o lista).
+
+    Cada patrón se evalúa con los kernels de cadenas de Arrow sobre las filas
+    que siguen sin etiqueta, respetando la misma prioridad que `tag_field`.
+    """
+    if pa is None:
+        raise ImportError("pyarrow es necesario para tag_column")
+    arr = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values, from_pandas=True)
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        arr = arr.cast(pa.string())
+    out = np.full(len(arr), None, dtype=object)
+    pending = np.arange(len(arr))
+    for tag, src in _PATTERN_SOURCES.items():
+        if not len(pending):
+            break
+        sub = arr if len(pending) == len(arr) else arr.take(pending)
+        if re.escape(src) == src:
+            hits = pc.match_substring(sub, src)
+        else:
+            hits = pc.match_substring_regex(sub, src)
+        hits = hits.fill_null(False).to_numpy(zero_copy_only=False)
+        out[pending[hits]] = tag
+        pending = pending[~hits]
+    return pa.array(out, type=pa.string())
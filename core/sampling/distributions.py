@@ -3,11 +3,20 @@ from __future__ import annotations
 import numpy as np
 from typing import Sequence
 
+_RNG = np.random.default_rng()
+
+
+def reseed(seed: int) -> None:
+    """Reiniciar el generador del módulo (lo invoca `set_seed`)"""
+    _RNG.bit_generator.state = np.random.PCG64(seed).state
+
 
 def normal(mean: float, std: float, n: int) -> Sequence[float]:
-    return np.random.normal(mean, std, size=n)
+    return _RNG.normal(mean, std, size=n)
 
 
-def categorical(choices: Sequence[str], n: int):
-    import random
-    return [random.choice(choices) for _ in range(n)]
+def categorical(choices: Sequence[str], n: int) -> np.ndarray:
+    # Índices en un solo bucle en C y gather vectorizado; arreglo 1-D de objetos
+    # que conserva los valores originales (str de Python, tuplas, ...)
+    pool = np.fromiter(choices, dtype=object, count=len(choices))
+    return pool[_RNG.integers(0, len(pool), size=n)]
@@ -1,8 +1,22 @@
 """Time pattern sampling stub."""
 from __future__ import annotations
+from functools import lru_cache
 import numpy as np
 
 
+@lru_cache(maxsize=32)
+def _seasonality_table(days: int) -> np.ndarray:
+    # (sin(2π·i/7) + 1) / 2 en un único buffer, sin temporales intermedios
+    table = np.arange(days, dtype=np.float64)
+    table *= 2 * np.pi / 7
+    np.sin(table, out=table)
+    table += 1
+    table *= 0.5
+    # Compartida entre llamadas: de solo lectura para que nadie la altere
+    table.setflags(write=False)
+    return table
+
+
 def daily_seasonality(days: int = 30):
-    idx = np.arange(days)
-    return (np.sin(idx / 7 * 2 * np.pi) + 1) / 2
+    """Factor estacional semanal en [0, 1] (arreglo cacheado de solo lectura)"""
+    return _seasonality_table(days)
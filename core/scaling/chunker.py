@@ -1,8 +1,21 @@
 """Chunking stub."""
 from __future__ import annotations
-from typing import Iterator, Callable, Any
+from typing import Iterator, Callable, Any, Mapping, Sequence
 
-def chunk_generator(total: int, chunk_size: int, factory: Callable[[int, int], list[dict]]) -> Iterator[list[dict]]:
+try:  # pragma: no cover
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+
+# Un bloque puede ser filas (list[dict]) o columnar: dict de arrays o RecordBatch,
+# listo para `write_columns` sin pasar por diccionarios por fila
+
+
+def chunk_generator(
+    total: int,
+    chunk_size: int,
+    factory: Callable[[int, int], list[dict] | Mapping[str, Sequence[Any]] | pa.RecordBatch],
+) -> Iterator[list[dict] | Mapping[str, Sequence[Any]] | pa.RecordBatch]:
     offset = 0
     while offset < total:
         size = min(chunk_size, total - offset)
@@ -0,0 +1,37 @@
+"""Columnar helpers: list-of-dicts <-> DataFrame without losing Python types."""
+from __future__ import annotations
+from typing import Any, Dict, List, Sequence, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+def _column_array(values: List[Any]):
+    arr = pd.array(values)
+    # Enteros y floats mezclados: pd.array los pasaría todos a Float64 (2 -> 2.0)
+    if arr.dtype.kind == "f" and any(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values):
+        return pd.array(values, dtype=object)
+    return arr
+
+
+def records_to_frame(rows: Sequence[Mapping[str, Any]]) -> pd.DataFrame:
+    """Construir un DataFrame columna a columna con dtypes que admiten nulos.
+
+    Las columnas homogéneas usan dtypes nullable (enteros con faltantes quedan
+    Int64, no float64); las que mezclan enteros y floats quedan como `object`, de
+    modo que `frame_to_records` devuelve los mismos valores de Python generados.
+    """
+    if not rows:
+        return pd.DataFrame()
+    columns: Dict[str, Any] = {}
+    for name in rows[0]:
+        columns[name] = _column_array([r.get(name) for r in rows])
+    return pd.DataFrame(columns)
+
+
+def frame_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convertir un DataFrame de vuelta a lista de diccionarios con None en los faltantes."""
+    if df.empty:
+        return []
+    obj = df.astype(object)
+    return obj.where(df.notna(), None).to_dict(orient="records")
@@ -1,9 +1,9 @@
 """FX utils stub."""
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Tuple
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FXRate:
     base: str
     quote: str
@@ -11,8 +11,12 @@ class FXRate:
 
 _SAMPLE = {"USD": 1.0, "EUR": 1.08, "MXN": 18.0, "COP": 4000.0}
 
+# Matriz de cruces precalculada; las instancias son inmutables y se comparten
+_MATRIX: Dict[Tuple[str, str], float] = {(b, q): _SAMPLE[q] / _SAMPLE[b] for b in _SAMPLE for q in _SAMPLE}
+_FXRATE_CACHE: Dict[Tuple[str, str], FXRate] = {k: FXRate(k[0], k[1], v) for k, v in _MATRIX.items()}
+
 def get_fx_rate(base: str, quote: str) -> FXRate:
-    if base not in _SAMPLE or quote not in _SAMPLE:
-        raise ValueError("Moneda no soportada en stub")
-    rate = _SAMPLE[quote] / _SAMPLE[base]
-    return FXRate(base=base, quote=quote, rate=rate)
+    try:
+        return _FXRATE_CACHE[(base, quote)]
+    except KeyError:
+        raise ValueError("Moneda no soportada en stub") from None
@@ -1,7 +1,9 @@
 """Geo utils stub."""
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
+
+import numpy as np
 
 @dataclass
 class City:
@@ -16,6 +18,27 @@ _SAMPLE: List[City] = [
     City(country="US", region="CA", name="San Francisco", lat=37.7749, lon=-122.4194),
 ]
 
+# Las mismas ciudades en columnas (una por atributo) para muestrear en bloque
+_COLUMNS: Dict[str, np.ndarray] = {
+    "country": np.array([c.country for c in _SAMPLE], dtype=object),
+    "region": np.array([c.region for c in _SAMPLE], dtype=object),
+    "name": np.array([c.name for c in _SAMPLE], dtype=object),
+    "lat": np.array([c.lat for c in _SAMPLE], dtype=np.float64),
+    "lon": np.array([c.lon for c in _SAMPLE], dtype=np.float64),
+}
+_RNG = np.random.default_rng()
+# Flujo propio derivado de la semilla global (distinto del de `distributions`)
+_STREAM = 1
+
+def reseed(seed: int) -> None:
+    """Reiniciar el generador del módulo (lo invoca `set_seed`)"""
+    _RNG.bit_generator.state = np.random.PCG64([seed, _STREAM]).state
+
 def sample_city() -> City:
     import random
     return random.choice(_SAMPLE)
+
+def sample_cities(n: int, rng: np.random.Generator | None = None) -> Dict[str, np.ndarray]:
+    """`n` ciudades al azar como columnas `{atributo: arreglo}` (un índice por fila)"""
+    idx = (rng or _RNG).integers(0, len(_SAMPLE), size=n)
+    return {k: col[idx] for k, col in _COLUMNS.items()}
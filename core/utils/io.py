@@ -1,15 +1,50 @@
 """IO helpers stub."""
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Tuple
 import json
 
+try:  # pragma: no cover
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 def write_json(data: Any, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        try:
+            # Bytes UTF-8 directamente, sin pasar por str
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        except orjson.JSONEncodeError:  # enteros > 64 bits, tipos no soportados: json estándar
+            pass
     path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
 
 
 def write_text(text: str, path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(text)
+
+
+def _write_one(item: Tuple[Path, "str | bytes"]) -> None:
+    path, data = item
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, bytes):
+        path.write_bytes(data)
+    else:
+        path.write_text(data)
+
+
+def write_many(items: Iterable[Tuple[Path, "str | bytes"]], workers: int = 8) -> None:
+    """Escribir muchos archivos pequeños `(ruta, contenido)` solapando las llamadas
+    al sistema en un pool de hilos (la E/S libera el GIL)"""
+    items = list(items)
+    if len(items) <= 1 or workers <= 1:
+        for item in items:
+            _write_one(item)
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as ex:
+        # list() para propagar la primera excepción de escritura
+        list(ex.map(_write_one, items))
@@ -1,18 +1,86 @@
 """Schema loading and resolution utilities."""
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
+import json
+import logging
+import tempfile
 import yaml
 
+try:  # pragma: no cover
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _Loader
+
+logger = logging.getLogger(__name__)
+if _Loader is yaml.SafeLoader:  # pragma: no cover
+    logger.warning("PyYAML sin libyaml: los esquemas se parsean con el cargador en Python puro (más lento)")
+
+try:  # pragma: no cover
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 SCHEMAS_ROOT = Path("schemas")
 _COMMON_FILE = SCHEMAS_ROOT / "_common.yml"
 
 class SchemaError(Exception):
     pass
 
+def _sidecar_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".cache.json")
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _json_dumps(data: Any) -> bytes:
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+
+def _write_sidecar(cache: Path, source: "tuple[int, int]", data: Any) -> None:
+    # Solo si JSON reproduce el YAML tal cual (sin fechas ni claves no str)
+    try:
+        if _json_loads(_json_dumps(data)) != data:
+            return
+        raw = _json_dumps({"source": list(source), "data": data})
+        # Temporal propio por escritor: los workers del pool pueden regenerar
+        # el mismo sidecar a la vez sin pisarse el archivo antes del `replace`
+        with tempfile.NamedTemporaryFile(dir=cache.parent, prefix=cache.name + ".", suffix=".tmp", delete=False) as fh:
+            tmp = Path(fh.name)
+            fh.write(raw)
+        try:
+            tmp.replace(cache)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError):  # directorio de solo lectura o datos no serializables
+        pass
+
+@lru_cache(maxsize=256)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # Sidecar `<archivo>.yml.cache.json`: json.loads es mucho más rápido que
+    # el parser YAML en el arranque en frío. Guarda el (mtime, tamaño) del YAML
+    # del que salió y solo vale si coincide exactamente: un YAML restaurado con
+    # un mtime anterior (`cp -p`, `rsync -a`, tar) no sirve datos obsoletos
+    path = Path(path_str)
+    cache = _sidecar_path(path)
+    try:
+        cached = _json_loads(cache.read_bytes())
+        if isinstance(cached, dict) and cached.get("source") == [mtime_ns, size]:
+            return cached["data"]
+    except (OSError, ValueError, KeyError):  # sin sidecar o ilegible: se vuelve a parsear el YAML
+        pass
+    # Bytes directos: libyaml decodifica UTF-8 internamente, sin str intermedio
+    data = yaml.load(path.read_bytes(), Loader=_Loader)
+    _write_sidecar(cache, (mtime_ns, size), data)
+    return data
+
 def _load_yaml(path: Path) -> Any:
+    # Se parsea una vez por versión del archivo (mtime y tamaño); el objeto
+    # devuelto es compartido entre llamadas, así que no debe modificarse
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8"))
+        st = path.stat()
+        return _load_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
     except FileNotFoundError as e:  # pragma: no cover
         raise SchemaError(f"Archivo no encontrado: {path}") from e
 
@@ -23,7 +91,25 @@ def load_common_fields() -> List[str]:
 _DEF_CACHE: Dict[str, Any] = {}
 
 
+_DOMAINS_CACHE: "tuple[tuple, Dict[str, List[str]]] | None" = None
+
+
+def _schemas_signature() -> tuple:
+    # Rutas y mtimes de todos los YAML: detecta archivos editados, nuevos y borrados
+    return tuple(sorted((str(p), p.stat().st_mtime_ns) for p in SCHEMAS_ROOT.rglob("*.yml")))
+
+
 def list_domains() -> Dict[str, List[str]]:
+    """Mapa dominio → tablas, reconstruido solo cuando cambia algún YAML del árbol"""
+    global _DOMAINS_CACHE
+    signature = _schemas_signature() if SCHEMAS_ROOT.exists() else ()
+    if _DOMAINS_CACHE is None or _DOMAINS_CACHE[0] != signature:
+        _DOMAINS_CACHE = (signature, _scan_domains())
+    # Copias: quien llama puede modificar el resultado sin tocar la caché
+    return {domain: list(tables) for domain, tables in _DOMAINS_CACHE[1].items()}
+
+
+def _scan_domains() -> Dict[str, List[str]]:
     result: Dict[str, List[str]] = {}
     if SCHEMAS_ROOT.exists():
         for domain_dir in SCHEMAS_ROOT.iterdir():
@@ -7,10 +7,20 @@ import numpy as np
 
 _DEFAULT_ENV = "SYNTHE_SEED"
 
-def set_seed(seed: Optional[int] = None) -> int:
+def resolve_seed(seed: Optional[int] = None) -> int:
     if seed is None:
         env_val = os.getenv(_DEFAULT_ENV)
         seed = int(env_val) if env_val is not None else 42
+    return seed
+
+def set_seed(seed: Optional[int] = None) -> int:
+    seed = resolve_seed(seed)
     random.seed(seed)
     np.random.seed(seed)
+    from core.sampling import distributions  # local import
+    from core.utils import geo  # local import
+    from core.localization import geographic_contexts  # local import
+    distributions.reseed(seed)
+    geo.reseed(seed)
+    geographic_contexts.reseed(seed)
     return seed
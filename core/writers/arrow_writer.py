@@ -14,7 +14,14 @@ except Exception:  # pragma: no cover
 def write_rows(path: Path, rows: Sequence[Mapping[str, Any]]):
     if not rows or pa is None or feather is None:
         return
+    # Columnas tomadas de la primera fila (igual que from_pylist) y una sola
+    # construcción de la tabla, sin RecordBatch intermedio
+    write_columns(path, {k: [r.get(k) for r in rows] for k in rows[0]})
+
+
+def write_columns(path: Path, columns: Mapping[str, Sequence[Any]]):
+    """Escribir un bloque columnar (`{columna: arreglo}`) sin pasar por filas"""
+    if not columns or pa is None or feather is None:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    batch = pa.RecordBatch.from_pylist(list(rows))
-    table = pa.Table.from_batches([batch])
-    feather.write_feather(table, path)
+    feather.write_feather(pa.Table.from_pydict(dict(columns)), path, compression="lz4")
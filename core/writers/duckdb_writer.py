@@ -1,24 +1,114 @@
 """DuckDB writer stub."""
 from __future__ import annotations
+import atexit
+import threading
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Sequence, Mapping, Any
+from typing import Dict, Iterator, Sequence, Mapping, Any, Tuple
 
 try:  # pragma: no cover
     import duckdb
 except Exception:  # pragma: no cover
     duckdb = None  # type: ignore
 
+from .parquet_writer import pa, rows_to_table
+
+
+# Conexiones abiertas con `connection()`: ruta -> (conexión, candado)
+_CONS: Dict[str, Tuple[Any, threading.Lock]] = {}
+_CONS_LOCK = threading.Lock()
+
+
+@contextmanager
+def connection(db_path: Path) -> Iterator[Any]:
+    """Mantener abierta la conexión a `db_path` mientras dure el bloque.
+
+    Dentro del bloque `write_rows` reutiliza esa conexión en lugar de abrir y
+    cerrar una por lote; al salir se cierra y el archivo queda libre para otros
+    procesos.
+
+        with duckdb_writer.connection(db_path):
+            for rows in chunks:
+                duckdb_writer.write_rows(db_path, "ventas", rows)
+    """
+    if duckdb is None:
+        raise ImportError("duckdb es necesario para duckdb_writer.connection")
+    key = str(db_path)
+    with _CONS_LOCK:
+        owner = key not in _CONS
+        if owner:
+            _CONS[key] = (duckdb.connect(key), threading.Lock())
+        con = _CONS[key][0]
+    try:
+        yield con
+    finally:
+        if owner:
+            close_connection(db_path)
+
+
+def close_connection(db_path: Path) -> None:
+    """Cerrar (y olvidar) la conexión cacheada de `db_path`, si existe"""
+    with _CONS_LOCK:
+        entry = _CONS.pop(str(db_path), None)
+    if entry is not None:
+        con, lock = entry
+        with lock:
+            con.close()
+
+
+def close_connections() -> None:
+    """Cerrar todas las conexiones cacheadas (también al salir del intérprete)"""
+    with _CONS_LOCK:
+        paths = list(_CONS)
+    for path in paths:
+        close_connection(Path(path))
+
+
+atexit.register(close_connections)
+
+
+def _as_relation_source(rows: Sequence[Mapping[str, Any]]):
+    # DuckDB lee tablas Arrow sin copiar; pandas solo como respaldo sin pyarrow
+    if pa is not None:
+        return rows_to_table(rows)
+    import pandas as pd  # local import
+    return pd.DataFrame(rows)
+
+
+def _insert(con, table: str, data) -> None:
+    # Nombre de vista único por llamada: escritores concurrentes no se pisan
+    view = f"_rows_{uuid.uuid4().hex}"
+    con.register(view, data)
+    try:
+        exists = con.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_name = ?", [table]
+        ).fetchone()
+        if exists:
+            con.execute(f"INSERT INTO {table} SELECT * FROM {view};")
+        else:
+            con.execute(f"CREATE TABLE {table} AS SELECT * FROM {view};")
+    finally:
+        con.unregister(view)
+
 
 def write_rows(db_path: Path, table: str, rows: Sequence[Mapping[str, Any]]):
     if duckdb is None or not rows:
         return
     db_path.parent.mkdir(parents=True, exist_ok=True)
+    data = _as_relation_source(rows)
+    with _CONS_LOCK:
+        entry = _CONS.get(str(db_path))
+    if entry is not None:
+        con, lock = entry
+        with lock:
+            # Puede haberse cerrado entre la consulta y el candado
+            if _CONS.get(str(db_path)) is entry:
+                _insert(con, table, data)
+                return
+    # Sin `connection()` activa: conexión propia que se cierra al terminar
     con = duckdb.connect(str(db_path))
     try:
-        import pandas as pd  # local import
-        df = pd.DataFrame(rows)
-        con.register("tmp", df)
-        con.execute(f"CREATE TABLE IF NOT EXISTS {table} AS SELECT * FROM tmp LIMIT 0;")
-        con.execute(f"INSERT INTO {table} SELECT * FROM tmp;")
+        _insert(con, table, data)
     finally:
         con.close()
@@ -1,17 +1,219 @@
 """Parquet writer stub."""
 from __future__ import annotations
 from pathlib import Path
-from typing import Sequence, Mapping, Any
+from typing import Sequence, Mapping, Any, List, Optional
 
 try:  # pragma: no cover
     import pandas as pd
 except ImportError:  # pragma: no cover
     pd = None  # type: ignore
 
+try:  # pragma: no cover
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+# Row groups grandes (~1M filas) evitan millones de grupos en tablas de hechos
+ROW_GROUP_SIZE = 1_000_000
+# Columnas de baja cardinalidad que se codifican con diccionario
+DICTIONARY_COLUMNS = [
+    "country", "geo_country", "geo_region", "genre", "platform",
+    "currency_code", "category", "source_system", "source_table", "processing_status",
+]
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+WRITE_OPTIONS: dict = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": DICTIONARY_COLUMNS,
+    "data_page_size": 1 << 20,
+    "write_batch_size": 65536,
+}
+
+
+def sort_frame(df: "pd.DataFrame", sort_by: Optional[List[str]]) -> "pd.DataFrame":
+    """Ordenar por las columnas más filtradas para que las estadísticas min/max
+    de cada row group permitan saltar grupos al leer."""
+    keys = [c for c in (sort_by or []) if c in df.columns]
+    if not keys:
+        return df
+    try:
+        return df.sort_values(keys, kind="stable", na_position="last", ignore_index=True)
+    except TypeError:  # columnas con tipos mezclados: se escribe sin ordenar
+        return df
+
+
+def _narrow_id_series(col: "pd.Series") -> "pd.Series | None":
+    # Con nulos (Int64/UInt64 nullable, o float64 por NaN) se usa el `Int32`
+    # nullable: `astype("int32")` falla con NA
+    is_int = pd.api.types.is_integer_dtype(col)
+    if not (is_int or pd.api.types.is_float_dtype(col)):
+        return None
+    values = col.dropna()
+    if values.empty or not (_INT32_MIN <= values.min() and values.max() <= _INT32_MAX):
+        return None
+    if not is_int and not (values == values.round()).all():
+        return None
+    return col.astype("Int32" if col.hasnans or not is_int else "int32")
+
+
+def downcast_frame(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Reducir columnas ID a int32 cuando el rango lo permite y codificar como
+    `category` las dimensiones de baja cardinalidad."""
+    for c in df.columns:
+        if c == "id" or c.endswith("_id"):
+            narrowed = _narrow_id_series(df[c])
+            if narrowed is not None:
+                df[c] = narrowed
+        elif c in DICTIONARY_COLUMNS and (df[c].dtype == object or pd.api.types.is_string_dtype(df[c].dtype)):
+            df[c] = df[c].astype("category")
+    return df
 
-def write_rows(path: Path, rows: Sequence[Mapping[str, Any]]):
-    if not rows or pd is None:
+
+def rows_to_table(rows: Sequence[Mapping[str, Any]]) -> "pa.Table":
+    """Tabla Arrow con la unión de las claves de todas las filas (como `pd.DataFrame`),
+    no solo las de la primera como `Table.from_pylist`"""
+    first = rows[0].keys()
+    if all(r.keys() == first for r in rows):
+        return pa.Table.from_pylist(list(rows))
+    names = dict.fromkeys(k for r in rows for k in r)
+    return pa.Table.from_pydict({k: [r.get(k) for r in rows] for k in names})
+
+
+def write_rows(path: Path, rows: Sequence[Mapping[str, Any]], sort_by: Optional[List[str]] = None):
+    if not rows:
+        return
+    if pq is not None:
+        # Directo a Arrow: sin DataFrame intermedio
+        write_table(path, rows_to_table(rows), sort_by)
+        return
+    if pd is None:
         return
     path.parent.mkdir(parents=True, exist_ok=True)
-    df = pd.DataFrame(rows)
-    df.to_parquet(path, index=False)
+    downcast_frame(sort_frame(pd.DataFrame(rows), sort_by)).to_parquet(path, index=False)
+
+def downcast_table(table: "pa.Table", narrow_ids: bool = True) -> "pa.Table":
+    """Equivalente de `downcast_frame` para una `pyarrow.Table`.
+
+    Con `narrow_ids=False` solo se codifican con diccionario las dimensiones: los
+    IDs conservan su ancho (lo necesario cuando faltan filas por ver).
+    """
+    import pyarrow.compute as pc
+    for i, name in enumerate(table.column_names):
+        col = table.column(i)
+        if name == "id" or name.endswith("_id"):
+            if not narrow_ids:
+                continue
+            if pa.types.is_integer(col.type) and len(col) and col.null_count < len(col):
+                bounds = pc.min_max(col)
+                if _INT32_MIN <= bounds["min"].as_py() and bounds["max"].as_py() <= _INT32_MAX:
+                    table = table.set_column(i, name, col.cast(pa.int32()))
+        elif name in DICTIONARY_COLUMNS and (pa.types.is_string(col.type) or pa.types.is_large_string(col.type)):
+            table = table.set_column(i, name, pc.dictionary_encode(col))
+    return table
+
+
+def sort_table(table: "pa.Table", sort_by: Optional[List[str]]) -> "pa.Table":
+    """`sort_frame` para una `pyarrow.Table`"""
+    keys = [c for c in (sort_by or []) if c in table.column_names]
+    if not keys:
+        return table
+    try:
+        return table.sort_by([(k, "ascending") for k in keys])
+    except (pa.ArrowNotImplementedError, pa.ArrowTypeError):  # tipos no ordenables: se escribe sin ordenar
+        return table
+
+
+def write_table(path: Path, table: "pa.Table", sort_by: Optional[List[str]] = None):
+    """Escribir una `pyarrow.Table` ordenada y reducida con las opciones comunes"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(downcast_table(sort_table(table, sort_by)), path, row_group_size=ROW_GROUP_SIZE, **WRITE_OPTIONS)
+
+
+def write_columns(path: Path, columns: Mapping[str, Sequence[Any]], sort_by: Optional[List[str]] = None):
+    """Escribir un bloque columnar (`{columna: arreglo}`) sin construir filas ni DataFrame"""
+    if not columns or pa is None or pq is None:
+        return
+    write_table(path, pa.Table.from_pydict(dict(columns)), sort_by)
+
+
+def stream_schema(schema: "pa.Schema") -> "pa.Schema":
+    """Esquema para escribir por lotes: las columnas nulas en el primer lote pasan a
+    string para que los lotes siguientes con valores puedan ajustarse a él"""
+    return pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in schema])
+
+
+class ParquetWriterSession:
+    """Escritura en streaming de un único Parquet, lote a lote.
+
+    Los lotes se acumulan hasta `ROW_GROUP_SIZE` filas y cada row group se ordena
+    por `sort_by` antes de escribirse, igual que `write_table`. El esquema (o el
+    indicado) se fija con el primer row group: si el archivo cabe en uno solo se
+    aplica `downcast_table` completo; si no, los IDs conservan su ancho porque un
+    lote posterior podría salirse de int32.
+
+        with ParquetWriterSession(path, sort_by=["customer_id"]) as session:
+            for df in chunks:
+                session.append_batch(pa.Table.from_pandas(df, preserve_index=False))
+    """
+
+    def __init__(self, path: Path, schema: "pa.Schema | None" = None, sort_by: Optional[List[str]] = None):
+        if pa is None or pq is None:
+            raise ImportError("pyarrow es necesario para ParquetWriterSession")
+        self.path = Path(path)
+        self.schema = schema
+        self.sort_by = sort_by
+        self.rows_written = 0
+        self._writer = None
+        self._pending: List["pa.Table"] = []
+        self._pending_rows = 0
+
+    def __enter__(self) -> "ParquetWriterSession":
+        return self
+
+    def append_batch(self, batch: "pa.RecordBatch | pa.Table | Mapping[str, Sequence[Any]]"):
+        if isinstance(batch, Mapping):
+            batch = pa.Table.from_pydict(dict(batch), schema=self.schema)
+        elif isinstance(batch, pa.RecordBatch):
+            batch = pa.Table.from_batches([batch])
+        if not batch.num_rows:
+            return
+        if self.schema is not None:
+            # Con el esquema ya fijado todos los lotes pendientes comparten tipos
+            batch = batch.cast(self.schema)
+        self._pending.append(batch)
+        self._pending_rows += batch.num_rows
+        while self._pending_rows >= ROW_GROUP_SIZE:
+            self._flush(final=False)
+
+    def _flush(self, final: bool):
+        table = pa.concat_tables(self._pending, promote_options="default")
+        if final:
+            group, self._pending, self._pending_rows = table, [], 0
+        else:
+            group = table.slice(0, ROW_GROUP_SIZE)
+            rest = table.slice(ROW_GROUP_SIZE)
+            self._pending, self._pending_rows = ([rest] if rest.num_rows else []), rest.num_rows
+        group = sort_table(group, self.sort_by)
+        if self._writer is None:
+            if self.schema is None:
+                # `final` en el primer vaciado: el archivo completo está en este grupo
+                self.schema = stream_schema(downcast_table(group, narrow_ids=final).schema)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, self.schema, **WRITE_OPTIONS)
+            self._pending = [t.cast(self.schema) for t in self._pending]
+        self._writer.write_table(group.cast(self.schema), row_group_size=ROW_GROUP_SIZE)
+        self.rows_written += group.num_rows
+
+    def close(self):
+        try:
+            if self._pending:
+                self._flush(final=True)
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def __exit__(self, *exc) -> None:
+        self.close()